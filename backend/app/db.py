@@ -1,5 +1,7 @@
 from sqlmodel import SQLModel, create_engine, Session
-from typing import Generator
+from sqlalchemy import event
+from contextlib import contextmanager
+from typing import Generator, Iterator, List
 import os
 from dotenv import load_dotenv
 
@@ -69,4 +71,27 @@ def get_engine():
 def get_session() -> Generator[Session, None, None]:
     """Dependency to get database session"""
     with Session(engine) as session:
-        yield session
\ No newline at end of file
+        yield session
+
+
+@contextmanager
+def count_queries(bind=None) -> Iterator[List[str]]:
+    """Record every SQL statement executed on the engine inside the block.
+
+    Used to guard against N+1 regressions, e.g.:
+
+        with count_queries() as queries:
+            client.get("/jobs?limit=100")
+        assert len(queries) <= 3
+    """
+    target = bind or engine
+    queries: List[str] = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(target, "before_cursor_execute", _before_cursor_execute)
@@ -1,7 +1,9 @@
 from fastapi import FastAPI, WebSocket, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from sqlalchemy.orm.exc import StaleDataError
 from contextlib import asynccontextmanager
+import asyncio
 
 from app.db import create_db_and_tables
 from app.routers import (
@@ -18,8 +20,11 @@ from app.routers import (
     employer,
     posts,
     profile,
+    notifications,
+    saved_searches,
 )
 from app.ws import websocket_endpoint
+from app.services.application_versions import conflict_detail
 
 # Translation service는 선택적으로 import
 try:
@@ -41,7 +46,7 @@ async def lifespan(app: FastAPI):
     # Ensure DB schema columns are present according to models (non-destructive)
     try:
         # import here to avoid circular import at module load time
-        from scripts.ensure_schema import ensure_columns as ensure_cols
+        from scripts.ensure_schema import ensure_columns as ensure_cols, ensure_indexes
         from app.db import get_engine
 
         engine = get_engine()
@@ -49,14 +54,121 @@ async def lifespan(app: FastAPI):
         if errors:
             # Log but continue; global exception handler will surface errors for requests
             print("Schema ensure reported errors:", errors)
+        created_indexes, index_errors = ensure_indexes(engine)
+        if index_errors:
+            print("Index ensure reported errors:", index_errors)
     except Exception as exc:
         print("Failed to run schema ensure on startup:", exc)
 
+    # Full-text search index (SQLite FTS5 / MySQL FULLTEXT)
+    try:
+        from app.services.job_search import ensure_search_index
+        from app.db import get_engine
+
+        ensure_search_index(get_engine())
+    except Exception as exc:
+        print("Failed to prepare job search index:", exc)
+
+    # 공고 목록 카드 프로젝션 (카드가 없는 기존 공고 채우기)
+    try:
+        from app.services.job_cards import ensure_job_cards
+        from app.db import get_engine
+
+        ensure_job_cards(get_engine())
+    except Exception as exc:
+        print("Failed to prepare job cards:", exc)
+
+    # 지원서 version 컬럼 (낙관적 동시성 제어 - 비어 있는 기존 지원서를 1로)
+    try:
+        from app.services.application_versions import ensure_application_versions
+        from app.db import get_engine
+
+        ensure_application_versions(get_engine())
+    except Exception as exc:
+        print("Failed to prepare application versions:", exc)
+
+    # 공고 소유 고용주 컬럼 (owner_user_id가 비어 있는 기존 공고/보관 공고 채우기)
+    try:
+        from app.services.job_owners import ensure_job_owners
+        from app.db import get_engine
+
+        ensure_job_owners(get_engine())
+    except Exception as exc:
+        print("Failed to prepare job owners:", exc)
+
+    # 공고별 지원자 수/상태별 지원자 수 (owner_user_id를 채운 뒤, 매장/고용주 카운터도 함께 계산)
+    try:
+        from app.services.application_counters import ensure_application_counts
+        from app.db import get_engine
+
+        ensure_application_counts(get_engine())
+    except Exception as exc:
+        print("Failed to prepare application counters:", exc)
+
+    # 매장/고용주별 상태별 지원자 수 (owner_user_id를 채운 뒤)
+    try:
+        from app.services.application_counters import ensure_status_rollups
+        from app.db import get_engine
+
+        ensure_status_rollups(get_engine())
+    except Exception as exc:
+        print("Failed to prepare application status rollups:", exc)
+
+    # 지원 자격 필터 컬럼 (visa_mask/lang_level이 비어 있는 기존 공고 채우기)
+    try:
+        from app.services.job_eligibility import ensure_job_eligibility
+        from app.db import get_engine
+
+        ensure_job_eligibility(get_engine())
+    except Exception as exc:
+        print("Failed to prepare job eligibility columns:", exc)
+
+    # 시급 환산 급여 컬럼 (hourly_wage가 비어 있는 기존 공고 채우기)
+    try:
+        from app.services.job_wages import ensure_hourly_wages
+        from app.db import get_engine
+
+        ensure_hourly_wages(get_engine())
+    except Exception as exc:
+        print("Failed to prepare job hourly wages:", exc)
+
+    # 인기 점수 컬럼 (trend_score가 비어 있는 기존 공고는 지원 이력으로 채움)
+    try:
+        from app.services.job_trends import ensure_trend_scores
+        from app.db import get_engine
+
+        ensure_trend_scores(get_engine())
+    except Exception as exc:
+        print("Failed to prepare job trend scores:", exc)
+
     if TRANSLATION_AVAILABLE:
         initialize_translation_service()
+
+    # 공고 조회수 버퍼 주기적 flush
+    from app.db import get_engine
+    from app.services.view_counter import run_periodic_flush, view_counter
+
+    view_flush_task = asyncio.create_task(run_periodic_flush(get_engine()))
+
+    # 마감일이 지난 공고 주기적 마감
+    from app.services.job_deadlines import run_deadline_scheduler
+
+    deadline_task = asyncio.create_task(run_deadline_scheduler(get_engine()))
+
+    # 보관 기간이 지난 삭제 공고/지원서 정리
+    from app.services.job_archive import run_archive_purge
+
+    archive_purge_task = asyncio.create_task(run_archive_purge(get_engine()))
     yield
     # Shutdown
-    pass
+    archive_purge_task.cancel()
+    deadline_task.cancel()
+    view_flush_task.cancel()
+    try:
+        await view_flush_task
+    except asyncio.CancelledError:
+        pass
+    view_counter.flush(get_engine())
 
 
 app = FastAPI(
@@ -83,7 +195,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "HEAD"],
     allow_headers=["*"],
-    expose_headers=["*"],
+    expose_headers=["*", "X-Next-Cursor"],
     max_age=3600,
 )
 
@@ -117,6 +229,13 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         }
     )
 
+@app.exception_handler(StaleDataError)
+async def stale_data_exception_handler(request: Request, exc: StaleDataError):
+    """버전 조건 UPDATE가 0행 (다른 요청이 먼저 변경) -> 409 (app/services/application_versions.py)"""
+    print(f"[WARNING] 동시 수정 충돌: {request.method} {request.url.path}")
+    return await http_exception_handler(request, HTTPException(status_code=409, detail=conflict_detail()))
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """모든 예외 처리 시 CORS 헤더 추가"""
@@ -165,6 +284,8 @@ app.include_router(translate.router)
 app.include_router(learning.router)
 app.include_router(posts.router)
 app.include_router(profile.router)
+app.include_router(notifications.router)
+app.include_router(saved_searches.router)
 
 
 # WebSocket endpoint
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Column, DateTime, Double, Index, Integer, Table, Text
 from typing import Optional, List
 from datetime import datetime, date
 import json
@@ -43,7 +44,7 @@ class Employer(SQLModel, table=True):
     __tablename__ = "employers"
     
     id: str = Field(primary_key=True)
-    businessNo: str
+    businessNo: str = Field(index=True)
     shopName: str
     industry: str
     address: str
@@ -60,40 +61,75 @@ class Employer(SQLModel, table=True):
 
 class Job(SQLModel, table=True):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # list_jobs 정렬 + LIMIT용 복합 인덱스
+        Index("ix_jobs_postedAt_id", "postedAt", "id"),
+        Index("ix_jobs_wage_id", "wage", "id"),
+        Index("ix_jobs_hourly_wage_id", "hourly_wage", "id"),
+        Index("ix_jobs_applications_id", "applications", "id"),
+        Index("ix_jobs_trend_score_id", "trend_score", "id"),
+        # 마감 스케줄러 (status='active' AND deadline < 오늘)
+        Index("ix_jobs_status_deadline", "status", "deadline"),
+        # 지원 자격 필터 (lang_level <= :mine AND visa_mask & :mine)
+        Index("ix_jobs_lang_level_visa_mask", "lang_level", "visa_mask"),
+        # 고용주 범위 조회 (공고 관리/지원자 목록) - owner_user_id = :user_id
+        Index("ix_jobs_owner_user_id_postedAt", "owner_user_id", "postedAt"),
+    )
     
     id: str = Field(primary_key=True)
-    employerId: str = Field(foreign_key="employers.id")
+    employerId: str = Field(foreign_key="employers.id", index=True)
+    owner_user_id: Optional[str] = None  # 공고를 소유한 고용주 signup_users.id (app/services/job_owners.py)
     title: str
     description: str
-    category: str
+    category: str = Field(index=True)
     wage: int
     wage_type: str = Field(default="hourly")  # 'hourly', 'weekly', 'monthly'
+    hourly_wage: Optional[int] = None  # 시급 환산 급여 (원, app/services/job_wages.py) - high-wage 필터/정렬
     workDays: str
     workHours: str
     deadline: str  # ISO8601
     positions: int
     requiredLanguage: str
     requiredVisa: str = Field(default="[]")  # JSON string
+    visa_mask: Optional[int] = Field(default=0)  # requiredVisa 비트마스크 (matching.VISA_BITS, 0 = 제한 없음)
+    lang_level: Optional[int] = Field(default=0)  # requiredLanguage 서수 (0 = 무관, 1~4)
     benefits: Optional[str] = None
     createdAt: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
-    status: str = Field(default="active")  # active, paused, closed
+    status: str = Field(default="active", index=True)  # active, paused, closed
     views: int = Field(default=0)
-    applications: int = Field(default=0)
+    applications: int = Field(default=0)  # 지원자 수 (application_counters에서 증감)
+    # 시간 감쇠 인기 점수 (app/services/job_trends.py) - 값 범위가 커서 배정밀도(DOUBLE)
+    trend_score: Optional[float] = Field(default=0.0, sa_column=Column(Double, default=0.0))
     postedAt: Optional[str] = Field(default_factory=lambda: datetime.utcnow().isoformat())
     location: Optional[str] = None
     shop_name: Optional[str] = None
     shop_address: Optional[str] = None
     shop_address_detail: Optional[str] = None
     shop_phone: Optional[str] = None
-    store_id: Optional[str] = None  # 매장 ID (stores.id 참조)
+    store_id: Optional[str] = Field(default=None, index=True)  # 매장 ID (stores.id 참조)
+    latitude: Optional[float] = None  # 오프라인 지오코딩 좌표 (app/services/geo.py)
+    longitude: Optional[float] = None
+    geo_cell: Optional[str] = Field(default=None, index=True)  # 반경 검색용 격자 셀 키
+
+
+# 낙관적 동시성 제어 - ORM UPDATE는 WHERE version = :읽은 값 조건으로 실행되고 1씩 증가
+# (0행이면 StaleDataError -> 409, app/services/application_versions.py)
+_application_version = Column("version", Integer, nullable=False, default=1)
 
 
 class Application(SQLModel, table=True):
     __tablename__ = "applications"
+    __mapper_args__ = {"version_id_col": _application_version}
+    __table_args__ = (
+        # 목록 keyset 페이지네이션 (appliedAt DESC, applicationId DESC)
+        Index("ix_applications_appliedAt_applicationId", "appliedAt", "applicationId"),
+        # sort=updated (최근 변경순)
+        Index("ix_applications_updatedAt_applicationId", "updatedAt", "applicationId"),
+    )
     
     applicationId: str = Field(primary_key=True)
-    seekerId: str  # User ID (signup_user_id)
-    jobId: str  # Job ID
+    seekerId: str = Field(index=True)  # User ID (signup_user_id)
+    jobId: str = Field(index=True)  # Job ID
     status: str = Field(default="applied")  # applied, reviewed, accepted, rejected, hold, hired
     appliedAt: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
     updatedAt: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
@@ -103,9 +139,145 @@ class Application(SQLModel, table=True):
     # 합격 관련 정보
     acceptanceData: Optional[str] = None  # JSON string: {documents: [], workAttire: [], workNotes: [], firstWorkDate: "", firstWorkTime: "", coordinationMessage: ""}
     # 조율 메시지
-    coordinationMessages: Optional[str] = None  # JSON string: [{message: "", sentAt: "", from: "employer"|"jobseeker", type: ""}]
+    # (레거시) JSON string: [{message: "", sentAt: "", from: "employer"|"jobseeker", type: ""}]
+    # 새 메시지는 coordination_messages 테이블에 저장하고, 남아 있는 배열은 지연 이전 후 NULL
+    coordinationMessages: Optional[str] = None
     # 채용 확정 정보
     firstWorkDateConfirmed: Optional[str] = None  # YYYY-MM-DD, 채용 확정된 첫 출근 날짜
+    version: Optional[int] = Field(default=1, sa_column=_application_version)
+
+
+class CoordinationMessage(SQLModel, table=True):
+    """지원서 조율 메시지 (append-only, app/services/coordination_messages.py)
+
+    applications.coordinationMessages JSON 배열을 대체합니다. 기존 배열은 해당 지원서에
+    처음 쓰기/조회가 일어날 때 행으로 옮겨집니다.
+    """
+    __tablename__ = "coordination_messages"
+    __table_args__ = (
+        Index("ix_coordination_messages_applicationId_sentAt", "applicationId", "sentAt", "id"),
+    )
+    
+    id: str = Field(primary_key=True)
+    applicationId: str  # references applications.applicationId
+    message: str = Field(sa_column=Column(Text, nullable=False))
+    sender: str  # employer | jobseeker (응답의 'from')
+    type: Optional[str] = None  # interview_coordination, work_date_coordination, ...
+    sentAt: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+
+
+def _archive_table(source: Table, name: str, *indexed: str) -> Table:
+    """source와 같은 컬럼 + archived_at을 가진 보관 테이블 (FK 없음, app/services/job_archive.py)
+
+    컬럼을 모델에서 복사하므로 jobs/applications에 컬럼이 추가되면 보관 테이블도
+    ensure_columns로 함께 추가됩니다.
+    """
+    return Table(
+        name,
+        SQLModel.metadata,
+        *[
+            Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable)
+            for column in source.columns
+        ],
+        Column("archived_at", DateTime, nullable=False),
+        Index(f"ix_{name}_archived_at", "archived_at"),
+        *[Index(f"ix_{name}_{column}", column) for column in indexed],
+    )
+
+
+# 삭제된 공고/지원서 보관 (복원/보존 기간 후 purge)
+jobs_archive = _archive_table(Job.__table__, "jobs_archive", "owner_user_id", "employerId")
+applications_archive = _archive_table(Application.__table__, "applications_archive", "jobId")
+
+
+class JobCard(SQLModel, table=True):
+    """공고 목록 카드 프로젝션 (job_to_dict 결과를 미리 직렬화해 저장, app/services/job_cards.py)"""
+    __tablename__ = "job_cards"
+    
+    job_id: str = Field(primary_key=True)  # references jobs.id
+    is_trusted: bool = Field(default=False, index=True)
+    payload: str = Field(sa_column=Column(Text, nullable=False))  # JSON object string
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class JobApplicationStat(SQLModel, table=True):
+    """공고별/상태별 지원자 수 (비정규화 카운터)"""
+    __tablename__ = "job_application_stats"
+    
+    jobId: str = Field(primary_key=True)
+    status: str = Field(primary_key=True)
+    count: int = Field(default=0)
+
+
+class ApplicationStatusRollup(SQLModel, table=True):
+    """매장/고용주별 상태별 지원자 수 (job_application_stats와 같은 트랜잭션에서 증감)
+
+    scope: 'store' (scope_id = stores.id) | 'employer' (scope_id = jobs.owner_user_id)
+    """
+    __tablename__ = "application_status_rollups"
+    
+    scope: str = Field(primary_key=True)
+    scope_id: str = Field(primary_key=True)
+    status: str = Field(primary_key=True)
+    count: int = Field(default=0)
+
+
+class ApplicationStatusEvent(SQLModel, table=True):
+    """지원서 상태 전환 이력 (append-only, 생성 시 from_status는 NULL)"""
+    __tablename__ = "application_status_events"
+    __table_args__ = (
+        Index("ix_application_status_events_applicationId_created_at", "applicationId", "created_at"),
+        Index("ix_application_status_events_jobId_created_at", "jobId", "created_at"),
+    )
+    
+    id: str = Field(primary_key=True)
+    applicationId: str  # references applications.applicationId
+    jobId: str  # references jobs.id
+    from_status: Optional[str] = None
+    to_status: str
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class Notification(SQLModel, table=True):
+    """사용자 알림 이벤트 (공고 마감 등, app/services/notifications.py)"""
+    __tablename__ = "notifications"
+    __table_args__ = (
+        # 사용자별 최신순 조회
+        Index("ix_notifications_user_id_created_at", "user_id", "created_at"),
+    )
+    
+    id: str = Field(primary_key=True)
+    user_id: str  # references signup_users.id
+    type: str  # job_closed, ...
+    job_id: Optional[str] = None
+    application_id: Optional[str] = None
+    message: str
+    payload: Optional[str] = None  # JSON string (이벤트별 추가 정보)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    read_at: Optional[datetime] = None
+
+
+class SavedSearch(SQLModel, table=True):
+    """구직자 저장 검색 - 조건에 맞는 새 공고가 등록되면 알림 (app/services/saved_searches.py)"""
+    __tablename__ = "saved_searches"
+    
+    id: str = Field(primary_key=True)
+    user_id: str = Field(index=True)  # references signup_users.id
+    name: str
+    query: Optional[str] = None  # 검색어 (제목/설명/업종/가게명)
+    location: Optional[str] = None
+    industry: Optional[str] = None
+    visa_type: Optional[str] = None
+    min_hourly_wage: Optional[int] = None  # 시급 환산 최저 급여 (jobs.hourly_wage와 비교)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class SavedSearchKey(SQLModel, table=True):
+    """저장 검색 역색인 (조건 토큰 -> 저장 검색). 저장 검색마다 대표 조건 토큰 1개"""
+    __tablename__ = "saved_search_keys"
+    
+    key: str = Field(primary_key=True)  # 'q:바리' / 'loc:남구' / 'cat:카페' / '*'
+    search_id: str = Field(primary_key=True, index=True)
 
 
 class Conversation(SQLModel, table=True):
@@ -178,6 +350,10 @@ class SignupUser(SQLModel, table=True):
 
 class JobSeekerProfile(SQLModel, table=True):
     __tablename__ = "job_seeker_profiles"
+    __table_args__ = (
+        # 목록 keyset 페이지네이션 (created_at DESC, id DESC)
+        Index("ix_job_seeker_profiles_created_at_id", "created_at", "id"),
+    )
     
     id: str = Field(primary_key=True)
     user_id: str  # references signup_users.id
@@ -196,14 +372,14 @@ class JobSeekerProfile(SQLModel, table=True):
     experience_introduction: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
-    visa_type: Optional[str] = None
+    visa_type: Optional[str] = Field(default=None, index=True)
 
 
 class EmployerProfile(SQLModel, table=True):
     __tablename__ = "employer_profiles"
     
     id: str = Field(primary_key=True)
-    user_id: str  # references signup_users.id
+    user_id: str = Field(index=True)  # references signup_users.id
     business_type: str  # 'business' or 'individual'
     company_name: str
     address: str
@@ -218,7 +394,7 @@ class Store(SQLModel, table=True):
     __tablename__ = "stores"
     
     id: str = Field(primary_key=True)
-    user_id: str  # references signup_users.id
+    user_id: str = Field(index=True)  # references signup_users.id
     is_main: bool = Field(default=False)  # 대표가게 여부
     store_name: str
     address: str
@@ -228,6 +404,8 @@ class Store(SQLModel, table=True):
     business_license: Optional[str] = None  # 사업자등록증 파일명 또는 URL
     management_role: str  # '본사 관리자' | '지점 관리자'
     store_type: str  # '직영점' | '가맹점' | '개인·독립 매장'
+    latitude: Optional[float] = None  # 오프라인 지오코딩 좌표
+    longitude: Optional[float] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
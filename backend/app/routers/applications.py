@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import update
 from sqlmodel import Session, select
-from sqlalchemy import or_
 from typing import Optional, List
 import uuid
 from datetime import datetime
@@ -9,17 +9,18 @@ import json
 from app.db import get_session
 from app.models import (
     Application,
+    ApplicationStatusEvent,
+    CoordinationMessage,
     Job,
     JobSeeker,
     Employer,
     SignupUser,
     JobSeekerProfile,
-    EmployerProfile,
-    Store,  # 매장 정보로 공고 소유주 조회
 )
 from app.schemas import (
     ApplicationCreate, 
     ApplicationUpdate,
+    ApplicationBulkStatusUpdate,
     InterviewProposalUpdate,
     AcceptanceGuideUpdate,
     FirstWorkDateUpdate,
@@ -27,6 +28,19 @@ from app.schemas import (
     WorkDateConfirmation,
 )
 
+from app.services.application_bulk_status import APPLICATION_STATUSES, MAX_BULK_APPLICATIONS, bulk_set_status
+from app.services.application_counters import record_application_created, set_application_status
+from app.services.application_versions import check_application_version
+from app.services.coordination_messages import (
+    append_coordination_message,
+    coordination_messages_by_application,
+    list_coordination_messages,
+    message_to_dict,
+    migrate_coordination_blob,
+)
+from app.services.employer_dashboard import invalidate_dashboards_for_jobs
+from app.services.pagination import NEXT_CURSOR_HEADER, next_cursor, paginate_desc
+
 router = APIRouter(prefix="/applications", tags=["applications"])
 @router.post("/invite", response_model=dict, status_code=201)
 async def invite_application(
@@ -68,8 +82,10 @@ async def invite_application(
             })
         )
         session.add(application)
+        record_application_created(session, application)
         session.commit()
         session.refresh(application)
+        invalidate_dashboards_for_jobs(session, [application.jobId])
 
         return {
             "applicationId": application.applicationId,
@@ -195,13 +211,12 @@ async def create_application(
         
         session.add(application)
         
-        # 공고의 지원자 수 증가
-        if job:
-            job.applications = (job.applications or 0) + 1
-            session.add(job)
+        # 공고의 지원자 수/상태별 카운터 증가 (같은 트랜잭션)
+        record_application_created(session, application)
         
         session.commit()
         session.refresh(application)
+        invalidate_dashboards_for_jobs(session, [application.jobId])
         
         print(f"[DEBUG] create_application - 지원서 생성 완료:")
         print(f"  applicationId: {application.applicationId}")
@@ -236,273 +251,200 @@ async def create_application(
         raise HTTPException(status_code=500, detail=f"지원서 생성 중 오류 발생: {str(e)}")
 
 
+APPLICATION_SORTS = {
+    # sort 값 -> keyset 정렬 컬럼 (모두 DESC, applicationId로 동점 정리)
+    "latest": Application.appliedAt,
+    "updated": Application.updatedAt,
+}
+
+
+def _parse_json_field(value: Optional[str], default):
+    if not value:
+        return default
+    if not isinstance(value, str):
+        return value
+    try:
+        return json.loads(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _seeker_job_dict(job: Job, employer: Optional[Employer]) -> dict:
+    return {
+        'id': job.id,
+        'title': job.title,
+        'shopName': job.shop_name or (employer.shopName if employer else ''),
+        'wage': job.wage,
+        'location': job.location or job.shop_address or '',
+        'category': job.category,
+        'workDays': job.workDays,
+        'workHours': job.workHours,
+        'employerId': job.employerId,
+        'store_id': job.store_id,
+    }
+
+
+def _jobseeker_dict(seeker_id: str, seeker: Optional[JobSeeker]) -> dict:
+    if not seeker:
+        # JobSeeker가 없어도 지원 내역은 반환 (기본 정보만)
+        print(f"[WARNING] JobSeeker not found for seekerId: {seeker_id}")
+        return {
+            'id': seeker_id,
+            'name': '알 수 없음',
+            'nationality': '알 수 없음',
+            'phone': '',
+            'languageLevel': '알 수 없음',
+            'visaType': '알 수 없음',
+            'experience': [],
+            'preferences': {},
+        }
+    return {
+        'id': seeker.id,
+        'name': seeker.name,
+        'nationality': seeker.nationality,
+        'phone': seeker.phone,
+        'languageLevel': seeker.languageLevel,
+        'visaType': seeker.visaType,
+        'experience': _parse_json_field(seeker.experience, []),
+        'preferences': _parse_json_field(seeker.preferences, {}),
+    }
+
+
 @router.get("", response_model=List[dict])
 async def list_applications(
+    response: Response,
     seekerId: Optional[str] = None,
     jobId: Optional[str] = None,
     employerId: Optional[str] = None,
     userId: Optional[str] = None,  # For employer: signup_user_id
+    status: Optional[str] = Query(default=None, description="지원 상태 필터 (쉼표로 여러 개: applied,reviewed)"),
+    sort: str = Query(default="latest", description="정렬: latest(지원일), updated(최근 변경)"),
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 X-Next-Cursor 헤더 값"),
     session: Session = Depends(get_session),
 ):
-    """List applications with filters and JOINed data"""
-    print(f"[DEBUG] list_applications - 요청 파라미터:")
-    print(f"  userId: {userId}")
-    print(f"  employerId: {employerId}")
-    print(f"  seekerId: {seekerId}")
-    print(f"  jobId: {jobId}")
-    print(f"[DEBUG] list_applications - userId 타입: {type(userId)}, 값: '{userId}'")
-    
-    # If userId(가입 고용주 ID)로 조회하면 소유 공고(매장/사업자/직접 employerId 모두) 기준으로 필터링
-    owned_job_ids: list[str] = []
-    if userId and not seekerId:
-        try:
-            # 1) 매장 기반: user_id가 소유한 store 목록 → 해당 store_id의 공고
-            store_ids = [s.id for s in session.exec(select(Store).where(Store.user_id == userId)).all()]
-            if store_ids:
-                job_ids_by_store = [j.id for j in session.exec(select(Job).where(Job.store_id.in_(store_ids))).all()]
-                owned_job_ids.extend(job_ids_by_store)
-                print(f"[DEBUG] list_applications - store 기반 공고 수: {len(job_ids_by_store)}")
-            
-            # 2) 사업자 기반: employer_profiles.user_id == userId → employer.businessNo == profile.id → 그 employerId의 공고
-            profile = session.exec(select(EmployerProfile).where(EmployerProfile.user_id == userId)).first()
-            print(f"[DEBUG] list_applications - employer profile 조회 결과: {profile.id if profile else 'NOT FOUND'}")
-            print(f"[DEBUG] list_applications - 조회한 userId: '{userId}'")
-            
-            if profile:
-                employer = session.exec(select(Employer).where(Employer.businessNo == profile.id)).first()
-                if employer:
-                    job_ids_by_employer = [j.id for j in session.exec(select(Job).where(Job.employerId == employer.id)).all()]
-                    owned_job_ids.extend(job_ids_by_employer)
-                    print(f"[DEBUG] list_applications - employer 기반 공고 수: {len(job_ids_by_employer)}")
-            
-            # 3) 레거시: job.employerId가 userId와 동일한 경우
-            direct_job_ids = [j.id for j in session.exec(select(Job).where(Job.employerId == userId)).all()]
-            if direct_job_ids:
-                owned_job_ids.extend(direct_job_ids)
-                print(f"[DEBUG] list_applications - employerId==userId 직접 매핑 공고 수: {len(direct_job_ids)}")
-            
-            # 중복 제거
-            owned_job_ids = list(dict.fromkeys(owned_job_ids))
-            print(f"[DEBUG] list_applications - 최종 owned_job_ids 수: {len(owned_job_ids)}")
-            
-            if not owned_job_ids:
-                print(f"[WARNING] list_applications - 이 고용주에게 공고가 없음: userId={userId}")
-                return []
-        except Exception as e:
-            print(f"[ERROR] list_applications - userId 기반 공고 조회 실패: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
-    
-    # Base query
-    statement = select(Application)
-    
+    """List applications with filters and JOINed data
+
+    정렬 키(sort) DESC 순으로 한 페이지(limit, 기본 50건)씩 반환하고, 다음 페이지가 있으면
+    cursor를 X-Next-Cursor 응답 헤더로 돌려줍니다.
+    userId와 seekerId를 함께 주면 그 고용주의 공고에 온 해당 구직자의 지원서만 반환합니다.
+    공고/고용주/구직자 정보는 지원 내역과 한 번의 JOIN 쿼리로 가져오므로
+    지원자 수와 관계없이 페이지당 쿼리 수가 일정합니다.
+    """
+    print(f"[DEBUG] list_applications - userId={userId}, employerId={employerId}, seekerId={seekerId}, "
+          f"jobId={jobId}, status={status}, sort={sort}, limit={limit}")
+    sort_column = APPLICATION_SORTS.get(sort)
+    if sort_column is None:
+        raise HTTPException(status_code=400, detail=f"sort는 {', '.join(APPLICATION_SORTS)} 중 하나여야 합니다.")
+
+    statement = (
+        select(Application, Job, Employer, JobSeeker)
+        .outerjoin(Job, Job.id == Application.jobId)
+        .outerjoin(Employer, Employer.id == Job.employerId)
+        .outerjoin(JobSeeker, JobSeeker.id == Application.seekerId)
+    )
     if seekerId:
         statement = statement.where(Application.seekerId == seekerId)
     if jobId:
         statement = statement.where(Application.jobId == jobId)
     if employerId:
-        # Filter by employer's jobs
-        try:
-            print(f"[DEBUG] list_applications - employerId로 공고 필터링 시작: {employerId}")
-            job_ids_stmt = select(Job.id).where(Job.employerId == employerId)
-            job_ids_result = session.exec(job_ids_stmt).all()
-            # select(Job.id)는 이미 id만 반환하므로, 결과는 문자열 리스트입니다
-            job_ids = [str(job_id) for job_id in job_ids_result] if job_ids_result else []
-            print(f"[DEBUG] list_applications - employerId {employerId}의 공고 개수: {len(job_ids)}")
-            print(f"[DEBUG] list_applications - 공고 IDs: {job_ids}")
-            
-            if not job_ids:
-                print(f"[WARNING] list_applications - 이 고용주에게 공고가 없음: employerId={employerId}")
-                print(f"[WARNING] list_applications - 공고를 먼저 등록해야 지원 내역을 볼 수 있음")
-                return []
-            
-            # Use or_ to create IN clause equivalent (more compatible with SQLModel)
-            if job_ids:
-                statement = statement.where(Application.jobId.in_(job_ids))
-            print(f"[DEBUG] list_applications - 공고 필터 적용 완료: {len(job_ids)}개 공고")
-        except Exception as e:
-            print(f"[ERROR] Failed to filter by employerId {employerId}: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
-    
-    # userId로 확보한 owned_job_ids가 있다면 필터 적용
-    if userId and owned_job_ids:
-        # Use or_ to create IN clause equivalent (more compatible with SQLModel)
-        conditions = [Application.jobId == job_id for job_id in owned_job_ids]
-        statement = statement.where(or_(*conditions))
-        print(f"[DEBUG] list_applications - owned_job_ids 필터 적용 완료: {len(owned_job_ids)}개 공고")
-    
+        # 고용주의 공고에 대한 지원만 (JOIN된 공고 기준)
+        statement = statement.where(Job.employerId == employerId)
+    if userId:
+        # userId(가입 고용주 ID)로 조회하면 소유 공고 기준으로 필터링 (jobs.owner_user_id, job_owners)
+        statement = statement.where(Job.owner_user_id == userId)
+    if status:
+        statuses = [value.strip() for value in status.split(",") if value.strip()]
+        if statuses:
+            statement = statement.where(Application.status.in_(statuses))
+
+    statement = paginate_desc(statement, sort_column, Application.applicationId, cursor).limit(limit)
+
     try:
-        applications = session.exec(statement).all()
+        rows = session.exec(statement).all()
     except Exception as e:
         print(f"[ERROR] Failed to execute applications query: {e}")
         import traceback
         traceback.print_exc()
-        return []
+        raise HTTPException(status_code=500, detail="지원 내역을 조회하는 중 오류가 발생했습니다.")
+
+    next_page = next_cursor(rows, limit, lambda row: (getattr(row[0], sort_column.key), row[0].applicationId))
+    if next_page:
+        response.headers[NEXT_CURSOR_HEADER] = next_page
+
+    # 조율 메시지는 페이지의 지원서 것만 한 번에 (coordination_messages)
+    messages_by_application = coordination_messages_by_application(session, [row[0] for row in rows])
     
     results = []
-    
-    for app in applications:
-        try:
-            app_dict = app.dict()  # This includes seekerId, jobId, status, etc.
-            
-            # Parse JSON fields if they exist
-            if app.interviewData:
-                try:
-                    app_dict['interviewData'] = json.loads(app.interviewData)
-                except:
-                    app_dict['interviewData'] = None
-            else:
-                app_dict['interviewData'] = None
-            
-            if app.acceptanceData:
-                try:
-                    app_dict['acceptanceData'] = json.loads(app.acceptanceData)
-                except:
-                    app_dict['acceptanceData'] = None
-            else:
-                app_dict['acceptanceData'] = None
-            
-            if app.coordinationMessages:
-                try:
-                    app_dict['coordinationMessages'] = json.loads(app.coordinationMessages)
-                except:
-                    app_dict['coordinationMessages'] = []
-            else:
-                app_dict['coordinationMessages'] = []
-            
-            app_dict['firstWorkDateConfirmed'] = app.firstWorkDateConfirmed
-            
-            # If filtering by seekerId, include Job information
-            if seekerId:
-                job = session.exec(select(Job).where(Job.id == app.jobId)).first()
-                if job:
-                    job_dict = job.dict()
-                    # Get employer info
-                    employer = session.exec(select(Employer).where(Employer.id == job.employerId)).first()
-                    employer_dict = employer.dict() if employer else {}
-                    
-                    app_dict['job'] = {
-                        'id': job_dict['id'],
-                        'title': job_dict['title'],
-                        'shopName': job_dict.get('shop_name') or employer_dict.get('shopName', ''),
-                        'wage': job_dict['wage'],
-                        'location': job_dict.get('location') or job_dict.get('shop_address', ''),
-                        'category': job_dict['category'],
-                        'workDays': job_dict['workDays'],
-                        'workHours': job_dict['workHours'],
-                        'employerId': job_dict['employerId'],
-                        'store_id': job_dict.get('store_id') or job_dict.get('storeId'),  # store_id 추가
-                    }
-            
-            # If filtering by jobId, employerId, or userId, include JobSeeker information
-            if jobId or employerId or userId:
-                seeker = session.exec(select(JobSeeker).where(JobSeeker.id == app.seekerId)).first()
-                if not seeker:
-                    print(f"[WARNING] JobSeeker not found for seekerId: {app.seekerId}")
-                    print(f"[WARNING] jobseekers 테이블에 구직자 정보가 없음 - ensure_jobseeker_exists가 실행되지 않았을 수 있음")
-                    # JobSeeker가 없어도 지원 내역은 반환 (기본 정보만)
-                    app_dict['jobseeker'] = {
-                        'id': app.seekerId,
-                        'name': '알 수 없음',
-                        'nationality': '알 수 없음',
-                        'phone': '',
-                        'languageLevel': '알 수 없음',
-                        'visaType': '알 수 없음',
-                        'experience': [],
-                        'preferences': {},
-                    }
-                elif seeker:
-                    seeker_dict = seeker.dict()
-                    # Parse JSON fields
-                    experience = []
-                    if seeker_dict.get('experience'):
-                        try:
-                            experience = json.loads(seeker_dict['experience']) if isinstance(seeker_dict['experience'], str) else seeker_dict['experience']
-                        except:
-                            experience = []
-                    
-                    preferences = {}
-                    if seeker_dict.get('preferences'):
-                        try:
-                            preferences = json.loads(seeker_dict['preferences']) if isinstance(seeker_dict['preferences'], str) else seeker_dict['preferences']
-                        except:
-                            preferences = {}
-                    
-                    app_dict['jobseeker'] = {
-                        'id': seeker_dict['id'],
-                        'name': seeker_dict['name'],
-                        'nationality': seeker_dict['nationality'],
-                        'phone': seeker_dict['phone'],
-                        'languageLevel': seeker_dict['languageLevel'],
-                        'visaType': seeker_dict['visaType'],
-                        'experience': experience,
-                        'preferences': preferences,
-                    }
-            
-            # If filtering by employerId or userId, include Job information
-            if employerId or userId:
-                job = session.exec(select(Job).where(Job.id == app.jobId)).first()
-                if employerId:
-                    # If employerId is set, verify job belongs to this employer
-                    if not job or job.employerId != employerId:
-                        continue  # Skip if job doesn't belong to this employer
-                if job and 'job' not in app_dict:  # Only add if not already added
-                    job_dict = job.dict()
-                    app_dict['job'] = {
-                        'id': job.id,
-                        'title': job.title,
-                        'category': job.category,
-                        'store_id': job_dict.get('store_id') or job_dict.get('storeId'),  # store_id 추가
-                    }
-            
-            results.append(app_dict)
-        except Exception as e:
-            print(f"[ERROR] Failed to process application {app.applicationId if hasattr(app, 'applicationId') else 'unknown'}: {e}")
-            import traceback
-            traceback.print_exc()
-            continue  # Skip this application and continue with others
-    
+    for app, job, employer, seeker in rows:
+        app_dict = app.dict()  # This includes seekerId, jobId, status, etc.
+        app_dict['interviewData'] = _parse_json_field(app.interviewData, None)
+        app_dict['acceptanceData'] = _parse_json_field(app.acceptanceData, None)
+        app_dict['coordinationMessages'] = messages_by_application[app.applicationId]
+
+        # If filtering by seekerId, include Job information
+        if seekerId and job:
+            app_dict['job'] = _seeker_job_dict(job, employer)
+
+        # If filtering by jobId, employerId, or userId, include JobSeeker information
+        if jobId or employerId or userId:
+            app_dict['jobseeker'] = _jobseeker_dict(app.seekerId, seeker)
+
+        # If filtering by employerId or userId, include Job information
+        if (employerId or userId) and job and 'job' not in app_dict:
+            app_dict['job'] = {
+                'id': job.id,
+                'title': job.title,
+                'category': job.category,
+                'store_id': job.store_id,
+            }
+
+        results.append(app_dict)
+
     print(f"[DEBUG] list_applications - 최종 반환할 결과 개수: {len(results)}")
-    
-    # 디버깅: 반환할 결과의 첫 번째 항목 로깅
-    if results:
-        print(f"[DEBUG] list_applications - 첫 번째 결과 샘플:")
-        first_result = results[0]
-        print(f"  applicationId: {first_result.get('applicationId', 'N/A')}")
-        print(f"  seekerId: {first_result.get('seekerId', 'N/A')}")
-        print(f"  jobId: {first_result.get('jobId', 'N/A')}")
-        print(f"  jobseeker 존재: {'jobseeker' in first_result}")
-        if 'jobseeker' in first_result:
-            jobseeker = first_result['jobseeker']
-            print(f"  jobseeker.name: {jobseeker.get('name', 'N/A')}")
-            print(f"  jobseeker.nationality: {jobseeker.get('nationality', 'N/A')}")
-    else:
-        print(f"[WARNING] list_applications - 반환할 결과가 없습니다!")
-        print(f"[WARNING] list_applications - 조회된 applications 개수: {len(applications)}")
-        if employerId:
-            print(f"[WARNING] list_applications - employerId: {employerId}")
-            # employerId로 공고 개수 확인
-            job_count_stmt = select(Job).where(Job.employerId == employerId)
-            job_count = len(session.exec(job_count_stmt).all())
-            print(f"[WARNING] list_applications - 이 고용주의 공고 개수: {job_count}")
-            
-            # 이 고용주의 공고에 대한 지원 내역 확인
-            if job_count > 0:
-                job_ids_stmt = select(Job.id).where(Job.employerId == employerId)
-                job_ids_result = session.exec(job_ids_stmt).all()
-                job_ids = [str(job_id) for job_id in job_ids_result] if job_ids_result else []
-                # Use or_ for IN clause
-                app_conditions = [Application.jobId == job_id for job_id in job_ids]
-                app_count_stmt = select(Application).where(or_(*app_conditions))
-                app_count = len(session.exec(app_count_stmt).all())
-                print(f"[WARNING] list_applications - 이 고용주의 공고에 대한 지원 내역 개수: {app_count}")
-    
     return results
 
 
+@router.post("/bulk-status", response_model=dict)
+async def bulk_update_application_status(
+    request: ApplicationBulkStatusUpdate,
+    session: Session = Depends(get_session),
+):
+    """지원서 여러 건의 상태를 한 번에 변경 (공고의 모든 지원서 또는 id 목록, 지원서별 결과 반환)
+
+    이미 결과가 난 지원서(rejected/hired)는 건너뛰고, hired는 accepted 지원서만 가능합니다.
+    """
+    if request.status not in APPLICATION_STATUSES:
+        raise HTTPException(status_code=400, detail=f"status는 {', '.join(APPLICATION_STATUSES)} 중 하나여야 합니다.")
+    if bool(request.jobId) == (request.applicationIds is not None):
+        raise HTTPException(status_code=400, detail="jobId 또는 applicationIds 중 하나만 보내야 합니다.")
+    if request.applicationIds is not None and len(request.applicationIds) > MAX_BULK_APPLICATIONS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {MAX_BULK_APPLICATIONS}건까지 변경할 수 있습니다.")
+    if request.jobId:
+        job = session.get(Job, request.jobId)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if request.userId and job.owner_user_id != request.userId:
+            raise HTTPException(status_code=403, detail="이 공고의 지원서를 변경할 권한이 없습니다.")
+
+    summary = bulk_set_status(
+        session,
+        request.status,
+        application_ids=request.applicationIds,
+        job_id=request.jobId,
+        user_id=request.userId,
+        versions=request.versions,
+    )
+    invalidate_dashboards_for_jobs(
+        session, [result["jobId"] for result in summary["results"] if result["result"] == "updated"]
+    )
+    print(
+        f"[DEBUG] bulk_update_application_status - {request.status}: 변경 {summary['updated']}건, "
+        f"유지 {summary['unchanged']}건, 실패 {summary['failed']}건"
+    )
+    return summary
+
+
 @router.patch("/{application_id}", response_model=dict)
 async def update_application(
     application_id: str,
@@ -515,8 +457,9 @@ async def update_application(
     
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
+    check_application_version(application, request.version)
     
-    application.status = request.status
+    set_application_status(session, application, request.status)
     application.updatedAt = datetime.utcnow().isoformat()
     
     if request.status == "accepted" or request.status == "hired":
@@ -525,6 +468,7 @@ async def update_application(
     session.add(application)
     session.commit()
     session.refresh(application)
+    invalidate_dashboards_for_jobs(session, [application.jobId])
     
     return {
         "applicationId": application.applicationId,
@@ -534,6 +478,7 @@ async def update_application(
         "appliedAt": application.appliedAt,
         "updatedAt": application.updatedAt,
         "hiredAt": application.hiredAt,
+        "version": application.version,
     }
 
 
@@ -549,6 +494,7 @@ async def update_interview_proposal(
     
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
+    check_application_version(application, request.version)
     
     # 기존 interviewData가 있으면 유지 (coordinationMessages 등)
     existing_interview_data = {}
@@ -578,14 +524,20 @@ async def update_interview_proposal(
     }
     
     application.interviewData = json.dumps(interview_data)
-    application.status = "reviewed" if application.status == "applied" else application.status
+    if application.status == "applied":
+        set_application_status(session, application, "reviewed")
     application.updatedAt = datetime.utcnow().isoformat()
     
     session.add(application)
     session.commit()
     session.refresh(application)
+    invalidate_dashboards_for_jobs(session, [application.jobId])
     
-    return {"applicationId": application.applicationId, "interviewData": interview_data}
+    return {
+        "applicationId": application.applicationId,
+        "interviewData": interview_data,
+        "version": application.version,
+    }
 
 
 @router.post("/{application_id}/acceptance-guide", response_model=dict)
@@ -600,6 +552,7 @@ async def update_acceptance_guide(
     
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
+    check_application_version(application, request.version)
     
     acceptance_data = {
         "documents": request.documents,
@@ -612,29 +565,23 @@ async def update_acceptance_guide(
     }
     
     application.acceptanceData = json.dumps(acceptance_data)
-    application.status = "accepted"
+    set_application_status(session, application, "accepted")
     application.updatedAt = datetime.utcnow().isoformat()
     
     # 조율 메시지가 있으면 추가
     if request.coordinationMessage:
-        messages = []
-        if application.coordinationMessages:
-            try:
-                messages = json.loads(application.coordinationMessages)
-            except:
-                messages = []
-        messages.append({
-            "message": request.coordinationMessage,
-            "sentAt": datetime.utcnow().isoformat(),
-            "from": "employer",
-        })
-        application.coordinationMessages = json.dumps(messages)
+        append_coordination_message(session, application, request.coordinationMessage, "employer")
     
     session.add(application)
     session.commit()
     session.refresh(application)
+    invalidate_dashboards_for_jobs(session, [application.jobId])
     
-    return {"applicationId": application.applicationId, "acceptanceData": acceptance_data}
+    return {
+        "applicationId": application.applicationId,
+        "acceptanceData": acceptance_data,
+        "version": application.version,
+    }
 
 
 @router.post("/{application_id}/first-work-date", response_model=dict)
@@ -649,6 +596,7 @@ async def update_first_work_date(
     
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
+    check_application_version(application, request.version)
     
     # acceptanceData 업데이트
     acceptance_data = {}
@@ -666,26 +614,20 @@ async def update_first_work_date(
     
     # 조율 메시지가 있으면 추가
     if request.coordinationMessage:
-        messages = []
-        if application.coordinationMessages:
-            try:
-                messages = json.loads(application.coordinationMessages)
-            except:
-                messages = []
-        messages.append({
-            "message": request.coordinationMessage,
-            "sentAt": datetime.utcnow().isoformat(),
-            "from": "employer",
-        })
-        application.coordinationMessages = json.dumps(messages)
+        append_coordination_message(session, application, request.coordinationMessage, "employer")
     
     application.updatedAt = datetime.utcnow().isoformat()
     
     session.add(application)
     session.commit()
     session.refresh(application)
+    invalidate_dashboards_for_jobs(session, [application.jobId])
     
-    return {"applicationId": application.applicationId, "acceptanceData": acceptance_data}
+    return {
+        "applicationId": application.applicationId,
+        "acceptanceData": acceptance_data,
+        "version": application.version,
+    }
 
 
 @router.post("/{application_id}/coordination-message", response_model=dict)
@@ -701,13 +643,6 @@ async def add_coordination_message(
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
     
-    messages = []
-    if application.coordinationMessages:
-        try:
-            messages = json.loads(application.coordinationMessages)
-        except:
-            messages = []
-    
     # 메시지 추가 (from 필드: type에 따라 구분)
     # interview_coordination: 구직자가 면접 조율 메시지 전송
     # work_date_coordination: 구직자가 출근 날짜 조율 메시지 전송
@@ -720,14 +655,8 @@ async def add_coordination_message(
     else:
         message_from = "jobseeker"  # 기본값
     
-    messages.append({
-        "message": request.message,
-        "sentAt": datetime.utcnow().isoformat(),
-        "from": message_from,
-        "type": request.type,
-    })
-    
-    application.coordinationMessages = json.dumps(messages)
+    # 배열 전체를 다시 쓰지 않고 행 INSERT 한 번 (coordination_messages)
+    append_coordination_message(session, application, request.message, message_from, request.type)
     
     # interviewData가 있으면 coordinationStatus 업데이트 (면접 조율인 경우)
     if request.type and "interview" in request.type and application.interviewData:
@@ -740,13 +669,68 @@ async def add_coordination_message(
         except:
             pass  # interviewData 파싱 실패 시 무시
     
-    application.updatedAt = datetime.utcnow().isoformat()
-    
+    # updatedAt만 바꾸는 경우는 version을 올리지 않음 (동시에 추가된 메시지끼리 409가 나지 않도록)
+    session.execute(
+        update(Application)
+        .where(Application.applicationId == application_id)
+        .values(updatedAt=datetime.utcnow().isoformat())
+    )
     session.add(application)
     session.commit()
     session.refresh(application)
     
-    return {"applicationId": application.applicationId, "coordinationMessages": messages}
+    return {
+        "applicationId": application.applicationId,
+        "coordinationMessages": list_coordination_messages(session, application.applicationId),
+    }
+
+
+@router.get("/{application_id}/coordination-messages", response_model=List[dict])
+async def get_coordination_messages(
+    application_id: str,
+    response: Response,
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    session: Session = Depends(get_session),
+):
+    """조율 메시지 목록 (최신순, 페이지 단위)"""
+    application = session.get(Application, application_id)
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+    if migrate_coordination_blob(session, application):
+        session.commit()
+    
+    statement = paginate_desc(
+        select(CoordinationMessage).where(CoordinationMessage.applicationId == application_id),
+        CoordinationMessage.sentAt,
+        CoordinationMessage.id,
+        cursor,
+    )
+    messages = session.exec(statement.limit(limit)).all()
+    next_page = next_cursor(messages, limit, lambda row: (row.sentAt, row.id))
+    if next_page:
+        response.headers[NEXT_CURSOR_HEADER] = next_page
+    return [message_to_dict(message) for message in messages]
+
+
+@router.get("/{application_id}/status-history", response_model=List[dict])
+async def get_status_history(application_id: str, session: Session = Depends(get_session)):
+    """지원서 상태 전환 이력 (오래된 순, application_status_events)"""
+    events = session.exec(
+        select(ApplicationStatusEvent)
+        .where(ApplicationStatusEvent.applicationId == application_id)
+        .order_by(ApplicationStatusEvent.created_at, ApplicationStatusEvent.id)
+    ).all()
+    if not events and not session.get(Application, application_id):
+        raise HTTPException(status_code=404, detail="Application not found")
+    return [
+        {
+            "from": event.from_status,
+            "to": event.to_status,
+            "at": event.created_at.isoformat(),
+        }
+        for event in events
+    ]
 
 
 @router.post("/{application_id}/confirm-work-date", response_model=dict)
@@ -761,6 +745,7 @@ async def confirm_work_date(
     
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
+    check_application_version(application, request.version)
     
     if request.confirmed:
         # acceptanceData에서 첫 출근 날짜 가져오기
@@ -774,18 +759,20 @@ async def confirm_work_date(
         first_work_date = acceptance_data.get("firstWorkDate")
         if first_work_date:
             application.firstWorkDateConfirmed = first_work_date
-            application.status = "hired"
+            set_application_status(session, application, "hired")
             application.hiredAt = datetime.utcnow().isoformat()
             application.updatedAt = datetime.utcnow().isoformat()
     
     session.add(application)
     session.commit()
     session.refresh(application)
+    invalidate_dashboards_for_jobs(session, [application.jobId])
     
     return {
         "applicationId": application.applicationId,
         "status": application.status,
         "firstWorkDateConfirmed": application.firstWorkDateConfirmed,
         "hiredAt": application.hiredAt,
+        "version": application.version,
     }
 
@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel import Session, select
-from typing import List
+from typing import List, Optional
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 
 from app.db import get_session
-from app.models import EmployerProfile, SignupUser, Store
+from app.models import EmployerProfile, Job, SignupUser, Store
 from app.schemas import EmployerProfileResponse, EmployerProfileCreate, StoreCreate, StoreResponse
+from app.services.employer_dashboard import get_dashboard, invalidate_dashboards
+from app.services.geo import geocode_address, set_job_coordinates
+from app.services.job_cards import refresh_cards_for_employer_profile, refresh_cards_for_store
+from app.services.job_facets import invalidate_job_facets
 
 router = APIRouter(prefix="/employer", tags=["employer"])
 
@@ -55,8 +59,10 @@ async def create_or_update_employer_profile(
             existing.is_verified = payload.is_verified
         existing.updated_at = datetime.utcnow()
         session.add(existing)
+        refresh_cards_for_employer_profile(session, existing.id)
         session.commit()
         session.refresh(existing)
+        invalidate_job_facets()  # 신뢰 공고 수가 바뀔 수 있음
         profile = existing
     else:
         profile = EmployerProfile(
@@ -87,6 +93,23 @@ async def create_or_update_employer_profile(
     )
 
 
+@router.get("/{user_id}/dashboard")
+async def get_employer_dashboard(
+    user_id: str,
+    day: Optional[str] = Query(default=None, alias="date", description="기준 날짜 YYYY-MM-DD (기본: 오늘, UTC)"),
+    session: Session = Depends(get_session),
+):
+    """고용주 채용 현황 - 상태/공고/매장별 지원자 수, 오늘 면접, 오늘 새 지원자 (고용주별 캐시)"""
+    if day:
+        try:
+            day = date.fromisoformat(day).isoformat()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="date는 YYYY-MM-DD 형식이어야 합니다.")
+    else:
+        day = datetime.utcnow().date().isoformat()
+    return get_dashboard(session, user_id, day)
+
+
 @router.get("/stores/{user_id}", response_model=List[StoreResponse])
 async def get_stores(user_id: str, session: Session = Depends(get_session)):
     """Get all stores for an employer"""
@@ -167,6 +190,7 @@ async def set_main_store(user_id: str, store_id: str, session: Session = Depends
     store.updated_at = datetime.utcnow()
     session.add(store)
     session.commit()
+    invalidate_dashboards([user_id])  # 매장 순서
     session.refresh(store)
     
     return StoreResponse(
@@ -205,11 +229,19 @@ async def update_store(user_id: str, store_id: str, payload: StoreCreate, sessio
     store.business_license = payload.business_license
     store.management_role = payload.management_role
     store.store_type = payload.store_type
+    store.latitude, store.longitude = geocode_address(payload.address) or (None, None)
     # is_main은 별도 API로만 변경 가능하므로 여기서는 업데이트하지 않음
     store.updated_at = datetime.utcnow()
     
     session.add(store)
+    # 매장 공고는 매장 좌표를 따름 → 좌표와 카드 갱신
+    if store.latitude is not None and store.longitude is not None:
+        for job in session.exec(select(Job).where(Job.store_id == store.id)).all():
+            set_job_coordinates(job, (store.latitude, store.longitude))
+            session.add(job)
+    refresh_cards_for_store(session, store.id)
     session.commit()
+    invalidate_dashboards([user_id])  # 매장 이름
     session.refresh(store)
     
     return StoreResponse(
@@ -265,9 +297,11 @@ async def create_store(payload: StoreCreate, session: Session = Depends(get_sess
             management_role=payload.management_role,
             store_type=payload.store_type,
         )
+        store.latitude, store.longitude = geocode_address(payload.address) or (None, None)
         
         session.add(store)
         session.commit()
+        invalidate_dashboards([payload.user_id])
         session.refresh(store)
         
         print(f"Store created successfully: {store.id}, is_main: {store.is_main}")
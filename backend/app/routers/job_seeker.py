@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlmodel import Session, select
 import uuid
 import json
@@ -8,6 +8,8 @@ from typing import Optional
 from app.db import get_session
 from app.models import JobSeekerProfile
 from app.schemas import JobSeekerProfileCreate, JobSeekerProfileResponse
+from app.services.pagination import NEXT_CURSOR_HEADER, next_cursor, paginate_desc
+from app.services.seeker_index import seeker_index
 
 router = APIRouter(prefix="/job-seeker", tags=["job-seeker"])
 
@@ -70,6 +72,7 @@ async def create_job_seeker_profile(
         session.add(existing)
         session.commit()
         session.refresh(existing)
+        seeker_index.upsert(session, existing)
 
         return JobSeekerProfileResponse(
             id=existing.id,
@@ -113,6 +116,7 @@ async def create_job_seeker_profile(
         session.add(profile)
         session.commit()
         session.refresh(profile)
+        seeker_index.upsert(session, profile)
 
         return JobSeekerProfileResponse(
             id=profile.id,
@@ -137,27 +141,38 @@ async def create_job_seeker_profile(
 
 @router.get("/profiles", response_model=list)
 async def list_job_seeker_profiles(
-    limit: int = 50,
+    response: Response,
+    limit: int = Query(default=50, le=200),
     offset: int = 0,
     visa_type: Optional[str] = None,
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 X-Next-Cursor 헤더 값 (offset 대신 사용)"),
     session: Session = Depends(get_session)
 ):
-    """List all job seeker profiles"""
+    """List all job seeker profiles (최신 등록순)"""
     from app.models import SignupUser
     
-    statement = select(JobSeekerProfile).offset(offset).limit(limit)
-    profiles = session.exec(statement).all()
+    statement = select(JobSeekerProfile, SignupUser).outerjoin(
+        SignupUser, SignupUser.id == JobSeekerProfile.user_id
+    )
+    if visa_type:
+        statement = statement.where(JobSeekerProfile.visa_type == visa_type)
+    statement = paginate_desc(
+        statement,
+        JobSeekerProfile.created_at,
+        JobSeekerProfile.id,
+        cursor,
+        parse_sort_value=datetime.fromisoformat,
+    )
+    if not cursor:
+        statement = statement.offset(offset)
+    rows = session.exec(statement.limit(limit)).all()
+    
+    next_page = next_cursor(rows, limit, lambda row: (row[0].created_at.isoformat(), row[0].id))
+    if next_page:
+        response.headers[NEXT_CURSOR_HEADER] = next_page
     
     result = []
-    for profile in profiles:
-        # filter by visa_type if requested
-        if visa_type:
-            if not profile.visa_type or profile.visa_type != visa_type:
-                continue
-        # Get user info
-        user_stmt = select(SignupUser).where(SignupUser.id == profile.user_id)
-        user = session.exec(user_stmt).first()
-        
+    for profile, user in rows:
         profile_dict = {
             "id": profile.id,
             "visa_type": profile.visa_type,
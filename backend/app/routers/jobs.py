@@ -1,209 +1,346 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlmodel import Session, select
-from sqlalchemy import func
 from typing import Optional, List
 import json
 import uuid
 
 from app.db import get_session
-from app.models import Job, Employer, EmployerProfile, SignupUser, Application
+from app.models import Job, JobCard, JobSeekerProfile, Employer, EmployerProfile, SignupUser, Application, Store, jobs_archive
 from app.schemas import JobCreateRequest, JobResponse
+from app.services.application_counters import get_status_counts
+from app.services.employer_dashboard import invalidate_dashboards
+from app.services.geo import (
+    MAX_RADIUS_KM,
+    geocode_address,
+    haversine_km,
+    parse_point,
+    set_job_coordinates,
+)
+from app.services.job_archive import archive_job, count_archived_applications, restore_job
+from app.services.job_cards import refresh_job_card
+from app.services.job_eligibility import seeker_eligibility, set_job_eligibility
+from app.services.job_facets import get_facets, invalidate_job_facets
+from app.services.job_import import JobImporter, iter_csv_records, iter_jsonl_records
+from app.services.job_recommender import job_recommender
+from app.services.job_search import index_job
+from app.services.job_wages import set_job_hourly_wage
+from app.services.matching import language_level
+from app.services.pagination import NEXT_CURSOR_HEADER
+from app.services.saved_searches import notify_matching_searches
+from app.services.seeker_index import seeker_index
+from app.services.view_counter import view_counter
+from app.services.job_query import (
+    build_job_list_statement,
+    card_json,
+    job_cursor,
+    job_to_dict,
+    select_jobs_with_employer,
+)
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
+def _check_job_owner(job, user_id: str, detail: str) -> None:
+    """공고(또는 보관된 공고 행)가 user_id 고용주의 것인지 확인, 아니면 403
+
+    소유자를 찾을 수 없는 레거시 공고(owner_user_id NULL)는 누구의 것도 아닌 것으로 봅니다.
+    """
+    if job.owner_user_id != user_id:
+        raise HTTPException(status_code=403, detail=detail)
+
+
+def _job_list_filters(
+    session: Session,
+    query: Optional[str],
+    location: Optional[str],
+    industry: Optional[str],
+    language_label: Optional[str],
+    visa_type: Optional[str],
+    eligible_for: Optional[str],
+    store_id: Optional[str],
+    user_id: Optional[str],
+    status: Optional[str],
+    sort: Optional[str],
+) -> dict:
+    """list_jobs/facets 공통 쿼리 파라미터 -> apply_job_filters 인자"""
+    # 지원 자격 (jobs.visa_mask / lang_level 정수 컬럼 비교)
+    max_language_level = language_level(language_label) if language_label else None
+    if eligible_for:
+        eligibility = seeker_eligibility(session, eligible_for)
+        if eligibility is None:
+            raise HTTPException(status_code=404, detail="구직자 프로필을 찾을 수 없습니다.")
+        seeker_visa, seeker_level = eligibility
+        visa_type = visa_type or seeker_visa
+        max_language_level = seeker_level if max_language_level is None else min(max_language_level, seeker_level)
+
+    # 구직자 피드는 모집 중인 공고만, 공고 관리 페이지(store_id/user_id)는 모든 상태
+    if status is None:
+        status = "all" if (store_id or user_id) else "active"
+
+    return {
+        "query": query,
+        "location": location,
+        "industry": industry,
+        "max_language_level": max_language_level,
+        "visa_type": visa_type,
+        "store_id": store_id,
+        "user_id": user_id,
+        "status": None if status == "all" else status,
+        "sort": sort,
+        "dialect": session.get_bind().dialect.name,
+    }
+
+
 @router.get("", response_model=List[dict])
 async def list_jobs(
-    query: Optional[str] = None,
+    response: Response,
+    q: Optional[str] = Query(default=None, description="전문 검색어 (제목/설명/업종/가게명, 관련도순)"),
+    query: Optional[str] = Query(default=None, description="q의 이전 이름 (호환용)"),
     location: Optional[str] = None,
     industry: Optional[str] = None,
-    languageLevel: Optional[str] = None,
-    visaType: Optional[str] = None,
+    languageLevel: Optional[str] = Query(default=None, description="한국어 수준 ('Lv.2 초급' 등) - 요구 수준이 이하인 공고"),
+    visaType: Optional[str] = Query(default=None, description="비자 - 해당 비자로 지원 가능한 공고 (비자 제한 없음 포함)"),
+    eligible_for: Optional[str] = Query(default=None, description="구직자 user_id - 비자/한국어 수준으로 지원 가능한 공고만"),
     store_id: Optional[str] = Query(default=None, description="매장 ID로 필터링"),
-    user_id: Optional[str] = Query(default=None, description="고용주 user_id로 필터링 (해당 고용주의 모든 매장 공고)"),
+    user_id: Optional[str] = Query(default=None, description="고용주 user_id로 필터링 (해당 고용주의 모든 공고)"),
+    status: Optional[str] = Query(
+        default=None,
+        description="공고 상태 필터 (active/paused/closed/all). 기본: store_id/user_id가 없으면 active",
+    ),
     sort: Optional[str] = Query(
         default=None,
         description="Preset filter: high-wage, popular, trusted, short-term",
     ),
+    near: Optional[str] = Query(default=None, description="반경 검색 중심 좌표 'lat,lng'"),
+    radiusKm: float = Query(default=5.0, gt=0, le=MAX_RADIUS_KM, description="반경 (km)"),
     limit: int = Query(default=20, le=100),
     offset: int = 0,
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 X-Next-Cursor 헤더 값 (offset 대신 사용)"),
     session: Session = Depends(get_session),
 ):
-    """List jobs with filters"""
-    from app.models import Store
-    
-    statement = select(Job)
-    if query:
-        statement = statement.where(Job.title.like(f"%{query}%"))
-    if location:
-        statement = statement.where(Job.location.like(f"%{location}%"))
-    if industry:
-        statement = statement.where(Job.category.like(f"%{industry}%"))
-    if languageLevel:
-        statement = statement.where(Job.requiredLanguage.like(f"%{languageLevel}%"))
-    if store_id:
-        statement = statement.where(Job.store_id == store_id)
-    if user_id and user_id.strip():
-        # 고용주의 모든 매장 ID 가져오기
-        stores_stmt = select(Store).where(Store.user_id == user_id)
-        stores = session.exec(stores_stmt).all()
-        store_ids = [store.id for store in stores]
-        
-        print(f"[DEBUG] list_jobs - user_id 필터링:")
-        print(f"  user_id: {user_id}")
-        print(f"  매장 개수: {len(stores)}")
-        print(f"  매장 IDs: {store_ids}")
-        
-        if store_ids:
-            # 매장이 있으면: 해당 매장의 공고만 조회 (store_id가 NULL인 레거시 공고는 제외)
-            statement = statement.where(Job.store_id.in_(store_ids))
-            print(f"[DEBUG] list_jobs - 매장 필터 적용: {store_ids}")
-        else:
-            # 매장이 없으면: 빈 결과 반환 (레거시 공고는 더 이상 표시하지 않음)
-            statement = statement.where(Job.id == "never-match")  # 항상 빈 결과
-            print(f"[DEBUG] list_jobs - 매장이 없음, 빈 결과 반환")
+    """List jobs with filters
+
+    다음 페이지가 있으면 X-Next-Cursor 응답 헤더로 cursor를 돌려줍니다.
+    (검색어 관련도순은 offset 페이지네이션, 반경 검색은 정렬 프리셋이 없으면 가까운 순 cursor)
+    """
+    near_filter = None
+    if near:
+        try:
+            near_filter = (*parse_point(near), radiusKm)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="near는 'lat,lng' 형식이어야 합니다.")
+
+    # 모든 필터/프리셋/정렬을 SQL 한 번에 처리 (LIMIT 이후 Python 필터링으로 페이지가 줄어드는 문제 방지)
+    filters = _job_list_filters(
+        session, q or query, location, industry, languageLevel, visaType, eligible_for,
+        store_id, user_id, status, sort,
+    )
+    statement = build_job_list_statement(
+        **filters,
+        near=near_filter,
+        cursor=cursor,
+        cards=not near_filter,
+    )
+    keyset = not ((q or query) and not sort)
+    if keyset and cursor:
+        statement = statement.limit(limit)
+    else:
+        statement = statement.offset(offset).limit(limit)
+
+    if near_filter:
+        # 거리 판정/정렬/LIMIT까지 SQL에서 처리된 페이지 - 응답 거리만 haversine으로 계산
+        lat, lng, _ = near_filter
+        rows = session.exec(statement).all()
+        if keyset:
+            next_page = job_cursor(rows, limit, sort, near=True)
+            if next_page:
+                response.headers[NEXT_CURSOR_HEADER] = next_page
+        result = []
+        for job, employer, employer_profile, _ in rows:
+            job_dict = job_to_dict(job, employer, employer_profile)
+            job_dict["distanceKm"] = round(haversine_km(lat, lng, job.latitude, job.longitude), 2)
+            result.append(job_dict)
+        return result
+
+    rows = session.exec(statement).all()
+    print(f"[DEBUG] list_jobs - 조회된 공고 개수: {len(rows)} (sort={sort}, offset={offset}, limit={limit})")
+
+    headers = {}
+    if keyset:
+        next_page = job_cursor(rows, limit, sort)
+        if next_page:
+            headers[NEXT_CURSOR_HEADER] = next_page
+
+    # job_cards에 미리 직렬화된 카드 JSON을 그대로 이어붙여 응답 (행별 dict 조립/검증 없음)
+    # applicationsCount/views는 DB가 jobs 행의 최신 값으로 덮어씀 (job_query.card_json)
+    content = "[" + ",".join(row.payload for row in rows) + "]"
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+@router.get("/facets", response_model=dict)
+async def job_facets(
+    q: Optional[str] = Query(default=None, description="전문 검색어"),
+    location: Optional[str] = None,
+    industry: Optional[str] = None,
+    languageLevel: Optional[str] = None,
+    visaType: Optional[str] = None,
+    eligible_for: Optional[str] = Query(default=None, description="구직자 user_id"),
+    store_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    status: Optional[str] = Query(default=None, description="active/paused/closed/all (기본은 GET /jobs와 같음)"),
+    sort: Optional[str] = Query(default=None, description="Preset filter: high-wage, popular, trusted"),
+    session: Session = Depends(get_session),
+):
+    """현재 필터 조건의 facet별 공고 수 (업종/지역/급여 구간/급여 형태/신뢰/프리셋)
+
+    GET /jobs와 같은 필터 파라미터를 받습니다. 결과는 짧은 TTL로 캐시되고 공고 변경 시 무효화됩니다.
+    """
+    filters = _job_list_filters(
+        session, q, location, industry, languageLevel, visaType, eligible_for,
+        store_id, user_id, status, sort,
+    )
+    return get_facets(session, **filters)
 
-    jobs = session.exec(statement.offset(offset).limit(limit)).all()
-    print(f"[DEBUG] list_jobs - 조회된 공고 개수: {len(jobs)}")
-    
-    if len(jobs) == 0:
-        print(f"[WARNING] list_jobs - 조회된 공고가 없습니다")
-        print(f"[WARNING] list_jobs - 필터 조건을 확인하세요")
 
-    # Preload application counts for popularity sorting/filtering
-    app_counts = dict(
+@router.get("/archived", response_model=List[dict])
+async def list_archived_jobs(
+    user_id: str = Query(..., description="고용주 user_id (해당 고용주의 보관 공고)"),
+    limit: int = Query(default=50, ge=1, le=200),
+    session: Session = Depends(get_session),
+):
+    """삭제(보관)된 공고 목록 (최근 삭제순) - 복원 화면용"""
+    rows = session.execute(
+        select(jobs_archive)
+        .where(jobs_archive.c.owner_user_id == user_id)
+        .order_by(jobs_archive.c.archived_at.desc(), jobs_archive.c.id.desc())
+        .limit(limit)
+    ).all()
+    counts = count_archived_applications(session, [row.id for row in rows])
+    return [
+        {
+            "id": row.id,
+            "title": row.title,
+            "status": row.status,
+            "deadline": row.deadline,
+            "store_id": row.store_id,
+            "shop_name": row.shop_name,
+            "postedAt": row.postedAt,
+            "archivedAt": row.archived_at,
+            "applicationsCount": counts.get(row.id, 0),
+        }
+        for row in rows
+    ]
+
+
+@router.get("/recommended", response_model=List[dict])
+async def recommend_jobs(
+    user_id: str = Query(..., description="구직자 user_id (job_seeker_profiles.user_id)"),
+    limit: int = Query(default=20, ge=1, le=100),
+    session: Session = Depends(get_session),
+):
+    """구직자 프로필(선호 지역/직종/요일, 비자) 기반 추천 공고 (점수 높은 순)"""
+    profile = session.exec(select(JobSeekerProfile).where(JobSeekerProfile.user_id == user_id)).first()
+    if not profile:
+        raise HTTPException(status_code=404, detail="구직자 프로필을 찾을 수 없습니다.")
+    
+    job_recommender.ensure_loaded(session)
+    ranked = job_recommender.top_k(profile, limit)
+    if not ranked:
+        return []
+    
+    payloads = dict(
         session.exec(
-            select(Application.jobId, func.count(Application.applicationId)).group_by(Application.jobId)
+            select(Job.id, card_json()).join(JobCard, JobCard.job_id == Job.id).where(
+                Job.id.in_([job_id for job_id, _ in ranked])
+            )
         ).all()
     )
-    
-    # Get employer info for each job
     result = []
-    for job in jobs:
-        employer_stmt = select(Employer).where(Employer.id == job.employerId)
-        employer = session.exec(employer_stmt).first()
-        # Status filter는 공고 관리 페이지에서 필요하므로 제거
-        # if hasattr(job, 'status') and job.status != 'active':
-        #     continue
-
-        # Filter by visaType if provided
-        try:
-            required_visas = json.loads(job.requiredVisa) if job.requiredVisa else []
-        except Exception:
-            required_visas = []
-
-        if visaType:
-            # required_visas may be list or string; normalize
-            if isinstance(required_visas, list):
-                if visaType not in required_visas:
-                    continue
-            else:
-                if visaType not in str(required_visas):
-                    continue
-
-        # Derive trust flag from employer profile (사업자등록증/인증 여부)
-        is_trusted = False
-        employer_profile = None
-        if employer and employer.businessNo:
-            employer_profile = session.exec(
-                select(EmployerProfile).where(EmployerProfile.id == employer.businessNo)
-            ).first()
-        if employer_profile:
-            if getattr(employer_profile, "business_license", None):
-                is_trusted = True
-            if getattr(employer_profile, "is_verified", False):
-                is_trusted = True
-
-        job_dict = job.dict()
-        job_dict["employer"] = employer.dict() if employer else {}
-        job_dict["requiredVisa"] = required_visas
-        job_dict["applicationsCount"] = app_counts.get(job.id, 0)
-        job_dict["isTrusted"] = is_trusted
-        job_dict["wage_type"] = getattr(job, 'wage_type', 'hourly') or 'hourly'
-        job_dict["store_id"] = getattr(job, 'store_id', None)
-        job_dict["shop_name"] = getattr(job, 'shop_name', None)
-        job_dict["shop_address"] = getattr(job, 'shop_address', None)
-        job_dict["shop_address_detail"] = getattr(job, 'shop_address_detail', None)
-        job_dict["shop_phone"] = getattr(job, 'shop_phone', None)
-
-        # Quick-menu preset filters
-        if sort == "high-wage" and job.wage < 11000:
-            continue
-        if sort == "popular" and app_counts.get(job.id, 0) <= 0:
-            continue
-        if sort == "trusted" and not is_trusted:
+    for job_id, score in ranked:
+        if job_id not in payloads:
             continue
+        job_dict = json.loads(payloads[job_id])
+        job_dict["matchScore"] = round(score, 3)
         result.append(job_dict)
-    
-    # Sorting for presets
-    if sort == "high-wage":
-        result.sort(key=lambda x: x.get("wage", 0), reverse=True)
-    elif sort == "popular":
-        result.sort(key=lambda x: x.get("applicationsCount", 0), reverse=True)
-    elif sort == "trusted":
-        result.sort(key=lambda x: x.get("postedAt") or x.get("createdAt") or "", reverse=True)
-    else:
-        # Default: latest first if postedAt exists
-        result.sort(key=lambda x: x.get("postedAt") or x.get("createdAt") or "", reverse=True)
-
-    print(f"[DEBUG] list_jobs - 최종 반환할 공고 개수: {len(result)}")
-    if result:
-        print(f"[DEBUG] list_jobs - 첫 번째 공고 샘플: {result[0].get('id', 'N/A')} - {result[0].get('title', 'N/A')}")
-    
     return result
 
 
 @router.get("/{job_id}", response_model=dict)
 async def get_job(job_id: str, session: Session = Depends(get_session)):
     """Get single job detail"""
-    statement = select(Job).where(Job.id == job_id)
-    job = session.exec(statement).first()
+    row = session.exec(select_jobs_with_employer().where(Job.id == job_id)).first()
+    
+    if not row:
+        raise HTTPException(status_code=404, detail="Job not found")
+    job, employer, employer_profile = row
     
+    # 조회수 증가 (메모리 버퍼에 모았다가 주기적으로 일괄 반영 - app.services.view_counter)
+    pending_views = view_counter.record(job.id)
+    
+    job_data = job_to_dict(job, employer, employer_profile)
+    job_data["views"] = (job.views or 0) + pending_views
+    return job_data
+
+
+@router.get("/{job_id}/application-stats", response_model=dict)
+async def get_job_application_stats(job_id: str, session: Session = Depends(get_session)):
+    """공고의 전체/상태별 지원자 수 (비정규화 카운터 조회)"""
+    job = session.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {
+        "jobId": job.id,
+        "applicationsCount": job.applications or 0,
+        "byStatus": get_status_counts(session, job.id),
+    }
+
+
+@router.get("/{job_id}/candidates", response_model=List[dict])
+async def get_job_candidates(
+    job_id: str,
+    limit: int = Query(default=20, ge=1, le=100),
+    exclude_applied: bool = Query(default=True, description="이미 지원/초대된 구직자 제외"),
+    session: Session = Depends(get_session),
+):
+    """공고 조건(업종/지역/요일/시간/비자/한국어)에 맞는 구직자 추천 순위와 매칭 사유"""
+    job = session.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    # 조회수 증가
-    if hasattr(job, 'views'):
-        job.views = (job.views or 0) + 1
-        session.add(job)
-        session.commit()
-        session.refresh(job)
+    exclude = []
+    if exclude_applied:
+        exclude = session.exec(select(Application.seekerId).where(Application.jobId == job_id)).all()
     
-    # Get employer
-    employer_stmt = select(Employer).where(Employer.id == job.employerId)
-    employer = session.exec(employer_stmt).first()
-    employer_profile = None
-    is_trusted = False
-    if employer and employer.businessNo:
-        employer_profile = session.exec(
-            select(EmployerProfile).where(EmployerProfile.id == employer.businessNo)
-        ).first()
-    if employer_profile:
-        if getattr(employer_profile, "business_license", None):
-            is_trusted = True
-        if getattr(employer_profile, "is_verified", False):
-            is_trusted = True
-    
-    job_dict = job.dict()
-    job_dict["employer"] = employer.dict() if employer else {}
-    # requiredVisa가 문자열/JSON 형태 모두 안전하게 처리
-    try:
-        job_dict["requiredVisa"] = json.loads(job.requiredVisa)
-    except Exception:
-        job_dict["requiredVisa"] = job.requiredVisa if isinstance(job.requiredVisa, list) else []
-    count_row = session.exec(
-        select(func.count(Application.applicationId)).where(Application.jobId == job.id)
-    ).first()
-    job_dict["applicationsCount"] = count_row or 0
-    job_dict["isTrusted"] = is_trusted
-    job_dict["wage_type"] = getattr(job, 'wage_type', 'hourly') or 'hourly'
-    job_dict["store_id"] = getattr(job, 'store_id', None)
-    job_dict["shop_name"] = getattr(job, 'shop_name', None)
-    job_dict["shop_address"] = getattr(job, 'shop_address', None)
-    job_dict["shop_address_detail"] = getattr(job, 'shop_address_detail', None)
-    job_dict["shop_phone"] = getattr(job, 'shop_phone', None)
-    
-    return job_dict
+    seeker_index.ensure_loaded(session)
+    ranked = seeker_index.top_k(job, limit, exclude=exclude)
+    if not ranked:
+        return []
+    
+    rows = session.exec(
+        select(JobSeekerProfile, SignupUser)
+        .outerjoin(SignupUser, SignupUser.id == JobSeekerProfile.user_id)
+        .where(JobSeekerProfile.user_id.in_([candidate["user_id"] for candidate in ranked]))
+    ).all()
+    by_user = {profile.user_id: (profile, user) for profile, user in rows}
+    
+    result = []
+    for candidate in ranked:
+        if candidate["user_id"] not in by_user:
+            continue
+        profile, user = by_user[candidate["user_id"]]
+        result.append({
+            "user_id": profile.user_id,
+            "profile_id": profile.id,
+            "name": user.name if user else "Unknown",
+            "nationality": user.nationality_code if user else None,
+            "visa_type": profile.visa_type,
+            "preferred_regions": json.loads(profile.preferred_regions) if profile.preferred_regions else [],
+            "preferred_jobs": json.loads(profile.preferred_jobs) if profile.preferred_jobs else [],
+            "work_days_of_week": json.loads(profile.work_days_of_week) if profile.work_days_of_week else [],
+            "score": candidate["score"],
+            "reasons": candidate["reasons"],
+        })
+    return result
 
 
 @router.patch("/{job_id}/status")
@@ -225,8 +362,12 @@ async def update_job_status(
     
     job.status = new_status
     session.add(job)
+    refresh_job_card(session, job.id)
     session.commit()
     session.refresh(job)
+    job_recommender.upsert(job)
+    invalidate_job_facets()
+    invalidate_dashboards([job.owner_user_id])
     
     return {"message": "Status updated successfully", "status": new_status}
 
@@ -238,8 +379,6 @@ async def delete_job(
     session: Session = Depends(get_session)
 ):
     """Delete a job posting (only by the owner)"""
-    from app.models import Store
-    
     statement = select(Job).where(Job.id == job_id)
     job = session.exec(statement).first()
     
@@ -248,37 +387,12 @@ async def delete_job(
     
     # 권한 확인: user_id가 제공된 경우, 해당 고용주의 공고인지 확인
     if user_id:
-        # Job의 store_id로 Store를 찾아서 user_id 확인
-        if job.store_id:
-            store_stmt = select(Store).where(Store.id == job.store_id)
-            store = session.exec(store_stmt).first()
-            if not store or store.user_id != user_id:
-                raise HTTPException(
-                    status_code=403, 
-                    detail="이 공고를 삭제할 권한이 없습니다. 본인이 등록한 공고만 삭제할 수 있습니다."
-                )
-        else:
-            # store_id가 NULL인 레거시 공고의 경우, employerId로 확인
-            employer_stmt = select(Employer).where(Employer.id == job.employerId)
-            employer = session.exec(employer_stmt).first()
-            if employer and employer.businessNo:
-                employer_profile_stmt = select(EmployerProfile).where(EmployerProfile.id == employer.businessNo)
-                employer_profile = session.exec(employer_profile_stmt).first()
-                if not employer_profile or employer_profile.user_id != user_id:
-                    raise HTTPException(
-                        status_code=403,
-                        detail="이 공고를 삭제할 권한이 없습니다. 본인이 등록한 공고만 삭제할 수 있습니다."
-                    )
-    
-    # Application이 있는 경우도 처리 (외래키 제약조건)
+        _check_job_owner(job, user_id, "이 공고를 삭제할 권한이 없습니다. 본인이 등록한 공고만 삭제할 수 있습니다.")
+    
+    owner_user_id = job.owner_user_id  # 보관 후에는 행이 없어 다시 읽을 수 없음
+    # 공고와 지원서를 보관 테이블로 이동 (INSERT ... SELECT + DELETE, 한 트랜잭션)
     try:
-        # 관련 Application 삭제
-        applications_stmt = select(Application).where(Application.jobId == job_id)
-        applications = session.exec(applications_stmt).all()
-        for app in applications:
-            session.delete(app)
-        
-        session.delete(job)
+        archived_applications = archive_job(session, job_id)
         session.commit()
     except Exception as e:
         session.rollback()
@@ -287,7 +401,42 @@ async def delete_job(
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"공고 삭제 중 오류 발생: {str(e)}")
     
-    return {"message": "Job deleted successfully"}
+    view_counter.discard(job_id)
+    job_recommender.remove(job_id)
+    invalidate_job_facets()
+    invalidate_dashboards([owner_user_id])
+    return {"message": "Job deleted successfully", "archivedApplications": archived_applications}
+
+
+@router.post("/{job_id}/restore")
+async def restore_deleted_job(
+    job_id: str,
+    user_id: Optional[str] = Query(default=None, description="고용주 user_id (권한 확인용)"),
+    session: Session = Depends(get_session),
+):
+    """삭제(보관)된 공고와 지원서 복원"""
+    archived = session.execute(select(jobs_archive).where(jobs_archive.c.id == job_id)).first()
+    if not archived:
+        raise HTTPException(status_code=404, detail="보관된 공고를 찾을 수 없습니다.")
+    if session.get(Job, job_id):
+        raise HTTPException(status_code=409, detail="같은 ID의 공고가 이미 있습니다.")
+    if user_id:
+        _check_job_owner(archived, user_id, "이 공고를 복원할 권한이 없습니다. 본인이 등록한 공고만 복원할 수 있습니다.")
+    
+    try:
+        job, restored_applications = restore_job(session, job_id)
+        session.commit()
+        session.refresh(job)
+    except Exception as e:
+        session.rollback()
+        print(f"[ERROR] restore_deleted_job - 복원 중 오류: {e}")
+        raise HTTPException(status_code=500, detail=f"공고 복원 중 오류 발생: {str(e)}")
+    
+    job_recommender.upsert(job)
+    invalidate_job_facets()
+    invalidate_dashboards([job.owner_user_id])
+    print(f"[DEBUG] restore_deleted_job - {job_id} 복원 (지원서 {restored_applications}건)")
+    return {"message": "Job restored successfully", "id": job_id, "restoredApplications": restored_applications}
 
 
 @router.put("/{job_id}")
@@ -326,14 +475,74 @@ async def update_job(
         job.requiredVisa = json.dumps(job_data['required_visa'])
     if 'benefits' in job_data:
         job.benefits = job_data['benefits']
+    set_job_eligibility(job)
+    set_job_hourly_wage(job)
     
     session.add(job)
+    index_job(session, job)
+    refresh_job_card(session, job.id)
     session.commit()
     session.refresh(job)
+    job_recommender.upsert(job)
+    invalidate_job_facets()
+    invalidate_dashboards([job.owner_user_id])
     
     return {"message": "Job updated successfully", "job_id": job.id}
 
 
+@router.post("/bulk", response_model=dict)
+async def bulk_create_jobs(
+    request: Request,
+    employer_profile_id: str = Query(..., description="공고를 등록할 고용주 프로필 ID"),
+    format: Optional[str] = Query(default=None, description="jsonl 또는 csv (미지정 시 Content-Type으로 판단)"),
+    session: Session = Depends(get_session),
+):
+    """JSONL/CSV 본문으로 공고 여러 건 등록 (행별 결과 반환)
+
+    각 행의 필드는 POST /jobs와 같습니다. CSV의 required_visa는 'E-9|H-2' 형식도 허용합니다.
+    """
+    content_type = request.headers.get("content-type", "")
+    fmt = (format or ("csv" if "csv" in content_type else "jsonl")).lower()
+    if fmt not in ("jsonl", "csv"):
+        raise HTTPException(status_code=400, detail="format은 jsonl 또는 csv여야 합니다.")
+    
+    # 고용주 정보는 요청당 한 번만 조회
+    employer_profile = session.get(EmployerProfile, employer_profile_id)
+    if not employer_profile:
+        raise HTTPException(status_code=404, detail="고용주 프로필을 찾을 수 없습니다.")
+    signup_user = session.exec(select(SignupUser).where(SignupUser.id == employer_profile.user_id)).first()
+    if not signup_user:
+        raise HTTPException(status_code=404, detail="사용자 정보를 찾을 수 없습니다.")
+    employer = session.exec(select(Employer).where(Employer.businessNo == employer_profile.id)).first()
+    if not employer:
+        # Legacy employers 레코드 (create_job과 동일, 공고별 값은 기본값 사용)
+        employer = Employer(
+            id=f"emp-{uuid.uuid4().hex[:8]}",
+            businessNo=employer_profile.id,
+            shopName=employer_profile.company_name,
+            industry="기타",
+            address=employer_profile.address,
+            openHours="09:00-18:00",
+            contact=signup_user.email or "",
+            minLanguageLevel="",
+            baseWage=0,
+            schedule="",
+        )
+        session.add(employer)
+        session.commit()
+        session.refresh(employer)
+    
+    importer = JobImporter(session, employer_profile, employer)
+    records = iter_csv_records(request.stream()) if fmt == "csv" else iter_jsonl_records(request.stream())
+    async for row_no, record in records:
+        importer.add(row_no, record)
+    result = importer.summary()
+    invalidate_job_facets()
+    invalidate_dashboards([importer.employer_profile.user_id])
+    print(f"[DEBUG] bulk_create_jobs - 등록 {result['created']}건, 실패 {result['failed']}건 (format={fmt})")
+    return result
+
+
 @router.post("", response_model=JobResponse, status_code=201)
 async def create_job(request: JobCreateRequest, session: Session = Depends(get_session)):
     """Create a new job posting"""
@@ -403,6 +612,7 @@ async def create_job(request: JobCreateRequest, session: Session = Depends(get_s
     job = Job(
         id=job_id,
         employerId=employer.id,
+        owner_user_id=employer_profile.user_id,
         title=request.title,
         description=request.description,
         category=request.category,
@@ -427,6 +637,14 @@ async def create_job(request: JobCreateRequest, session: Session = Depends(get_s
         shop_phone=request.shop_phone,
         store_id=request.store_id,
     )
+    # 좌표: 매장 좌표 우선, 없으면 주소를 오프라인 지오코딩
+    store = session.get(Store, request.store_id) if request.store_id else None
+    if store and store.latitude is not None and store.longitude is not None:
+        set_job_coordinates(job, (store.latitude, store.longitude))
+    else:
+        set_job_coordinates(job, geocode_address(request.shop_address, location, employer.address))
+    set_job_eligibility(job)
+    set_job_hourly_wage(job)
     
     # 디버깅: 저장할 Job 객체 확인 (인코딩 안전 처리)
     try:
@@ -447,8 +665,14 @@ async def create_job(request: JobCreateRequest, session: Session = Depends(get_s
     try:
         print(f"[DEBUG] create_job - 데이터베이스에 저장 시작...")
         session.add(job)
+        index_job(session, job)
+        refresh_job_card(session, job.id)
+        notify_matching_searches(session, [job])  # 저장 검색 알림 (같은 트랜잭션)
         session.commit()
         session.refresh(job)
+        job_recommender.upsert(job)
+        invalidate_job_facets()
+        invalidate_dashboards([job.owner_user_id])
         print(f"[DEBUG] create_job - commit 완료")
         
         # 데이터베이스에 실제로 저장되었는지 확인
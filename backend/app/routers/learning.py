@@ -4,31 +4,11 @@ from sqlmodel import Session, select
 from app.db import get_session
 from app.models import LearningProgress
 from app.schemas import LevelTestSubmit
+from app.services.language_levels import map_topik_to_lv
 
 router = APIRouter(tags=["learning"])
 
 
-def map_topik_to_lv(label: str) -> str:
-    """Map TOPIK-style labels to frontend 'Lv.x' labels.
-
-    Examples:
-      'TOPIK 1급' -> 'Lv.1 기초'
-      'TOPIK 2급' -> 'Lv.2 초급'
-      'TOPIK 3급' -> 'Lv.3 중급'
-      anything else -> 'Lv.4 상급'
-    """
-    if not label:
-        return "Lv.1 기초"
-    l = label.upper()
-    if "TOPIK 1" in l or "1급" in l:
-        return "Lv.1 기초"
-    if "TOPIK 2" in l or "2급" in l:
-        return "Lv.2 초급"
-    if "TOPIK 3" in l or "3급" in l:
-        return "Lv.3 중급"
-    return "Lv.4 상급"
-
-
 @router.get("/learning/summary", response_model=dict)
 async def get_learning_summary(
     seekerId: str = Query(...),
@@ -0,0 +1,60 @@
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlmodel import Session, select
+
+from app.db import get_session
+from app.models import Notification
+from app.services.notifications import notification_to_dict
+from app.services.pagination import NEXT_CURSOR_HEADER, next_cursor, paginate_desc
+
+router = APIRouter(prefix="/notifications", tags=["notifications"])
+
+
+@router.get("", response_model=List[dict])
+async def list_notifications(
+    response: Response,
+    user_id: str = Query(..., description="알림을 받을 사용자 ID (signup_users.id)"),
+    unread_only: bool = False,
+    type: Optional[str] = Query(default=None, description="알림 종류 (job_closed, saved_search_match 등)"),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    session: Session = Depends(get_session),
+):
+    """사용자 알림 목록 (최신순)"""
+    statement = select(Notification).where(Notification.user_id == user_id)
+    if unread_only:
+        statement = statement.where(Notification.read_at.is_(None))
+    if type:
+        statement = statement.where(Notification.type == type)
+    statement = paginate_desc(
+        statement,
+        Notification.created_at,
+        Notification.id,
+        cursor,
+        parse_sort_value=datetime.fromisoformat,
+    )
+    notifications = session.exec(statement.limit(limit)).all()
+    
+    next_page = next_cursor(notifications, limit, lambda row: (row.created_at.isoformat(), row.id))
+    if next_page:
+        response.headers[NEXT_CURSOR_HEADER] = next_page
+    return [notification_to_dict(notification) for notification in notifications]
+
+
+@router.patch("/{notification_id}/read", response_model=dict)
+async def mark_notification_read(
+    notification_id: str,
+    session: Session = Depends(get_session),
+):
+    """알림 읽음 처리"""
+    notification = session.get(Notification, notification_id)
+    if not notification:
+        raise HTTPException(status_code=404, detail="알림을 찾을 수 없습니다.")
+    if notification.read_at is None:
+        notification.read_at = datetime.utcnow()
+        session.add(notification)
+        session.commit()
+        session.refresh(notification)
+    return notification_to_dict(notification)
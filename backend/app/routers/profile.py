@@ -8,6 +8,7 @@ from app.db import get_session
 from app.models import SignupUser, JobSeeker, JobSeekerProfile, Nationality
 from app.schemas import ProfileData
 from app.routers.auth import get_current_user
+from app.services.seeker_index import seeker_index
 
 router = APIRouter(prefix="/profile", tags=["profile"])
 
@@ -151,6 +152,7 @@ async def update_my_profile(
     session.refresh(signup_user)
     session.refresh(jobseeker)
     session.refresh(job_seeker_profile)
+    seeker_index.upsert(session, job_seeker_profile)
     
     # Return the updated data in the same combined format
     return ProfileData(
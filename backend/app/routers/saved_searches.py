@@ -0,0 +1,94 @@
+import uuid
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from app.db import get_session
+from app.models import SavedSearch
+from app.schemas import SavedSearchCreate
+from app.services.saved_searches import (
+    MAX_SAVED_SEARCHES_PER_USER,
+    index_saved_search,
+    remove_saved_search,
+)
+
+router = APIRouter(prefix="/saved-searches", tags=["saved-searches"])
+
+
+def _default_name(payload: SavedSearchCreate) -> str:
+    parts = [payload.query, payload.location, payload.industry, payload.visa_type]
+    if payload.min_hourly_wage:
+        parts.append(f"시급 {payload.min_hourly_wage:,}원 이상")
+    return " · ".join(part for part in parts if part) or "전체 공고"
+
+
+def _to_dict(search: SavedSearch) -> dict:
+    return {
+        "id": search.id,
+        "user_id": search.user_id,
+        "name": search.name,
+        "query": search.query,
+        "location": search.location,
+        "industry": search.industry,
+        "visa_type": search.visa_type,
+        "min_hourly_wage": search.min_hourly_wage,
+        "created_at": search.created_at,
+    }
+
+
+@router.post("", response_model=dict, status_code=201)
+async def create_saved_search(payload: SavedSearchCreate, session: Session = Depends(get_session)):
+    """검색 조건 저장 - 조건에 맞는 새 공고가 등록되면 알림함(GET /notifications)에 추가"""
+    count = session.exec(
+        select(func.count()).select_from(SavedSearch).where(SavedSearch.user_id == payload.user_id)
+    ).one()
+    if count >= MAX_SAVED_SEARCHES_PER_USER:
+        raise HTTPException(
+            status_code=400,
+            detail=f"저장한 검색은 최대 {MAX_SAVED_SEARCHES_PER_USER}개까지 만들 수 있습니다.",
+        )
+    
+    search = SavedSearch(
+        id=f"ss-{uuid.uuid4().hex[:12]}",
+        user_id=payload.user_id,
+        name=payload.name or _default_name(payload),
+        query=(payload.query or "").strip() or None,
+        location=(payload.location or "").strip() or None,
+        industry=(payload.industry or "").strip() or None,
+        visa_type=payload.visa_type or None,
+        min_hourly_wage=payload.min_hourly_wage or None,
+    )
+    session.add(search)
+    index_saved_search(session, search)
+    session.commit()
+    session.refresh(search)
+    return _to_dict(search)
+
+
+@router.get("", response_model=List[dict])
+async def list_saved_searches(
+    user_id: str = Query(..., description="구직자 user_id"),
+    session: Session = Depends(get_session),
+):
+    searches = session.exec(
+        select(SavedSearch).where(SavedSearch.user_id == user_id).order_by(SavedSearch.created_at.desc())
+    ).all()
+    return [_to_dict(search) for search in searches]
+
+
+@router.delete("/{search_id}")
+async def delete_saved_search(
+    search_id: str,
+    user_id: Optional[str] = Query(default=None, description="구직자 user_id (권한 확인용)"),
+    session: Session = Depends(get_session),
+):
+    search = session.get(SavedSearch, search_id)
+    if not search:
+        raise HTTPException(status_code=404, detail="저장한 검색을 찾을 수 없습니다.")
+    if user_id and search.user_id != user_id:
+        raise HTTPException(status_code=403, detail="본인이 저장한 검색만 삭제할 수 있습니다.")
+    remove_saved_search(session, search)
+    session.commit()
+    return {"message": "Saved search deleted successfully"}
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime, date, time
 
 
@@ -34,6 +34,17 @@ class ApplicationCreate(BaseModel):
 
 class ApplicationUpdate(BaseModel):
     status: str
+    # 마지막으로 읽은 applications.version (보내면 다르면 409, app/services/application_versions.py)
+    version: Optional[int] = None
+
+
+class ApplicationBulkStatusUpdate(BaseModel):
+    status: str
+    # jobId(공고의 모든 지원서) 또는 applicationIds 중 하나
+    jobId: Optional[str] = None
+    applicationIds: Optional[List[str]] = None
+    userId: Optional[str] = None  # 고용주 user_id (권한 확인용)
+    versions: Optional[Dict[str, int]] = None  # applicationId -> 마지막으로 읽은 version
 
 
 class InterviewProposalUpdate(BaseModel):
@@ -48,6 +59,7 @@ class InterviewProposalUpdate(BaseModel):
     # 면접 응답 상태 (구직자 응답)
     response: Optional[str] = None  # 'accepted' | 'rejected' | 'hold'
     responseAt: Optional[str] = None
+    version: Optional[int] = None  # ApplicationUpdate.version과 같음
 
 
 class AcceptanceGuideUpdate(BaseModel):
@@ -57,12 +69,14 @@ class AcceptanceGuideUpdate(BaseModel):
     firstWorkDate: Optional[str] = None
     firstWorkTime: Optional[str] = None
     coordinationMessage: Optional[str] = None
+    version: Optional[int] = None  # ApplicationUpdate.version과 같음
 
 
 class FirstWorkDateUpdate(BaseModel):
     firstWorkDate: str
     firstWorkTime: Optional[str] = None
     coordinationMessage: Optional[str] = None
+    version: Optional[int] = None  # ApplicationUpdate.version과 같음
 
 
 class CoordinationMessageCreate(BaseModel):
@@ -72,6 +86,7 @@ class CoordinationMessageCreate(BaseModel):
 
 class WorkDateConfirmation(BaseModel):
     confirmed: bool  # 출근 확정
+    version: Optional[int] = None  # ApplicationUpdate.version과 같음
 
 
 class MessageCreate(BaseModel):
@@ -286,6 +301,21 @@ class JobCreateRequest(BaseModel):
     location: Optional[str] = None
 
 
+class JobBulkRow(JobCreateRequest):
+    """POST /jobs/bulk 한 행 - employer_profile_id는 요청 단위(query)로 지정"""
+    employer_profile_id: Optional[str] = None
+
+
+class SavedSearchCreate(BaseModel):
+    user_id: str
+    name: Optional[str] = None
+    query: Optional[str] = None
+    location: Optional[str] = None
+    industry: Optional[str] = None
+    visa_type: Optional[str] = None
+    min_hourly_wage: Optional[int] = None
+
+
 class JobResponse(BaseModel):
     id: str
     employer_id: str
@@ -0,0 +1,124 @@
+"""
+Bulk application status (POST /applications/bulk-status)
+
+공고를 마감하면서 남은 지원자 수백 명을 불합격 처리하려면 PATCH /applications/{id}를
+지원서마다 호출해야 했습니다(행 읽기 → updatedAt 설정 → commit 반복).
+- 대상 지원서(공고 하나의 전체 지원서 또는 id 목록)의 상태/version을 쿼리 한 번으로 읽고 전환을 일괄 검증
+- 통과한 지원서는 UPDATE 한 번으로 status/updatedAt/version을 변경
+  (WHERE (applicationId, version) IN 읽은 값 - 그 사이 다른 요청이 바꾼 행이 있으면 전체 롤백 후 409)
+- 공고/매장/고용주 카운터와 상태 이력은 record_status_changes로 같은 트랜잭션에서
+- 지원서별 결과(updated / unchanged / error)를 돌려줌
+"""
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_, update
+from sqlmodel import Session, select
+
+from app.models import Application, Job
+from app.services.application_counters import record_status_changes
+from app.services.application_versions import CONFLICT_MESSAGE, conflict_detail
+
+APPLICATION_STATUSES = ("invited", "applied", "reviewed", "hold", "accepted", "rejected", "hired")
+MAX_BULK_APPLICATIONS = 2000
+
+# 결과가 난 지원서는 일괄 변경에서 제외 (필요하면 개별 PATCH로)
+FINAL_STATUSES = ("rejected", "hired")
+# 대상 상태별로 허용되는 이전 상태 (없으면 FINAL_STATUSES만 아니면 됨)
+_ALLOWED_FROM = {"hired": ("accepted",)}
+
+
+def transition_error(old_status: Optional[str], new_status: str) -> Optional[str]:
+    """old_status → new_status 일괄 전환이 불가능하면 사유, 가능하면 None"""
+    if old_status in FINAL_STATUSES:
+        return f"이미 결과가 난 지원서입니다 ({old_status})"
+    allowed = _ALLOWED_FROM.get(new_status)
+    if allowed and old_status not in allowed:
+        return f"{new_status} 상태로는 {', '.join(allowed)} 상태의 지원서만 변경할 수 있습니다."
+    return None
+
+
+def _result(application_id: str, job_id: Optional[str], result: str, **fields) -> dict:
+    return {"applicationId": application_id, "jobId": job_id, "result": result, **fields}
+
+
+def bulk_set_status(
+    session: Session,
+    status: str,
+    application_ids: Optional[List[str]] = None,
+    job_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    versions: Optional[Dict[str, int]] = None,
+) -> dict:
+    """지원서 여러 건의 상태 변경 후 commit. application_ids가 없으면 job_id 공고의 모든 지원서
+
+    user_id를 주면 그 고용주의 공고에 온 지원서만, versions를 주면 version이 같은 지원서만 변경합니다.
+    """
+    statement = select(
+        Application.applicationId, Application.jobId, Application.status, Application.version, Job.owner_user_id
+    ).outerjoin(Job, Job.id == Application.jobId)
+    if application_ids is None:
+        statement = statement.where(Application.jobId == job_id).order_by(
+            Application.appliedAt, Application.applicationId
+        )
+    else:
+        statement = statement.where(Application.applicationId.in_(application_ids))
+    rows = {row[0]: row for row in session.exec(statement).all()}
+    versions = versions or {}
+
+    results: List[dict] = []
+    targets = []
+    for application_id in dict.fromkeys(application_ids if application_ids is not None else rows):
+        row = rows.get(application_id)
+        if row is None:
+            results.append(_result(application_id, None, "error", error="지원서를 찾을 수 없습니다."))
+            continue
+        _, row_job_id, old_status, version, owner_user_id = row
+        error = None
+        if user_id and owner_user_id != user_id:
+            error = "이 지원서의 상태를 변경할 권한이 없습니다."
+        elif application_id in versions and versions[application_id] != version:
+            error = CONFLICT_MESSAGE
+        elif old_status != status:
+            error = transition_error(old_status, status)
+        if error:
+            results.append(_result(
+                application_id, row_job_id, "error", status=old_status, version=version, error=error
+            ))
+        elif old_status == status:
+            results.append(_result(application_id, row_job_id, "unchanged", status=old_status, version=version))
+        else:
+            targets.append(row)
+            results.append(_result(
+                application_id, row_job_id, "updated", previousStatus=old_status, status=status, version=version + 1
+            ))
+
+    if targets:
+        now = datetime.utcnow().isoformat()
+        values = {"status": status, "updatedAt": now, "version": Application.version + 1}
+        if status in ("accepted", "hired"):
+            values["hiredAt"] = now
+        updated = session.execute(
+            update(Application)
+            .where(tuple_(Application.applicationId, Application.version).in_([(row[0], row[3]) for row in targets]))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if updated != len(targets):
+            # 읽은 뒤 다른 요청이 일부 지원서를 바꿈 - 카운터가 어긋나지 않도록 전부 취소
+            session.rollback()
+            raise HTTPException(status_code=409, detail=conflict_detail())
+        record_status_changes(session, [(row[0], row[1], row[2], status) for row in targets])
+    session.commit()
+
+    counts = {"updated": 0, "unchanged": 0, "error": 0}
+    for result in results:
+        counts[result["result"]] += 1
+    return {
+        "status": status,
+        "updated": counts["updated"],
+        "unchanged": counts["unchanged"],
+        "failed": counts["error"],
+        "results": results,
+    }
@@ -0,0 +1,278 @@
+"""
+Denormalized application counters
+
+공고별 지원자 수(Job.applications)와 상태별 지원자 수(job_application_stats),
+매장/고용주별 상태별 지원자 수(application_status_rollups)를 지원서 생성/상태 변경/
+공고 삭제와 같은 트랜잭션 안에서 증감합니다.
+목록/대시보드 조회 시 applications 테이블 전체 GROUP BY가 필요 없어집니다.
+
+상태 전환은 모두 application_status_events에 한 행씩 남깁니다. (생성은 from_status NULL)
+"""
+import uuid
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, literal, update
+from sqlmodel import Session, select
+
+from app.models import (
+    Application,
+    ApplicationStatusEvent,
+    ApplicationStatusRollup,
+    Job,
+    JobApplicationStat,
+)
+from app.services.job_trends import APPLICATION_WEIGHT, trend_increment
+
+# (applicationId, jobId, 이전 상태 또는 None, 새 상태)
+StatusChange = Tuple[str, str, Optional[str], str]
+
+
+def _bump_count(session: Session, model, keys: dict, delta: int) -> None:
+    """카운터 행(model, 기본키 keys)을 delta만큼 원자적으로 증감 (없으면 생성)"""
+    dialect = session.get_bind().dialect.name
+    values = {**keys, "count": max(delta, 0)}
+
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+
+        stmt = insert(model).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={"count": model.count + delta},
+        )
+        session.execute(stmt)
+        return
+    if dialect in ("mysql", "mariadb"):
+        from sqlalchemy.dialects.mysql import insert
+
+        stmt = insert(model).values(**values)
+        stmt = stmt.on_duplicate_key_update(count=model.count + delta)
+        session.execute(stmt)
+        return
+
+    result = session.execute(
+        update(model)
+        .where(*[getattr(model, name) == value for name, value in keys.items()])
+        .values(count=model.count + delta)
+    )
+    if result.rowcount == 0:
+        session.add(model(**values))
+
+
+def _bump_stat(session: Session, job_id: str, status: str, delta: int) -> None:
+    """(jobId, status) 카운터 증감"""
+    _bump_count(session, JobApplicationStat, {"jobId": job_id, "status": status}, delta)
+
+
+def _job_scopes(session: Session, job_ids: Iterable[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """공고 id -> (store_id, owner_user_id) - 쿼리 한 번"""
+    job_ids = list(set(job_ids))
+    if not job_ids:
+        return {}
+    rows = session.exec(select(Job.id, Job.store_id, Job.owner_user_id).where(Job.id.in_(job_ids))).all()
+    return {job_id: (store_id, owner_user_id) for job_id, store_id, owner_user_id in rows}
+
+
+def _bump_rollups(session: Session, deltas: Dict[Tuple[str, str], int]) -> None:
+    """(jobId, status) -> delta 를 공고/매장/고용주 카운터에 반영 (같은 키는 합쳐서 UPDATE 한 번)"""
+    scopes = _job_scopes(session, [job_id for job_id, _ in deltas])
+    merged: Counter = Counter()
+    for (job_id, status), delta in deltas.items():
+        if not delta:
+            continue
+        _bump_stat(session, job_id, status, delta)
+        store_id, owner_user_id = scopes.get(job_id, (None, None))
+        if store_id:
+            merged[("store", store_id, status)] += delta
+        if owner_user_id:
+            merged[("employer", owner_user_id, status)] += delta
+    for (scope, scope_id, status), delta in merged.items():
+        if delta:
+            _bump_count(
+                session, ApplicationStatusRollup, {"scope": scope, "scope_id": scope_id, "status": status}, delta
+            )
+
+
+def record_status_changes(session: Session, changes: Iterable[StatusChange]) -> int:
+    """상태 전환 여러 건의 카운터 이동 + 이벤트 INSERT (commit은 호출자가 수행)
+
+    Returns the number of transitions recorded (이전 상태와 같은 항목은 건너뜀).
+    """
+    deltas: Counter = Counter()
+    events = []
+    now = datetime.utcnow()
+    for application_id, job_id, old_status, new_status in changes:
+        if old_status == new_status:
+            continue
+        if old_status:
+            deltas[(job_id, old_status)] -= 1
+        deltas[(job_id, new_status)] += 1
+        events.append({
+            "id": f"ase-{uuid.uuid4().hex[:12]}",
+            "applicationId": application_id,
+            "jobId": job_id,
+            "from_status": old_status,
+            "to_status": new_status,
+            "created_at": now,
+        })
+    if events:
+        _bump_rollups(session, deltas)
+        session.execute(insert(ApplicationStatusEvent), events)
+    return len(events)
+
+
+def record_application_created(session: Session, application: Application) -> None:
+    """새 지원서(applied/invited) 생성 시 호출 - commit은 호출자가 수행"""
+    job_id = application.jobId
+    session.execute(
+        update(Job)
+        .where(Job.id == job_id)
+        .values(
+            applications=func.coalesce(Job.applications, 0) + 1,
+            trend_score=func.coalesce(Job.trend_score, 0.0) + trend_increment(APPLICATION_WEIGHT),
+        )
+    )
+    record_status_changes(session, [(application.applicationId, job_id, None, application.status)])
+
+
+def set_application_status(session: Session, application: Application, new_status: str) -> None:
+    """Application.status를 바꾸고 카운터를 함께 갱신 (같은 트랜잭션)"""
+    old_status = application.status
+    if old_status == new_status:
+        return
+    application.status = new_status
+    application.updatedAt = datetime.utcnow().isoformat()
+    # 카운터 UPDATE가 지원서를 먼저 flush하지 않도록 (요청당 version 조건 UPDATE 한 번)
+    with session.no_autoflush:
+        record_status_changes(session, [(application.applicationId, application.jobId, old_status, new_status)])
+
+
+def _bump_scope_rollups(session: Session, job_id: str, sign: int) -> None:
+    """공고의 상태별 카운터를 매장/고용주 카운터에서 빼거나(sign=-1) 더함(sign=1)"""
+    store_id, owner_user_id = _job_scopes(session, [job_id]).get(job_id, (None, None))
+    stats = session.exec(
+        select(JobApplicationStat.status, JobApplicationStat.count).where(JobApplicationStat.jobId == job_id)
+    ).all()
+    for status, count in stats:
+        for scope, scope_id in (("store", store_id), ("employer", owner_user_id)):
+            if scope_id and count:
+                _bump_count(
+                    session,
+                    ApplicationStatusRollup,
+                    {"scope": scope, "scope_id": scope_id, "status": status},
+                    sign * count,
+                )
+
+
+def delete_job_counters(session: Session, job_id: str) -> None:
+    """공고 삭제 시 상태별 카운터 행 제거 (매장/고용주 카운터에서도 차감, jobs 행이 남아 있을 때 호출)"""
+    _bump_scope_rollups(session, job_id, -1)
+    session.execute(delete(JobApplicationStat).where(JobApplicationStat.jobId == job_id))
+
+
+def recount_job(session: Session, job_id: str) -> None:
+    """공고 1건의 카운터를 applications 테이블로부터 다시 계산 (공고 복원 시, commit은 호출자가 수행)"""
+    session.execute(
+        update(Job)
+        .where(Job.id == job_id)
+        .values(
+            applications=select(func.count(Application.applicationId))
+            .where(Application.jobId == job_id)
+            .scalar_subquery()
+        )
+    )
+    delete_job_counters(session, job_id)
+    session.execute(
+        insert(JobApplicationStat).from_select(
+            ["jobId", "status", "count"],
+            select(Application.jobId, Application.status, func.count(Application.applicationId))
+            .where(Application.jobId == job_id)
+            .group_by(Application.jobId, Application.status),
+        )
+    )
+    _bump_scope_rollups(session, job_id, 1)
+
+
+def get_status_counts(session: Session, job_id: str) -> Dict[str, int]:
+    """공고의 상태별 지원자 수"""
+    rows = session.exec(
+        select(JobApplicationStat.status, JobApplicationStat.count).where(
+            JobApplicationStat.jobId == job_id
+        )
+    ).all()
+    return {status: count for status, count in rows if count}
+
+
+def reconcile_application_counts(session: Session) -> int:
+    """applications 테이블로부터 모든 카운터(매장/고용주 포함)를 다시 계산 (backfill/정합성 복구용)
+
+    Returns the number of jobs whose Job.applications value changed.
+    """
+    totals = dict(
+        session.exec(
+            select(Application.jobId, func.count(Application.applicationId)).group_by(
+                Application.jobId
+            )
+        ).all()
+    )
+    per_status = session.exec(
+        select(Application.jobId, Application.status, func.count(Application.applicationId))
+        .group_by(Application.jobId, Application.status)
+    ).all()
+
+    changed = 0
+    for job_id, current in session.exec(select(Job.id, Job.applications)).all():
+        expected = totals.get(job_id, 0)
+        if current != expected:
+            session.execute(update(Job).where(Job.id == job_id).values(applications=expected))
+            changed += 1
+
+    session.execute(delete(JobApplicationStat))
+    for job_id, status, count in per_status:
+        session.add(JobApplicationStat(jobId=job_id, status=status, count=count))
+
+    rebuild_status_rollups(session)
+
+    session.commit()
+    return changed
+
+
+def rebuild_status_rollups(session: Session) -> None:
+    """매장/고용주 카운터를 applications + jobs로부터 다시 계산 (scope별 INSERT ... SELECT GROUP BY, commit은 호출자가 수행)"""
+    session.execute(delete(ApplicationStatusRollup))
+    for scope, column in (("store", Job.store_id), ("employer", Job.owner_user_id)):
+        session.execute(
+            insert(ApplicationStatusRollup).from_select(
+                ["scope", "scope_id", "status", "count"],
+                select(literal(scope), column, Application.status, func.count(Application.applicationId))
+                .join(Job, Job.id == Application.jobId)
+                .where(column.is_not(None))
+                .group_by(column, Application.status),
+            )
+        )
+
+
+def ensure_application_counts(engine) -> None:
+    """시작 시 공고별 카운터(job_application_stats)가 비어 있고 지원서가 있으면(테이블 추가 이전 데이터)
+    Job.applications/job_application_stats/매장·고용주 카운터를 applications로부터 다시 계산"""
+    with Session(engine) as session:
+        if session.exec(select(JobApplicationStat.jobId).limit(1)).first():
+            return
+        if not session.exec(select(Application.applicationId).limit(1)).first():
+            return
+        changed = reconcile_application_counts(session)
+    print(f"Application counters created ({changed} jobs corrected)")
+
+
+def ensure_status_rollups(engine) -> None:
+    """시작 시 매장/고용주 카운터가 비어 있고 지원서가 있으면(테이블 추가 이전 데이터) 채움"""
+    with Session(engine) as session:
+        if session.exec(select(ApplicationStatusRollup.scope).limit(1)).first():
+            return
+        if not session.exec(select(Application.applicationId).limit(1)).first():
+            return
+        rebuild_status_rollups(session)
+        session.commit()
+    print("Application status rollups created")
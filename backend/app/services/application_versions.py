@@ -0,0 +1,60 @@
+"""
+Optimistic concurrency for applications (applications.version)
+
+고용주와 구직자가 같은 지원서 행(면접 제안, 합격 안내, 출근 확정, 상태 변경)을
+읽고 → JSON을 고쳐 → 행 전체를 다시 쓰므로, 동시에 들어온 요청은 서로의 변경을
+덮어썼습니다. Application은 SQLAlchemy version_id_col로 매핑되어 있어 ORM UPDATE가
+항상 WHERE version = :읽은 값 조건으로 실행되고 version이 1 증가합니다.
+
+- 다른 요청이 먼저 바꿨으면 UPDATE가 0행 → StaleDataError → 409 (main.py 예외 처리기)
+- 클라이언트가 마지막으로 본 version을 보내면 쓰기 전에 비교해 바로 409
+- 409 응답에는 최신 version이 들어 있으므로 다시 불러온 뒤 재시도하면 됨
+- 조율 메시지 추가처럼 행을 덮어쓰지 않는 쓰기는 version을 올리지 않음
+"""
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import update
+from sqlmodel import Session, select
+
+from app.models import Application, applications_archive
+
+CONFLICT_MESSAGE = "다른 사용자가 먼저 지원서를 변경했습니다. 최신 내용을 다시 불러온 뒤 시도해 주세요."
+
+
+def conflict_detail(application_id: Optional[str] = None, current_version: Optional[int] = None) -> dict:
+    return {
+        "message": CONFLICT_MESSAGE,
+        "applicationId": application_id,
+        "currentVersion": current_version,
+        "retryable": True,
+    }
+
+
+def check_application_version(application: Application, expected: Optional[int]) -> None:
+    """클라이언트가 보낸 version(expected)이 현재 값과 다르면 409 (None이면 생략)"""
+    if expected is not None and expected != application.version:
+        raise HTTPException(
+            status_code=409,
+            detail=conflict_detail(application.applicationId, application.version),
+        )
+
+
+def current_version(session: Session, application_id: str) -> Optional[int]:
+    return session.exec(select(Application.version).where(Application.applicationId == application_id)).first()
+
+
+def ensure_application_versions(engine) -> None:
+    """시작 시 version이 비어 있는 지원서(컬럼 추가 이전 데이터)를 1로 채움
+
+    version이 NULL이면 WHERE version = NULL 조건이 항상 실패하므로 필요합니다.
+    """
+    with Session(engine) as session:
+        count = 0
+        for table in (Application.__table__, applications_archive):
+            count += session.execute(
+                update(table).where(table.c.version.is_(None)).values(version=1)
+            ).rowcount
+        session.commit()
+    if count:
+        print(f"Application versions filled ({count} applications)")
@@ -0,0 +1,172 @@
+"""
+Coordination messages (coordination_messages 테이블)
+
+면접/출근 날짜 조율 메시지는 applications.coordinationMessages JSON 배열에 저장되어
+메시지 하나를 추가할 때마다 배열 전체를 읽고 다시 써야 했고(O(n)), 동시에 쓰는
+요청끼리 서로의 메시지를 덮어썼습니다. 메시지를 (applicationId, sentAt) 인덱스가 있는
+append-only 테이블의 행으로 저장해 추가는 INSERT 한 번으로 처리합니다.
+
+기존 배열은 지연 이전합니다.
+- 메시지 추가/페이지 조회 시 해당 지원서의 배열을 행으로 옮기고 컬럼을 NULL로 비움
+  (배열이 읽은 값 그대로일 때만 비우는 조건부 UPDATE - 동시에 이전해도 한 번만 INSERT)
+- 지원서 목록(GET /applications)은 쓰지 않고 남은 배열과 행을 합쳐서 응답
+- 한 번에 옮기려면 scripts/backfill.py coordination-messages
+배열 항목의 id는 (applicationId, 배열 위치)로 정해지므로 이전 전후 응답의 id가 같습니다.
+"""
+import hashlib
+import json
+import uuid
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import insert, update
+from sqlmodel import Session, select
+
+from app.models import Application, CoordinationMessage
+
+_BATCH_SIZE = 500
+
+
+def message_values(
+    application_id: str,
+    message: str,
+    sender: str,
+    type: Optional[str] = None,
+    sent_at: Optional[str] = None,
+    message_id: Optional[str] = None,
+) -> dict:
+    return {
+        "id": message_id or f"cmsg-{uuid.uuid4().hex[:12]}",
+        "applicationId": application_id,
+        "message": message,
+        "sender": sender,
+        "type": type,
+        "sentAt": sent_at or datetime.utcnow().isoformat(),
+    }
+
+
+def message_to_dict(row) -> dict:
+    """기존 JSON 배열 항목과 같은 형식 ({message, sentAt, from, type})"""
+    values = row if isinstance(row, dict) else row.dict()
+    return {
+        "id": values["id"],
+        "message": values["message"],
+        "sentAt": values["sentAt"],
+        "from": values["sender"],
+        "type": values["type"],
+    }
+
+
+def _blob_entries(blob: Optional[str]) -> List[dict]:
+    if not blob:
+        return []
+    try:
+        entries = json.loads(blob)
+    except (TypeError, ValueError):
+        return []
+    return [entry for entry in entries if isinstance(entry, dict)] if isinstance(entries, list) else []
+
+
+def legacy_message_id(application_id: str, index: int) -> str:
+    """배열 항목의 고정 id - 조회할 때마다 같고, 행으로 이전해도 그대로 유지"""
+    return "cmsg-" + hashlib.sha1(f"{application_id}:{index}".encode()).hexdigest()[:12]
+
+
+def _blob_values(application_id: str, blob: Optional[str]) -> List[dict]:
+    return [
+        message_values(
+            application_id,
+            str(entry.get("message") or ""),
+            entry.get("from") or "jobseeker",
+            entry.get("type"),
+            entry.get("sentAt"),
+            message_id=legacy_message_id(application_id, index),
+        )
+        for index, entry in enumerate(_blob_entries(blob))
+    ]
+
+
+def migrate_coordination_blob(session: Session, application: Application) -> int:
+    """지원서의 coordinationMessages 배열을 행으로 옮김 (commit은 호출자가 수행)"""
+    blob = application.coordinationMessages
+    if blob is None:
+        return 0
+    result = session.execute(
+        update(Application)
+        .where(Application.applicationId == application.applicationId, Application.coordinationMessages == blob)
+        .values(coordinationMessages=None)
+    )
+    if result.rowcount != 1:
+        return 0  # 다른 요청이 먼저 이전함
+    rows = _blob_values(application.applicationId, blob)
+    if rows:
+        session.execute(insert(CoordinationMessage), rows)
+    return len(rows)
+
+
+def append_coordination_message(
+    session: Session,
+    application: Application,
+    message: str,
+    sender: str,
+    type: Optional[str] = None,
+) -> dict:
+    """메시지 1건 추가 - INSERT 한 번 (commit은 호출자가 수행)"""
+    migrate_coordination_blob(session, application)
+    values = message_values(application.applicationId, message, sender, type)
+    session.execute(insert(CoordinationMessage).values(**values))
+    return message_to_dict(values)
+
+
+def list_coordination_messages(session: Session, application_id: str) -> List[dict]:
+    """지원서의 전체 메시지 (오래된 순)"""
+    rows = session.exec(
+        select(CoordinationMessage)
+        .where(CoordinationMessage.applicationId == application_id)
+        .order_by(CoordinationMessage.sentAt, CoordinationMessage.id)
+    ).all()
+    return [message_to_dict(row) for row in rows]
+
+
+def coordination_messages_by_application(
+    session: Session, applications: Iterable[Application]
+) -> Dict[str, List[dict]]:
+    """지원서 목록 페이지의 메시지를 쿼리 한 번으로 (아직 이전되지 않은 배열은 합쳐서, 오래된 순)"""
+    applications = list(applications)
+    by_application: Dict[str, List[dict]] = {
+        application.applicationId: [
+            message_to_dict(values)
+            for values in _blob_values(application.applicationId, application.coordinationMessages)
+        ]
+        for application in applications
+    }
+    if by_application:
+        rows = session.exec(
+            select(CoordinationMessage)
+            .where(CoordinationMessage.applicationId.in_(list(by_application)))
+            .order_by(CoordinationMessage.sentAt, CoordinationMessage.id)
+        ).all()
+        for row in rows:
+            by_application[row.applicationId].append(message_to_dict(row))
+    for messages in by_application.values():
+        messages.sort(key=lambda message: message["sentAt"] or "")
+    return by_application
+
+
+def migrate_coordination_blobs(session: Session) -> int:
+    """남아 있는 배열 전체를 행으로 이전 (backfill용, _BATCH_SIZE건마다 commit)"""
+    count = 0
+    last_id = ""
+    while True:
+        applications = session.exec(
+            select(Application)
+            .where(Application.coordinationMessages.is_not(None), Application.applicationId > last_id)
+            .order_by(Application.applicationId)
+            .limit(_BATCH_SIZE)
+        ).all()
+        if not applications:
+            return count
+        last_id = applications[-1].applicationId
+        for application in applications:
+            count += migrate_coordination_blob(session, application)
+        session.commit()
@@ -0,0 +1,187 @@
+"""
+Employer recruitment dashboard (GET /employer/{user_id}/dashboard)
+
+고용주 화면은 /applications?userId=로 모든 지원자(구직자 정보 포함)를 받아 상태별 개수를
+클라이언트에서 셌습니다. 대시보드는 지원자 수와 무관한 고정 개수의 쿼리로 계산합니다.
+- 상태별/매장별: application_status_rollups (application_counters)
+- 공고별: job_application_stats + jobs.owner_user_id
+- 오늘 면접: interviewData에 오늘 날짜가 들어 있는 지원서만 조회 후 selectedDates 확인
+- 새 지원자: appliedAt이 오늘인 지원서 수와 최근 RECENT_APPLICANTS건
+결과는 (user_id, 날짜)별로 EMPLOYER_DASHBOARD_TTL_SECONDS(기본 60초) 동안 캐시하고,
+지원서 쓰기 후 invalidate_dashboards_for_jobs로 해당 고용주 항목만 무효화합니다.
+"""
+import json
+import os
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from app.models import (
+    Application,
+    ApplicationStatusRollup,
+    Job,
+    JobApplicationStat,
+    JobSeeker,
+    SignupUser,
+    Store,
+)
+from app.services.ttl_cache import TTLCache
+
+DASHBOARD_TTL_SECONDS = float(os.getenv("EMPLOYER_DASHBOARD_TTL_SECONDS", "60"))
+RECENT_APPLICANTS = 5
+
+dashboard_cache = TTLCache(DASHBOARD_TTL_SECONDS)
+
+
+def invalidate_dashboards(user_ids: Iterable[Optional[str]]) -> None:
+    user_ids = {user_id for user_id in user_ids if user_id}
+    if user_ids:
+        dashboard_cache.invalidate(lambda key: key[0] in user_ids)
+
+
+def invalidate_dashboards_for_jobs(session: Session, job_ids: Iterable[str]) -> None:
+    """지원서 쓰기(commit 이후) 후 호출 - 공고 소유 고용주의 대시보드 캐시 무효화"""
+    job_ids = list(set(job_ids))
+    if job_ids:
+        invalidate_dashboards(session.exec(select(Job.owner_user_id).where(Job.id.in_(job_ids))).all())
+
+
+def _status_counts(rows) -> Dict[str, int]:
+    return {status: count for status, count in rows if count}
+
+
+def _interview_time(interview: dict, day: str) -> Optional[str]:
+    """면접 제안 모달 형식: allDatesSame이면 allDatesTimeSlots, 아니면 dateSpecificTimes[day], 없으면 time"""
+    if interview.get("allDatesSame", True):
+        slots = interview.get("allDatesTimeSlots") or []
+    else:
+        slots = (interview.get("dateSpecificTimes") or {}).get(day) or []
+    if slots and isinstance(slots[0], dict) and slots[0].get("time"):
+        return slots[0]["time"]
+    return interview.get("time")
+
+
+def _today_interviews(session: Session, user_id: str, day: str) -> List[dict]:
+    rows = session.exec(
+        select(Application, Job.title, JobSeeker.name, SignupUser.name)
+        .join(Job, Job.id == Application.jobId)
+        .outerjoin(JobSeeker, JobSeeker.id == Application.seekerId)
+        .outerjoin(SignupUser, SignupUser.id == Application.seekerId)
+        .where(
+            Job.owner_user_id == user_id,
+            Application.status.not_in(["rejected", "hired"]),
+            Application.interviewData.contains(f'"{day}"'),
+        )
+    ).all()
+    interviews = []
+    for application, title, seeker_name, user_name in rows:
+        try:
+            interview = json.loads(application.interviewData)
+        except (TypeError, ValueError):
+            continue
+        if not isinstance(interview, dict) or day not in (interview.get("selectedDates") or []):
+            continue
+        interviews.append({
+            "applicationId": application.applicationId,
+            "seekerId": application.seekerId,
+            "seekerName": seeker_name or user_name,
+            "jobId": application.jobId,
+            "jobTitle": title,
+            "time": _interview_time(interview, day),
+            "isConfirmed": bool(interview.get("isConfirmed")),
+        })
+    interviews.sort(key=lambda item: item["time"] or "")
+    return interviews
+
+
+def _new_applicants(session: Session, user_id: str, day: str) -> dict:
+    next_day = (date.fromisoformat(day) + timedelta(days=1)).isoformat()
+    applied_today = (
+        Job.owner_user_id == user_id,
+        Application.appliedAt >= day,
+        Application.appliedAt < next_day,
+    )
+    count = session.exec(
+        select(func.count()).select_from(Application).join(Job, Job.id == Application.jobId).where(*applied_today)
+    ).one()
+    recent = session.exec(
+        select(Application, Job.title, JobSeeker.name, SignupUser.name)
+        .join(Job, Job.id == Application.jobId)
+        .outerjoin(JobSeeker, JobSeeker.id == Application.seekerId)
+        .outerjoin(SignupUser, SignupUser.id == Application.seekerId)
+        .where(*applied_today)
+        .order_by(Application.appliedAt.desc(), Application.applicationId.desc())
+        .limit(RECENT_APPLICANTS)
+    ).all()
+    return {
+        "count": count,
+        "recent": [
+            {
+                "applicationId": application.applicationId,
+                "seekerId": application.seekerId,
+                "seekerName": seeker_name or user_name,
+                "jobId": application.jobId,
+                "jobTitle": title,
+                "status": application.status,
+                "appliedAt": application.appliedAt,
+            }
+            for application, title, seeker_name, user_name in recent
+        ],
+    }
+
+
+def compute_dashboard(session: Session, user_id: str, day: str) -> dict:
+    by_status = _status_counts(session.exec(
+        select(ApplicationStatusRollup.status, ApplicationStatusRollup.count).where(
+            ApplicationStatusRollup.scope == "employer", ApplicationStatusRollup.scope_id == user_id
+        )
+    ).all())
+
+    stores: Dict[str, dict] = {
+        store_id: {"storeId": store_id, "storeName": store_name, "total": 0, "byStatus": {}}
+        for store_id, store_name in session.exec(
+            select(Store.id, Store.store_name)
+            .where(Store.user_id == user_id)
+            .order_by(Store.is_main.desc(), Store.created_at)
+        ).all()
+    }
+    if stores:
+        for store_id, status, count in session.exec(
+            select(ApplicationStatusRollup.scope_id, ApplicationStatusRollup.status, ApplicationStatusRollup.count)
+            .where(ApplicationStatusRollup.scope == "store", ApplicationStatusRollup.scope_id.in_(list(stores)))
+        ).all():
+            if count:
+                stores[store_id]["byStatus"][status] = count
+                stores[store_id]["total"] += count
+
+    jobs: Dict[str, dict] = {}
+    for job_id, title, job_status, store_id, status, count in session.exec(
+        select(Job.id, Job.title, Job.status, Job.store_id, JobApplicationStat.status, JobApplicationStat.count)
+        .outerjoin(JobApplicationStat, JobApplicationStat.jobId == Job.id)
+        .where(Job.owner_user_id == user_id)
+        .order_by(Job.postedAt.desc(), Job.id.desc())
+    ).all():
+        job = jobs.setdefault(job_id, {
+            "jobId": job_id, "title": title, "status": job_status, "storeId": store_id, "total": 0, "byStatus": {},
+        })
+        if status and count:
+            job["byStatus"][status] = count
+            job["total"] += count
+
+    return {
+        "userId": user_id,
+        "date": day,
+        "total": sum(by_status.values()),
+        "byStatus": by_status,
+        "byStore": list(stores.values()),
+        "byJob": list(jobs.values()),
+        "todayInterviews": _today_interviews(session, user_id, day),
+        "newApplicants": _new_applicants(session, user_id, day),
+        "generatedAt": datetime.utcnow().isoformat(),
+    }
+
+
+def get_dashboard(session: Session, user_id: str, day: str) -> dict:
+    return dashboard_cache.get_or_compute((user_id, day), lambda: compute_dashboard(session, user_id, day))
@@ -0,0 +1,196 @@
+"""
+Geospatial helpers for job radius search
+
+- 오프라인 지오코딩: 주소의 '시/도 + 시/군/구'를 내장 중심 좌표 테이블로 변환 (외부 API 호출 없음)
+- 격자 인덱스: 위경도를 GRID_DEGREES 크기의 셀로 나눈 geo_cell 문자열 (인덱스 컬럼)
+- 반경 검색: 반경을 덮는 셀 목록 + bounding box로 인덱스 범위를 좁히고, 거리 판정/가까운 순 정렬은
+  SQL의 등장방형 근사 거리(planar_distance_sq, 삼각함수 없음)로 처리해 LIMIT까지 DB에서 적용
+"""
+import math
+from typing import List, Optional, Tuple
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.radians(1.0) * EARTH_RADIUS_KM
+
+# 격자 셀 크기 (위도 0.05도 ≈ 5.6km)
+GRID_DEGREES = 0.05
+
+MAX_RADIUS_KM = 50.0
+
+# 시/도 표기 정규화 ('서울특별시' -> '서울')
+_PROVINCE_ALIASES = {
+    "서울특별시": "서울", "서울시": "서울",
+    "부산광역시": "부산", "부산시": "부산",
+    "인천광역시": "인천", "인천시": "인천",
+    "대구광역시": "대구", "대구시": "대구",
+    "광주광역시": "광주",
+    "대전광역시": "대전", "대전시": "대전",
+    "울산광역시": "울산", "울산시": "울산",
+    "세종특별자치시": "세종", "세종시": "세종",
+    "경기도": "경기",
+    "강원도": "강원", "강원특별자치도": "강원",
+    "충청북도": "충북", "충청남도": "충남",
+    "전라북도": "전북", "전북특별자치도": "전북", "전라남도": "전남",
+    "경상북도": "경북", "경상남도": "경남",
+    "제주특별자치도": "제주", "제주도": "제주",
+}
+
+# 시/도 중심 좌표
+PROVINCE_CENTROIDS = {
+    "서울": (37.5665, 126.9780), "부산": (35.1796, 129.0756), "인천": (37.4563, 126.7052),
+    "대구": (35.8714, 128.6014), "광주": (35.1595, 126.8526), "대전": (36.3504, 127.3845),
+    "울산": (35.5384, 129.3114), "세종": (36.4800, 127.2890), "경기": (37.4138, 127.5183),
+    "강원": (37.8228, 128.1555), "충북": (36.6357, 127.4917), "충남": (36.5184, 126.8000),
+    "전북": (35.7175, 127.1530), "전남": (34.8679, 126.9910), "경북": (36.4919, 128.8889),
+    "경남": (35.4606, 128.2132), "제주": (33.4996, 126.5312),
+}
+
+# (시/도, 시/군/구) 중심 좌표
+DISTRICT_CENTROIDS = {
+    ("서울", "종로구"): (37.5730, 126.9794), ("서울", "중구"): (37.5641, 126.9979),
+    ("서울", "용산구"): (37.5326, 126.9905), ("서울", "성동구"): (37.5634, 127.0369),
+    ("서울", "광진구"): (37.5385, 127.0823), ("서울", "동대문구"): (37.5744, 127.0396),
+    ("서울", "중랑구"): (37.6063, 127.0925), ("서울", "성북구"): (37.5894, 127.0167),
+    ("서울", "강북구"): (37.6396, 127.0257), ("서울", "도봉구"): (37.6688, 127.0471),
+    ("서울", "노원구"): (37.6542, 127.0568), ("서울", "은평구"): (37.6027, 126.9291),
+    ("서울", "서대문구"): (37.5791, 126.9368), ("서울", "마포구"): (37.5663, 126.9019),
+    ("서울", "양천구"): (37.5170, 126.8665), ("서울", "강서구"): (37.5509, 126.8495),
+    ("서울", "구로구"): (37.4954, 126.8874), ("서울", "금천구"): (37.4569, 126.8955),
+    ("서울", "영등포구"): (37.5264, 126.8962), ("서울", "동작구"): (37.5124, 126.9393),
+    ("서울", "관악구"): (37.4784, 126.9516), ("서울", "서초구"): (37.4837, 127.0324),
+    ("서울", "강남구"): (37.5172, 127.0473), ("서울", "송파구"): (37.5145, 127.1059),
+    ("서울", "강동구"): (37.5301, 127.1238),
+    ("부산", "중구"): (35.1064, 129.0324), ("부산", "서구"): (35.0979, 129.0243),
+    ("부산", "동구"): (35.1292, 129.0454), ("부산", "영도구"): (35.0911, 129.0679),
+    ("부산", "부산진구"): (35.1630, 129.0532), ("부산", "동래구"): (35.2049, 129.0837),
+    ("부산", "남구"): (35.1366, 129.0843), ("부산", "북구"): (35.1972, 128.9903),
+    ("부산", "해운대구"): (35.1631, 129.1635), ("부산", "사하구"): (35.1046, 128.9749),
+    ("부산", "금정구"): (35.2431, 129.0921), ("부산", "강서구"): (35.2122, 128.9807),
+    ("부산", "연제구"): (35.1762, 129.0799), ("부산", "수영구"): (35.1455, 129.1131),
+    ("부산", "사상구"): (35.1527, 128.9910), ("부산", "기장군"): (35.2446, 129.2222),
+    ("인천", "중구"): (37.4738, 126.6216), ("인천", "동구"): (37.4739, 126.6432),
+    ("인천", "미추홀구"): (37.4635, 126.6505), ("인천", "연수구"): (37.4101, 126.6783),
+    ("인천", "남동구"): (37.4473, 126.7314), ("인천", "부평구"): (37.5070, 126.7219),
+    ("인천", "계양구"): (37.5372, 126.7376), ("인천", "서구"): (37.5454, 126.6759),
+    ("대구", "중구"): (35.8693, 128.6062), ("대구", "동구"): (35.8866, 128.6356),
+    ("대구", "서구"): (35.8718, 128.5591), ("대구", "남구"): (35.8460, 128.5974),
+    ("대구", "북구"): (35.8858, 128.5828), ("대구", "수성구"): (35.8582, 128.6306),
+    ("대구", "달서구"): (35.8299, 128.5326), ("대구", "달성군"): (35.7746, 128.4314),
+    ("광주", "동구"): (35.1460, 126.9232), ("광주", "서구"): (35.1519, 126.8902),
+    ("광주", "남구"): (35.1329, 126.9026), ("광주", "북구"): (35.1740, 126.9120),
+    ("광주", "광산구"): (35.1395, 126.7937),
+    ("대전", "동구"): (36.3120, 127.4548), ("대전", "중구"): (36.3255, 127.4213),
+    ("대전", "서구"): (36.3554, 127.3838), ("대전", "유성구"): (36.3623, 127.3562),
+    ("대전", "대덕구"): (36.3467, 127.4156),
+    ("울산", "중구"): (35.5694, 129.3326), ("울산", "남구"): (35.5438, 129.3301),
+    ("울산", "동구"): (35.5049, 129.4166), ("울산", "북구"): (35.5827, 129.3613),
+    ("울산", "울주군"): (35.5623, 129.1428),
+    ("경기", "수원시"): (37.2636, 127.0286), ("경기", "성남시"): (37.4200, 127.1267),
+    ("경기", "고양시"): (37.6584, 126.8320), ("경기", "용인시"): (37.2411, 127.1776),
+    ("경기", "부천시"): (37.5034, 126.7660), ("경기", "안산시"): (37.3219, 126.8309),
+    ("경기", "안양시"): (37.3943, 126.9568), ("경기", "남양주시"): (37.6360, 127.2165),
+    ("경기", "화성시"): (37.1995, 126.8312), ("경기", "평택시"): (36.9921, 127.1129),
+    ("경기", "의정부시"): (37.7381, 127.0337), ("경기", "시흥시"): (37.3800, 126.8029),
+    ("경기", "파주시"): (37.7599, 126.7799), ("경기", "김포시"): (37.6153, 126.7156),
+    ("경기", "광명시"): (37.4786, 126.8646), ("경기", "광주시"): (37.4294, 127.2550),
+    ("경기", "군포시"): (37.3616, 126.9352), ("경기", "하남시"): (37.5393, 127.2149),
+    ("경기", "오산시"): (37.1499, 127.0774), ("경기", "이천시"): (37.2720, 127.4350),
+    ("경기", "구리시"): (37.5943, 127.1296), ("경기", "안성시"): (37.0080, 127.2797),
+    ("경기", "의왕시"): (37.3448, 126.9683), ("경기", "양주시"): (37.7853, 127.0458),
+    ("경기", "포천시"): (37.8949, 127.2002),
+    ("강원", "춘천시"): (37.8813, 127.7298), ("강원", "원주시"): (37.3422, 127.9202),
+    ("강원", "강릉시"): (37.7519, 128.8761),
+    ("충북", "청주시"): (36.6424, 127.4890), ("충남", "천안시"): (36.8151, 127.1139),
+    ("충남", "아산시"): (36.7898, 127.0018), ("전북", "전주시"): (35.8242, 127.1480),
+    ("전남", "여수시"): (34.7604, 127.6622), ("전남", "순천시"): (34.9507, 127.4872),
+    ("전남", "목포시"): (34.8118, 126.3922), ("경북", "포항시"): (36.0190, 129.3435),
+    ("경북", "구미시"): (36.1195, 128.3446), ("경남", "창원시"): (35.2279, 128.6811),
+    ("경남", "김해시"): (35.2285, 128.8894), ("제주", "제주시"): (33.4996, 126.5312),
+    ("제주", "서귀포시"): (33.2541, 126.5601),
+}
+
+
+def province_of(address: Optional[str]) -> Optional[str]:
+    """주소의 시/도를 정규화된 이름으로 ('서울특별시 강남구 ...' -> '서울')"""
+    if not address or not address.split():
+        return None
+    first = address.split()[0]
+    return _PROVINCE_ALIASES.get(first, first)
+
+
+def geocode_address(*addresses: Optional[str]) -> Optional[Tuple[float, float]]:
+    """주소(들)를 내장 테이블로 지오코딩 - 처음으로 좌표를 찾은 주소의 결과를 반환
+
+    '서울 강남구 역삼동 1' -> 강남구 중심, '서울특별시' -> 서울 중심, 매칭 실패 시 None
+    """
+    for address in addresses:
+        if not address:
+            continue
+        parts = address.split()
+        if not parts:
+            continue
+        province = _PROVINCE_ALIASES.get(parts[0], parts[0])
+        if len(parts) >= 2 and (province, parts[1]) in DISTRICT_CENTROIDS:
+            return DISTRICT_CENTROIDS[(province, parts[1])]
+        if province in PROVINCE_CENTROIDS:
+            return PROVINCE_CENTROIDS[province]
+    return None
+
+
+def grid_cell(lat: float, lng: float) -> str:
+    """위경도가 속한 격자 셀 키 ('row:col')"""
+    return f"{math.floor(lat / GRID_DEGREES)}:{math.floor(lng / GRID_DEGREES)}"
+
+
+def bounding_box(lat: float, lng: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """(min_lat, max_lat, min_lng, max_lng) of the box enclosing the radius."""
+    dlat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    cos_lat = max(math.cos(math.radians(lat)), 1e-6)
+    dlng = math.degrees(radius_km / (EARTH_RADIUS_KM * cos_lat))
+    return lat - dlat, lat + dlat, lng - dlng, lng + dlng
+
+
+def covering_cells(lat: float, lng: float, radius_km: float) -> List[str]:
+    """반경을 덮는 격자 셀 키 목록 (후보 필터용)"""
+    min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+    rows = range(math.floor(min_lat / GRID_DEGREES), math.floor(max_lat / GRID_DEGREES) + 1)
+    cols = range(math.floor(min_lng / GRID_DEGREES), math.floor(max_lng / GRID_DEGREES) + 1)
+    return [f"{row}:{col}" for row in rows for col in cols]
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이의 대권 거리 (km)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def parse_point(value: str) -> Tuple[float, float]:
+    """'lat,lng' 문자열을 좌표로 변환 (범위를 벗어나면 ValueError)"""
+    lat_str, lng_str = value.split(",")
+    lat, lng = float(lat_str), float(lng_str)
+    if not (-90.0 <= lat <= 90.0 and -180.0 <= lng <= 180.0):
+        raise ValueError("coordinates out of range")
+    return lat, lng
+
+
+def planar_distance_sq(lat_column, lng_column, lat: float, lng: float):
+    """SQL expression: squared distance (km²) from (lat, lng), equirectangular approximation.
+
+    경도 축척(cos(lat))은 중심점 기준 상수로 미리 계산하므로 DB에 삼각함수가 필요 없습니다.
+    MAX_RADIUS_KM 이내(한국 위도)에서는 haversine과의 차이가 0.2% 미만입니다.
+    """
+    dx = (lng_column - lng) * (KM_PER_DEGREE * math.cos(math.radians(lat)))
+    dy = (lat_column - lat) * KM_PER_DEGREE
+    return dx * dx + dy * dy
+
+
+def set_job_coordinates(job, point: Optional[Tuple[float, float]]) -> None:
+    """Job의 위경도와 geo_cell을 함께 갱신"""
+    if point is None:
+        job.latitude = job.longitude = job.geo_cell = None
+        return
+    job.latitude, job.longitude = point
+    job.geo_cell = grid_cell(*point)
@@ -0,0 +1,134 @@
+"""
+Job archive (jobs_archive / applications_archive)
+
+공고 삭제 시 공고와 지원서를 ORM으로 한 건씩 DELETE하는 대신, 같은 트랜잭션에서
+- INSERT INTO jobs_archive / applications_archive ... SELECT (집합 단위 복사)
+- DELETE FROM applications WHERE jobId = ? / DELETE FROM jobs WHERE id = ? (한 번씩)
+로 보관 테이블에 옮깁니다. 지원자가 많은 공고도 문장 수가 일정합니다.
+
+- 복원: 보관 테이블에서 다시 INSERT ... SELECT 후 카운터/카드/검색 인덱스 재생성
+- purge: 보관 기간(JOB_ARCHIVE_RETENTION_DAYS, 기본 365일)이 지난 보관 행 삭제
+  (lifespan에서 하루 한 번, 0이면 비활성)
+  조율 메시지/상태 이력은 복원에 대비해 보관 중에는 그대로 두고 purge 때 함께 삭제
+"""
+import asyncio
+import os
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from sqlalchemy import delete, func, insert, literal
+from sqlmodel import Session, select
+
+from app.models import (
+    Application,
+    ApplicationStatusEvent,
+    CoordinationMessage,
+    Job,
+    applications_archive,
+    jobs_archive,
+)
+from app.services.application_counters import delete_job_counters, recount_job
+from app.services.job_cards import refresh_job_card, remove_job_card
+from app.services.job_search import index_job, remove_job as remove_from_search_index
+
+RETENTION_DAYS = int(os.getenv("JOB_ARCHIVE_RETENTION_DAYS", "365"))
+PURGE_INTERVAL_SECONDS = float(os.getenv("JOB_ARCHIVE_PURGE_SECONDS", str(24 * 60 * 60)))
+
+
+def _archive_rows(session: Session, table, archive, where, archived_at: datetime) -> int:
+    """INSERT INTO archive (..., archived_at) SELECT ..., :archived_at FROM table WHERE ..."""
+    columns = list(table.c.keys())
+    selected = select(*table.c, literal(archived_at, type_=archive.c.archived_at.type)).where(where)
+    return session.execute(insert(archive).from_select(columns + ["archived_at"], selected)).rowcount
+
+
+def _restore_rows(session: Session, table, archive, where) -> int:
+    """INSERT INTO table SELECT (table 컬럼) FROM archive WHERE ..."""
+    columns = list(table.c.keys())
+    selected = select(*[archive.c[name] for name in columns]).where(where)
+    return session.execute(insert(table).from_select(columns, selected)).rowcount
+
+
+def archive_job(session: Session, job_id: str) -> int:
+    """공고와 지원서를 보관 테이블로 이동하고 보관한 지원서 수 반환 (commit은 호출자가 수행)"""
+    jobs, applications = Job.__table__, Application.__table__
+    now = datetime.utcnow()
+    # 복원 후 다시 삭제하는 경우를 대비해 이전 보관 행 정리
+    session.execute(delete(applications_archive).where(applications_archive.c.jobId == job_id))
+    session.execute(delete(jobs_archive).where(jobs_archive.c.id == job_id))
+
+    _archive_rows(session, jobs, jobs_archive, jobs.c.id == job_id, now)
+    archived = _archive_rows(session, applications, applications_archive, applications.c.jobId == job_id, now)
+    session.execute(delete(Application).where(Application.jobId == job_id))
+    delete_job_counters(session, job_id)
+    remove_from_search_index(session, job_id)
+    remove_job_card(session, job_id)
+    session.execute(delete(Job).where(Job.id == job_id))
+    return archived
+
+
+def restore_job(session: Session, job_id: str) -> Tuple[Optional[Job], int]:
+    """보관된 공고와 지원서를 되돌리고 (공고, 복원한 지원서 수) 반환. 보관된 공고가 없으면 (None, 0)
+
+    같은 id의 공고가 jobs에 없어야 합니다. (commit은 호출자가 수행)
+    """
+    if not _restore_rows(session, Job.__table__, jobs_archive, jobs_archive.c.id == job_id):
+        return None, 0
+    applications = _restore_rows(
+        session, Application.__table__, applications_archive, applications_archive.c.jobId == job_id
+    )
+    session.execute(delete(applications_archive).where(applications_archive.c.jobId == job_id))
+    session.execute(delete(jobs_archive).where(jobs_archive.c.id == job_id))
+
+    recount_job(session, job_id)
+    job = session.get(Job, job_id)
+    index_job(session, job)
+    refresh_job_card(session, job_id)
+    return job, applications
+
+
+def purge_archive(session: Session, retention_days: int = RETENTION_DAYS) -> Tuple[int, int]:
+    """보관 기간이 지난 보관 공고/지원서(조율 메시지, 상태 이력 포함) 삭제 후 (공고 수, 지원서 수) 반환"""
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    expired_ids = select(jobs_archive.c.id).where(jobs_archive.c.archived_at < cutoff)
+    expired_application_ids = select(applications_archive.c.applicationId).where(
+        applications_archive.c.jobId.in_(expired_ids)
+    )
+    session.execute(
+        delete(CoordinationMessage).where(CoordinationMessage.applicationId.in_(expired_application_ids))
+    )
+    session.execute(delete(ApplicationStatusEvent).where(ApplicationStatusEvent.jobId.in_(expired_ids)))
+    applications = session.execute(
+        delete(applications_archive).where(applications_archive.c.jobId.in_(expired_ids))
+    ).rowcount
+    jobs = session.execute(delete(jobs_archive).where(jobs_archive.c.archived_at < cutoff)).rowcount
+    session.commit()
+    return jobs, applications
+
+
+def count_archived_applications(session: Session, job_ids) -> dict:
+    rows = session.exec(
+        select(applications_archive.c.jobId, func.count())
+        .where(applications_archive.c.jobId.in_(job_ids))
+        .group_by(applications_archive.c.jobId)
+    ).all()
+    return dict(rows)
+
+
+async def run_archive_purge(engine, interval: float = PURGE_INTERVAL_SECONDS) -> None:
+    """lifespan에서 백그라운드 task로 실행 - interval마다 보관 기간이 지난 행 삭제"""
+    if RETENTION_DAYS <= 0:
+        return
+
+    def purge() -> Tuple[int, int]:
+        with Session(engine) as session:
+            return purge_archive(session)
+
+    while True:
+        try:
+            jobs, applications = await asyncio.to_thread(purge)
+            if jobs or applications:
+                print(f"[DEBUG] job_archive - 보관 공고 {jobs}개, 지원서 {applications}개 삭제")
+        except Exception as exc:
+            print(f"[ERROR] job_archive - purge 실패: {exc}")
+        await asyncio.sleep(interval)
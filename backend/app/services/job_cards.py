@@ -0,0 +1,100 @@
+"""
+Job card projection (job_cards)
+
+공고 목록(/jobs)은 공고마다 Job + Employer + EmployerProfile을 조합해 같은 dict
+(isTrusted, 파싱된 requiredVisa, wage_type 기본값 등)를 매번 다시 만들었습니다.
+job_cards 테이블에 job_to_dict 결과를 미리 직렬화한 JSON으로 저장해두고,
+목록은 카드 payload를 그대로 이어붙여 응답합니다. (행별 Python 조립 없음)
+
+카드는 원본이 바뀌는 쓰기 경로에서 같은 트랜잭션으로 갱신합니다.
+- 공고 생성/수정/상태 변경/삭제 (routers/jobs.py)
+- 고용주 프로필 생성/수정 (routers/employer.py) - isTrusted, employer 정보
+- 매장 수정 (routers/employer.py) - 매장 공고의 좌표
+지원자 수/조회수처럼 자주 바뀌는 카운터는 카드에 굽지 않고 조회 시 jobs 행에서 덮어씁니다.
+(job_query.card_json)
+"""
+import json
+from datetime import datetime
+from typing import Iterable, Optional
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import delete
+from sqlmodel import Session, select
+
+from app.models import Employer, EmployerProfile, Job, JobCard
+from app.services.job_query import is_trusted_profile, job_to_dict, select_jobs_with_employer
+
+
+def _serialize(job_dict: dict) -> str:
+    # JSONResponse와 같은 형식 (UTF-8 그대로, 공백 없음)
+    return json.dumps(jsonable_encoder(job_dict), ensure_ascii=False, separators=(",", ":"))
+
+
+def card_values(job: Job, employer: Optional[Employer], employer_profile: Optional[EmployerProfile]) -> dict:
+    """job_cards INSERT용 값 (bulk import에서 executemany로 사용)"""
+    return {
+        "job_id": job.id,
+        "is_trusted": is_trusted_profile(employer_profile),
+        "payload": _serialize(job_to_dict(job, employer, employer_profile)),
+        "updated_at": datetime.utcnow(),
+    }
+
+
+def _refresh_rows(session: Session, rows: Iterable) -> int:
+    count = 0
+    for job, employer, employer_profile in rows:
+        card = session.get(JobCard, job.id) or JobCard(job_id=job.id, payload="{}")
+        card.payload = _serialize(job_to_dict(job, employer, employer_profile))
+        card.is_trusted = is_trusted_profile(employer_profile)
+        card.updated_at = datetime.utcnow()
+        session.add(card)
+        count += 1
+    return count
+
+
+def refresh_job_card(session: Session, job_id: str) -> None:
+    """공고 1건의 카드 재생성 (commit은 호출자가 수행)"""
+    rows = session.exec(select_jobs_with_employer().where(Job.id == job_id)).all()
+    _refresh_rows(session, rows)
+
+
+def refresh_cards_for_employer_profile(session: Session, profile_id: str) -> int:
+    """고용주 프로필에 연결된 모든 공고 카드 재생성 (commit은 호출자가 수행)"""
+    rows = session.exec(
+        select_jobs_with_employer().where(Employer.businessNo == profile_id)
+    ).all()
+    return _refresh_rows(session, rows)
+
+
+def refresh_cards_for_store(session: Session, store_id: str) -> int:
+    """매장 공고 카드 재생성 (commit은 호출자가 수행)"""
+    rows = session.exec(select_jobs_with_employer().where(Job.store_id == store_id)).all()
+    return _refresh_rows(session, rows)
+
+
+def remove_job_card(session: Session, job_id: str) -> None:
+    session.execute(delete(JobCard).where(JobCard.job_id == job_id))
+
+
+def rebuild_job_cards(session: Session, missing_only: bool = False) -> int:
+    """jobs 테이블로부터 카드 재생성 (backfill용). missing_only면 카드가 없는 공고만"""
+    statement = select_jobs_with_employer()
+    if missing_only:
+        statement = statement.where(Job.id.not_in(select(JobCard.job_id)))
+    else:
+        session.execute(delete(JobCard))
+    count = _refresh_rows(session, session.exec(statement).all())
+    session.commit()
+    return count
+
+
+def ensure_job_cards(engine) -> None:
+    """시작 시 카드가 없는 공고(배포 이전 데이터 등)를 채움 - 목록은 카드와 INNER JOIN하므로 필요"""
+    with Session(engine) as session:
+        missing = session.exec(
+            select(Job.id).where(Job.id.not_in(select(JobCard.job_id))).limit(1)
+        ).first()
+        if not missing:
+            return
+        count = rebuild_job_cards(session, missing_only=True)
+    print(f"Job cards created ({count} jobs)")
@@ -0,0 +1,150 @@
+"""
+Job deadline scheduler
+
+Job.deadline(ISO 날짜 문자열)이 지난 활성 공고를 주기적으로 마감(status='closed')합니다.
+lifespan에서 백그라운드 task로 실행되며, 한 tick에서
+- 마감 대상 id를 (status, deadline) 인덱스로 BATCH_SIZE개씩 조회 (MySQL은 FOR UPDATE)
+- UPDATE jobs SET status='closed' WHERE id IN (...) AND status='active' AND deadline < 오늘 한 번
+  (rowcount가 후보 수와 다르면 공고별 UPDATE로 이 tick이 실제로 마감한 공고만 골라냄)
+- job_cards payload의 status도 같은 트랜잭션에서 json_set으로 갱신
+- 이 tick이 마감한 공고의 진행 중인 지원자(거절/채용 완료 제외)에게만 job_closed 알림
+을 배치 단위 트랜잭션으로 처리합니다. 여러 워커가 동시에 돌아도 알림은 한 번만 나갑니다.
+마감 후 공고 집계(facets)와 고용주 대시보드 캐시를 무효화합니다.
+
+deadline은 날짜('2025-01-31') 또는 일시('2025-01-31T18:00:00')이며, 마감일 다음 날(UTC 기준)에 마감됩니다.
+주기는 JOB_DEADLINE_CHECK_SECONDS (기본 60초)
+"""
+import asyncio
+import os
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import func, update
+from sqlmodel import Session, select
+
+from app.models import Application, Job, JobCard
+from app.services.employer_dashboard import invalidate_dashboards
+from app.services.job_facets import invalidate_job_facets
+from app.services.job_recommender import job_recommender
+from app.services.notifications import add_notifications, notification_values
+
+CHECK_INTERVAL_SECONDS = float(os.getenv("JOB_DEADLINE_CHECK_SECONDS", "60"))
+BATCH_SIZE = int(os.getenv("JOB_DEADLINE_BATCH_SIZE", "500"))
+
+# 마감 알림을 보내지 않는 지원 상태 (이미 결과가 난 지원)
+_FINISHED_APPLICATION_STATUSES = ("rejected", "hired")
+
+
+def deadline_cutoff(now: Optional[datetime] = None) -> str:
+    """이 값보다 작은 deadline은 마감 (오늘 날짜 'YYYY-MM-DD')"""
+    return (now or datetime.utcnow()).date().isoformat()
+
+
+def _expired_clause(cutoff: str):
+    # 빈 문자열 deadline(상시 모집)은 제외
+    return (Job.status == "active", Job.deadline < cutoff, Job.deadline != "")
+
+
+def _claim_expired(session: Session, candidates: Dict[str, Optional[str]], cutoff: str) -> Dict[str, Optional[str]]:
+    """candidates(id -> owner) 중 이 트랜잭션이 실제로 마감한 공고만 반환
+
+    다른 워커/tick이 먼저 마감했거나 그 사이 다시 활성화된 공고는 UPDATE 조건에서 빠집니다.
+    한 번의 UPDATE로 전부 바뀌면 그대로 쓰고, 일부만 바뀌었으면 어느 행인지 알 수 없으므로
+    롤백 후 공고별 UPDATE의 rowcount로 다시 확인합니다. (경합이 있을 때만)
+    """
+    closed = session.execute(
+        update(Job)
+        .where(Job.id.in_(list(candidates)), *_expired_clause(cutoff))
+        .values(status="closed")
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if closed == len(candidates):
+        return candidates
+    session.rollback()
+    claimed = {}
+    for job_id, owner_user_id in candidates.items():
+        closed = session.execute(
+            update(Job)
+            .where(Job.id == job_id, *_expired_clause(cutoff))
+            .values(status="closed")
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if closed:
+            claimed[job_id] = owner_user_id
+    return claimed
+
+
+def _close_batch(session: Session, cutoff: str, now: datetime) -> Tuple[int, Dict[str, Optional[str]]]:
+    """마감 대상 BATCH_SIZE개 처리 - (조회한 후보 수, 이번 tick이 마감한 공고 id -> 소유 고용주)"""
+    # MySQL: 후보 행을 잠가 동시에 실행된 다른 tick은 커밋 후 바뀐 상태로 다시 평가 (SQLite는 무시)
+    candidates = dict(session.exec(
+        select(Job.id, Job.owner_user_id).where(*_expired_clause(cutoff)).limit(BATCH_SIZE).with_for_update()
+    ).all())
+    if not candidates:
+        return 0, {}
+
+    closed = _claim_expired(session, candidates, cutoff)
+    if not closed:
+        session.commit()
+        return len(candidates), {}
+    job_ids = list(closed)
+    session.execute(
+        update(JobCard)
+        .where(JobCard.job_id.in_(job_ids))
+        .values(payload=func.json_set(JobCard.payload, "$.status", "closed"), updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+
+    applicants = session.exec(
+        select(Application.applicationId, Application.seekerId, Job.id, Job.title)
+        .join(Job, Job.id == Application.jobId)
+        .where(
+            Application.jobId.in_(job_ids),
+            Application.status.not_in(_FINISHED_APPLICATION_STATUSES),
+        )
+    ).all()
+    add_notifications(session, [
+        notification_values(
+            user_id=seeker_id,
+            type="job_closed",
+            message=f"지원하신 공고 '{title}'의 모집이 마감되었습니다.",
+            job_id=job_id,
+            application_id=application_id,
+            created_at=now,
+        )
+        for application_id, seeker_id, job_id, title in applicants
+    ])
+    session.commit()
+    return len(candidates), closed
+
+
+def close_expired_jobs(engine, now: Optional[datetime] = None) -> int:
+    """마감일이 지난 활성 공고를 모두 마감하고 마감한 공고 수 반환"""
+    now = now or datetime.utcnow()
+    cutoff = deadline_cutoff(now)
+    closed: Dict[str, Optional[str]] = {}
+    with Session(engine) as session:
+        while True:
+            candidates, batch = _close_batch(session, cutoff, now)
+            for job_id in batch:
+                job_recommender.remove(job_id)
+            closed.update(batch)
+            if candidates < BATCH_SIZE:
+                break
+    if closed:
+        # 공고 상태가 바뀌었으므로 활성 공고 집계와 고용주 대시보드 캐시 무효화
+        invalidate_job_facets()
+        invalidate_dashboards(closed.values())
+    return len(closed)
+
+
+async def run_deadline_scheduler(engine, interval: float = CHECK_INTERVAL_SECONDS) -> None:
+    """lifespan에서 백그라운드 task로 실행 - interval마다 마감 처리"""
+    while True:
+        try:
+            closed = await asyncio.to_thread(close_expired_jobs, engine)
+            if closed:
+                print(f"[DEBUG] job_deadlines - 마감일이 지난 공고 {closed}개 마감")
+        except Exception as exc:
+            print(f"[ERROR] job_deadlines - 마감 처리 실패: {exc}")
+        await asyncio.sleep(interval)
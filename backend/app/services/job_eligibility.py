@@ -0,0 +1,106 @@
+"""
+Job eligibility columns (jobs.visa_mask / jobs.lang_level)
+
+requiredVisa(JSON 배열 문자열)와 requiredLanguage('Lv.2 초급', 'TOPIK 3급' 등)를
+정수 컬럼으로 정규화해 두고, 구직자 기준 "지원 가능한 공고" 조건을 SQL로만 처리합니다.
+
+    WHERE lang_level <= :my_level AND (visa_mask = 0 OR visa_mask & :my_visa_bit)
+
+- VISA_BITS에 없는 비자는 모두 OTHER_VISA_BIT를 쓰므로, 그런 비자로 조회할 때는 비트가 켜진
+  공고 중 requiredVisa에 같은 코드가 있는 공고만 (다른 미등록 비자와 섞이지 않도록)
+- 값은 공고 생성/수정/bulk import 시 set_job_eligibility로 함께 저장
+- 기존 공고는 시작 시 ensure_job_eligibility, 또는 scripts/backfill.py eligibility로 채움
+"""
+import json
+from typing import Optional
+
+from sqlalchemy import and_, or_, update
+from sqlmodel import Session, select
+
+from app.models import Job, JobSeeker, JobSeekerProfile
+from app.services.matching import (
+    OTHER_VISA_BIT,
+    VISA_BITS,
+    language_level,
+    normalize_visa,
+    parse_json_list,
+    visa_bit,
+    visa_mask,
+)
+
+_BATCH_SIZE = 1000
+
+
+def set_job_eligibility(job: Job) -> None:
+    """requiredVisa/requiredLanguage로부터 visa_mask/lang_level 설정"""
+    job.visa_mask = visa_mask(parse_json_list(job.requiredVisa))
+    job.lang_level = language_level(job.requiredLanguage)
+
+
+def eligibility_clause(visa_type: Optional[str] = None, level: Optional[int] = None):
+    """구직자 비자/한국어 수준으로 지원 가능한 공고 조건 (None이면 해당 조건 생략)"""
+    clauses = []
+    code = normalize_visa(visa_type)
+    if code in VISA_BITS:
+        clauses.append(or_(Job.visa_mask == 0, Job.visa_mask.op("&")(visa_bit(code)) != 0))
+    elif code:
+        # requiredVisa는 json.dumps(list) - 항목 문자열 '"D-3"' 그대로 비교
+        clauses.append(or_(
+            Job.visa_mask == 0,
+            and_(
+                Job.visa_mask.op("&")(1 << OTHER_VISA_BIT) != 0,
+                Job.requiredVisa.contains(json.dumps(code), autoescape=True),
+            ),
+        ))
+    if level is not None:
+        clauses.append(Job.lang_level <= level)
+    return clauses
+
+
+def seeker_eligibility(session: Session, user_id: str):
+    """구직자 user_id -> (비자, 한국어 서수). 프로필이 없으면 None
+
+    한국어 수준은 jobseekers.languageLevel (seeker_index와 같은 기준), 없으면 0(무관 공고만)
+    """
+    row = session.exec(
+        select(JobSeekerProfile.visa_type, JobSeeker.languageLevel)
+        .outerjoin(JobSeeker, JobSeeker.id == JobSeekerProfile.user_id)
+        .where(JobSeekerProfile.user_id == user_id)
+        .order_by(JobSeekerProfile.created_at.desc())
+    ).first()
+    if row is None:
+        return None
+    visa_type, language_label = row
+    return visa_type, language_level(language_label)
+
+
+def rebuild_job_eligibility(session: Session, missing_only: bool = False) -> int:
+    """jobs.visa_mask/lang_level 재계산 (backfill용). missing_only면 값이 없는 공고만"""
+    statement = select(Job.id, Job.requiredVisa, Job.requiredLanguage)
+    if missing_only:
+        statement = statement.where(or_(Job.visa_mask.is_(None), Job.lang_level.is_(None)))
+    rows = [
+        {
+            "id": job_id,
+            "visa_mask": visa_mask(parse_json_list(required_visa)),
+            "lang_level": language_level(required_language),
+        }
+        for job_id, required_visa, required_language in session.exec(statement).all()
+    ]
+    # ORM bulk UPDATE by primary key (executemany)
+    for start in range(0, len(rows), _BATCH_SIZE):
+        session.execute(update(Job), rows[start:start + _BATCH_SIZE])
+    session.commit()
+    return len(rows)
+
+
+def ensure_job_eligibility(engine) -> None:
+    """시작 시 visa_mask/lang_level이 비어 있는 공고(컬럼 추가 이전 데이터)를 채움"""
+    with Session(engine) as session:
+        missing = session.exec(
+            select(Job.id).where(or_(Job.visa_mask.is_(None), Job.lang_level.is_(None))).limit(1)
+        ).first()
+        if not missing:
+            return
+        count = rebuild_job_eligibility(session, missing_only=True)
+    print(f"Job eligibility columns filled ({count} jobs)")
@@ -0,0 +1,109 @@
+"""
+Job search facets (GET /jobs/facets)
+
+현재 필터 조건(list_jobs와 동일)에 해당하는 공고 수를 업종/지역/급여 구간/급여 형태/
+신뢰 여부/퀵메뉴 프리셋별로 돌려줍니다.
+- (업종, location, 급여 형태, 급여 구간, 신뢰, 인기 점수 유무, 고시급) GROUP BY 쿼리 1회 후 Python에서 합산
+  (그룹 수는 값 종류의 조합이라 공고 수와 무관하게 작음)
+- 결과는 필터 조합별로 JOB_FACETS_TTL_SECONDS(기본 30초) 동안 캐시하고,
+  공고 쓰기 경로에서 invalidate_job_facets()로 즉시 무효화
+"""
+import os
+from collections import Counter
+from typing import Dict, List
+
+from sqlalchemy import case, func
+from sqlmodel import Session, select
+
+from app.models import Job, JobCard
+from app.services.geo import province_of
+from app.services.job_query import HIGH_WAGE_THRESHOLD, apply_job_filters
+from app.services.ttl_cache import TTLCache
+
+FACETS_TTL_SECONDS = float(os.getenv("JOB_FACETS_TTL_SECONDS", "30"))
+
+# 시급 환산 급여 구간 경계 (원) - high-wage 기준(HIGH_WAGE_THRESHOLD)을 경계로 포함
+WAGE_BUCKET_EDGES = [10000, HIGH_WAGE_THRESHOLD, 13000, 15000]
+
+UNKNOWN_REGION = "기타"
+
+facet_cache = TTLCache(FACETS_TTL_SECONDS)
+
+
+def invalidate_job_facets() -> None:
+    """공고 생성/수정/상태 변경/삭제 후 호출"""
+    facet_cache.invalidate()
+
+
+def _wage_bucket_expr():
+    # 시급 환산 컬럼 기준 (jobs.hourly_wage)
+    return case(
+        *[(Job.hourly_wage < edge, index) for index, edge in enumerate(WAGE_BUCKET_EDGES)],
+        else_=len(WAGE_BUCKET_EDGES),
+    )
+
+
+def _wage_buckets(counts: Counter) -> List[dict]:
+    bounds = [None, *WAGE_BUCKET_EDGES, None]
+    return [
+        {"min": bounds[index], "max": bounds[index + 1], "count": counts.get(index, 0)}
+        for index in range(len(WAGE_BUCKET_EDGES) + 1)
+    ]
+
+
+def _ranked(counts: Counter) -> List[dict]:
+    return [{"value": value, "count": count} for value, count in counts.most_common()]
+
+
+def compute_facets(session: Session, **filters) -> dict:
+    """필터(apply_job_filters 인자)에 해당하는 공고의 facet별 개수"""
+    wage_type = func.coalesce(Job.wage_type, "hourly")
+    trending = func.coalesce(Job.trend_score, 0) > 0
+    high_wage = func.coalesce(Job.hourly_wage, 0) >= HIGH_WAGE_THRESHOLD
+    bucket = _wage_bucket_expr()
+    statement = (
+        select(
+            Job.category, Job.location, wage_type, bucket, JobCard.is_trusted,
+            trending, high_wage, func.count(),
+        )
+        .select_from(Job)
+        .join(JobCard, JobCard.job_id == Job.id)
+    )
+    statement, _ = apply_job_filters(statement, cards=True, **filters)
+    statement = statement.group_by(
+        Job.category, Job.location, wage_type, bucket, JobCard.is_trusted, trending, high_wage
+    )
+
+    total = 0
+    categories: Counter = Counter()
+    regions: Counter = Counter()
+    wage_types: Counter = Counter()
+    buckets: Counter = Counter()
+    trusted: Dict[bool, int] = {True: 0, False: 0}
+    presets = Counter()
+    for category, location, job_wage_type, job_bucket, is_trusted, popular, high, count in session.exec(statement).all():
+        total += count
+        categories[category] += count
+        regions[province_of(location) or UNKNOWN_REGION] += count
+        wage_types[job_wage_type] += count
+        buckets[job_bucket] += count
+        trusted[bool(is_trusted)] += count
+        presets["high-wage"] += count if high else 0
+        presets["popular"] += count if popular else 0
+        presets["trusted"] += count if is_trusted else 0
+
+    return {
+        "total": total,
+        "category": _ranked(categories),
+        "region": _ranked(regions),
+        "wageBucket": _wage_buckets(buckets),
+        "wageType": _ranked(wage_types),
+        "trusted": {"true": trusted[True], "false": trusted[False]},
+        "presets": {name: presets.get(name, 0) for name in ("high-wage", "popular", "trusted")},
+    }
+
+
+def get_facets(session: Session, **filters) -> dict:
+    """compute_facets 결과 (필터 조합별 TTL 캐시)"""
+    key = tuple(sorted(filters.items()))
+    return facet_cache.get_or_compute(key, lambda: compute_facets(session, **filters))
@@ -0,0 +1,255 @@
+"""
+Bulk job import (POST /jobs/bulk)
+
+여러 매장을 가진 고용주가 공고를 한 번에 등록할 수 있도록 JSONL/CSV 요청 본문을
+스트리밍으로 읽어 처리합니다.
+- 고용주 프로필/가입 사용자/레거시 Employer/매장 목록은 요청당 한 번만 조회
+- 행 단위로 검증하고, 통과한 행은 BULK_CHUNK_SIZE개씩 모아 executemany INSERT 후 commit
+  (jobs, job_cards, 검색 인덱스, 저장 검색 알림을 같은 트랜잭션에서)
+- 실패한 행은 건너뛰고 행 번호별 결과를 돌려줌 (DB 오류가 난 청크는 그 청크의 행만 실패)
+"""
+import codecs
+import csv
+import json
+import uuid
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlmodel import Session, select
+
+from app.models import Employer, EmployerProfile, Job, JobCard, Store
+from app.schemas import JobBulkRow
+from app.services.geo import geocode_address, set_job_coordinates
+from app.services.job_cards import card_values
+from app.services.job_eligibility import set_job_eligibility
+from app.services.job_recommender import job_recommender
+from app.services.job_search import index_new_jobs
+from app.services.job_wages import set_job_hourly_wage
+from app.services.saved_searches import notify_matching_searches
+
+BULK_CHUNK_SIZE = 500
+MAX_BULK_ROWS = 10000
+JOB_STATUSES = ("active", "paused", "closed")
+
+_JOB_COLUMNS = list(Job.__table__.columns.keys())
+
+
+async def _iter_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """바이트 청크 스트림 -> 줄 단위 문자열 (UTF-8, BOM 허용)"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in stream:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+def _normalize_visa(value) -> List[str]:
+    """CSV의 required_visa ('E-9|H-2', 'E-9,H-2', '["E-9"]')를 list로"""
+    if value is None or isinstance(value, list):
+        return value or []
+    value = str(value).strip()
+    if value.startswith("["):
+        return json.loads(value)
+    separator = "|" if "|" in value else ","
+    return [part.strip() for part in value.split(separator) if part.strip()]
+
+
+async def iter_jsonl_records(stream: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, object]]:
+    """(행 번호, dict 또는 파싱 오류 메시지) - 빈 줄은 건너뜀"""
+    row_no = 0
+    async for line in _iter_lines(stream):
+        if not line.strip():
+            continue
+        row_no += 1
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield row_no, f"JSON 형식 오류: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield row_no, "각 줄은 JSON 객체여야 합니다."
+            continue
+        yield row_no, record
+
+
+async def iter_csv_records(stream: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, object]]:
+    """(행 번호, dict 또는 파싱 오류 메시지) - 첫 줄은 헤더
+
+    따옴표 안의 줄바꿈(설명 등)을 지원하기 위해 따옴표 개수가 짝수가 될 때까지
+    줄을 이어붙여 한 레코드로 파싱합니다.
+    """
+    header: Optional[List[str]] = None
+    buffer: List[str] = []
+    quotes = 0
+    row_no = 0
+    async for line in _iter_lines(stream):
+        buffer.append(line)
+        quotes += line.count('"')
+        if quotes % 2:
+            continue
+        text, buffer, quotes = "\n".join(buffer), [], 0
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        row_no += 1
+        if len(values) != len(header):
+            yield row_no, f"열 개수가 헤더와 다릅니다 ({len(values)} != {len(header)})"
+            continue
+        yield row_no, {name: value for name, value in zip(header, values) if value != ""}
+    if buffer:
+        yield row_no + 1, "닫히지 않은 따옴표가 있습니다."
+
+
+def _derive_location(row: JobBulkRow, employer: Employer) -> Optional[str]:
+    """create_job과 같은 규칙: location > 가게 주소 앞 두 단어 > 고용주 주소 앞 두 단어"""
+    if row.location:
+        return row.location
+    for address in (row.shop_address, employer.address):
+        parts = (address or "").split()
+        if len(parts) >= 2:
+            return f"{parts[0]} {parts[1]}"
+    return None
+
+
+class JobImporter:
+    """요청 하나의 bulk import 상태 (고용주/매장은 생성 시 한 번 조회)"""
+
+    def __init__(self, session: Session, employer_profile: EmployerProfile, employer: Employer):
+        self.session = session
+        self.employer_profile = employer_profile
+        self.employer = employer
+        self.stores: Dict[str, Store] = {
+            store.id: store
+            for store in session.exec(select(Store).where(Store.user_id == employer_profile.user_id)).all()
+        }
+        self.results: List[dict] = []
+        self.created = 0
+        self.failed = 0
+        self._rows = 0
+        self._pending: List[Tuple[int, Job]] = []
+
+    def _fail(self, row_no: int, errors: List[str]) -> None:
+        self.failed += 1
+        self.results.append({"row": row_no, "status": "error", "errors": errors})
+
+    def _build_job(self, row: JobBulkRow, now: str) -> Job:
+        job = Job(
+            id=f"job-{uuid.uuid4().hex[:8]}",
+            employerId=self.employer.id,
+            owner_user_id=self.employer_profile.user_id,
+            title=row.title,
+            description=row.description,
+            category=row.category,
+            wage=row.wage,
+            wage_type=row.wage_type or "hourly",
+            workDays=row.work_days,
+            workHours=row.work_hours,
+            deadline=row.deadline,
+            positions=row.positions,
+            requiredLanguage=row.required_language,
+            requiredVisa=json.dumps(row.required_visa),
+            benefits=row.benefits,
+            createdAt=now,
+            postedAt=now,
+            status=row.status or "active",
+            views=0,
+            applications=0,
+            location=_derive_location(row, self.employer),
+            shop_name=row.shop_name,
+            shop_address=row.shop_address,
+            shop_address_detail=row.shop_address_detail,
+            shop_phone=row.shop_phone,
+            store_id=row.store_id,
+        )
+        store = self.stores.get(row.store_id) if row.store_id else None
+        if store and store.latitude is not None and store.longitude is not None:
+            set_job_coordinates(job, (store.latitude, store.longitude))
+        else:
+            set_job_coordinates(job, geocode_address(row.shop_address, job.location, self.employer.address))
+        set_job_eligibility(job)
+        set_job_hourly_wage(job)
+        return job
+
+    def add(self, row_no: int, record) -> None:
+        """레코드 1건 검증 후 대기열에 추가 (청크가 차면 저장)"""
+        self._rows += 1
+        if self._rows > MAX_BULK_ROWS:
+            self._fail(row_no, [f"한 번에 최대 {MAX_BULK_ROWS}건까지 등록할 수 있습니다."])
+            return
+        if isinstance(record, str):
+            self._fail(row_no, [record])
+            return
+        try:
+            record = {**record, "required_visa": _normalize_visa(record.get("required_visa"))}
+            row = JobBulkRow(**record)
+        except ValidationError as exc:
+            self._fail(row_no, [
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors()
+            ])
+            return
+        except ValueError as exc:
+            self._fail(row_no, [f"required_visa: {exc}"])
+            return
+
+        errors = []
+        if row.status and row.status not in JOB_STATUSES:
+            errors.append(f"status: {', '.join(JOB_STATUSES)} 중 하나여야 합니다.")
+        if row.store_id and row.store_id not in self.stores:
+            errors.append(f"store_id: 이 고용주의 매장이 아닙니다 ({row.store_id})")
+        if errors:
+            self._fail(row_no, errors)
+            return
+
+        store = self.stores.get(row.store_id) if row.store_id else None
+        if store:
+            # 가게 정보가 비어 있으면 매장 정보로 채움
+            row.shop_name = row.shop_name or store.store_name
+            row.shop_address = row.shop_address or store.address
+            row.shop_address_detail = row.shop_address_detail or store.address_detail
+            row.shop_phone = row.shop_phone or store.phone
+        self._pending.append((row_no, self._build_job(row, datetime.utcnow().isoformat())))
+        if len(self._pending) >= BULK_CHUNK_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """대기 중인 행을 executemany INSERT + commit (청크 단위 트랜잭션)"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        jobs = [job for _, job in pending]
+        try:
+            self.session.execute(
+                insert(Job), [{column: getattr(job, column) for column in _JOB_COLUMNS} for job in jobs]
+            )
+            self.session.execute(
+                insert(JobCard), [card_values(job, self.employer, self.employer_profile) for job in jobs]
+            )
+            index_new_jobs(self.session, jobs)
+            notify_matching_searches(self.session, jobs)
+            self.session.commit()
+        except Exception as exc:
+            self.session.rollback()
+            print(f"[ERROR] bulk_create_jobs - 청크 저장 실패 ({len(jobs)}건): {exc}")
+            for row_no, _ in pending:
+                self._fail(row_no, [f"저장 실패: {exc.__class__.__name__}"])
+            return
+
+        for row_no, job in pending:
+            job_recommender.upsert(job)
+            self.results.append({"row": row_no, "status": "created", "id": job.id})
+        self.created += len(pending)
+
+    def summary(self) -> dict:
+        self.flush()
+        self.results.sort(key=lambda result: result["row"])
+        return {"created": self.created, "failed": self.failed, "results": self.results}
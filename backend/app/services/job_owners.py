@@ -0,0 +1,68 @@
+"""
+Job ownership column (jobs.owner_user_id)
+
+"이 고용주(user_id)의 공고"를 구하려면 매장(stores.user_id) → 공고, 사업자 프로필 →
+레거시 employers → 공고, employerId == user_id(레거시 직접 매핑)의 세 경로를 모두
+따라가야 했습니다. 공고 생성 시 소유 고용주의 signup user id를 owner_user_id에 저장해
+두고, 고용주 범위 조회는 모두 owner_user_id = :user_id 인덱스 조건 하나로 처리합니다.
+
+- 공고 생성/bulk import 시 등록한 고용주 프로필의 user_id로 저장
+- 기존 공고(보관 공고 포함)는 시작 시 ensure_job_owners, 또는 scripts/backfill.py job-owners로 채움
+  (매장 소유자 > 사업자 프로필 소유자 > employerId와 같은 가입 사용자 순)
+"""
+from sqlalchemy import func, update
+from sqlmodel import Session, select
+
+from app.models import Employer, EmployerProfile, Job, SignupUser, Store, jobs_archive
+
+
+def _owner_sources(table):
+    """table(jobs 또는 jobs_archive) 행의 소유자를 구하는 상관 서브쿼리 (우선순위 순)"""
+    columns = table.c
+    return (
+        select(Store.user_id).where(Store.id == columns.store_id).scalar_subquery(),
+        select(EmployerProfile.user_id)
+        .join(Employer, Employer.businessNo == EmployerProfile.id)
+        .where(Employer.id == columns.employerId)
+        .limit(1)
+        .scalar_subquery(),
+        select(SignupUser.id).where(SignupUser.id == columns.employerId).scalar_subquery(),
+    )
+
+
+def _count_missing(session: Session, table) -> int:
+    return session.execute(
+        select(func.count()).select_from(table).where(table.c.owner_user_id.is_(None))
+    ).scalar_one()
+
+
+def rebuild_job_owners(session: Session, missing_only: bool = False) -> int:
+    """jobs/jobs_archive.owner_user_id 재계산 (backfill용). missing_only면 값이 없는 행만
+
+    우선순위가 높은 경로부터 UPDATE ... SET owner_user_id = (서브쿼리)를 실행하고,
+    다음 경로는 아직 비어 있는 행만 채웁니다. (행별 Python 조회 없음)
+    소유자를 찾은 행 수를 돌려줍니다.
+    """
+    filled = 0
+    for table in (Job.__table__, jobs_archive):
+        if not missing_only:
+            session.execute(update(table).values(owner_user_id=None))
+        before = _count_missing(session, table)
+        for source in _owner_sources(table):
+            session.execute(update(table).where(table.c.owner_user_id.is_(None)).values(owner_user_id=source))
+        filled += before - _count_missing(session, table)
+    session.commit()
+    return filled
+
+
+def ensure_job_owners(engine) -> None:
+    """시작 시 owner_user_id가 비어 있는 공고(컬럼 추가 이전 데이터)를 채움"""
+    with Session(engine) as session:
+        missing = session.exec(select(Job.id).where(Job.owner_user_id.is_(None)).limit(1)).first()
+        missing_archived = session.execute(
+            select(jobs_archive.c.id).where(jobs_archive.c.owner_user_id.is_(None)).limit(1)
+        ).first()
+        if not missing and not missing_archived:
+            return
+        count = rebuild_job_owners(session, missing_only=True)
+    print(f"Job owners filled ({count} jobs)")
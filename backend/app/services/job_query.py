@@ -0,0 +1,229 @@
+"""
+Job listing query builder
+
+list_jobs의 모든 필터, 프리셋(high-wage/popular/trusted), 정렬을 하나의 SQL 문으로 조립합니다.
+WHERE/ORDER BY/LIMIT이 모두 DB에서 처리되므로 페이지 크기와 순서가 항상 정확합니다.
+"""
+import json
+from typing import Optional, Tuple
+
+from sqlalchemy import and_, func, or_
+from sqlmodel import select
+
+from app.models import Employer, EmployerProfile, Job, JobCard
+from app.services.geo import bounding_box, covering_cells, planar_distance_sq
+from app.services.job_eligibility import eligibility_clause
+from app.services.job_search import apply_search
+from app.services.job_trends import current_trend, trend_increment
+from app.services.pagination import next_cursor, paginate_asc, paginate_desc
+
+# high-wage 프리셋 기준 시급 (원, 시급 환산 jobs.hourly_wage와 비교)
+HIGH_WAGE_THRESHOLD = 11000
+
+
+def is_trusted_profile(employer_profile: Optional[EmployerProfile]) -> bool:
+    """Python 측 신뢰 플래그 판정 (trusted_clause와 동일한 기준)"""
+    if not employer_profile:
+        return False
+    return bool(employer_profile.business_license) or bool(employer_profile.is_verified)
+
+
+def trusted_clause():
+    """사업자등록증이 있거나 인증된 고용주 프로필이면 신뢰 공고로 간주"""
+    return or_(
+        and_(
+            EmployerProfile.business_license.is_not(None),
+            EmployerProfile.business_license != "",
+        ),
+        EmployerProfile.is_verified == True,  # noqa: E712
+    )
+
+
+def select_jobs_with_employer():
+    """SELECT (Job, Employer, EmployerProfile) with the employer chain outer-joined."""
+    return (
+        select(Job, Employer, EmployerProfile)
+        .outerjoin(Employer, Employer.id == Job.employerId)
+        .outerjoin(EmployerProfile, EmployerProfile.id == Employer.businessNo)
+    )
+
+
+def card_json():
+    """job_cards.payload with the live counters spliced in by the database.
+
+    Job.applications/views/trend_score change on every application/flush, so they are not
+    baked into the card; json_set (SQLite JSON1 / MySQL JSON_SET) overwrites
+    them from the jobs row without any per-row Python work. hourly_wage is
+    spliced the same way so cards built before the column existed include it.
+    """
+    applications = func.coalesce(Job.applications, 0)
+    return func.json_set(
+        JobCard.payload,
+        "$.applications", applications,
+        "$.applicationsCount", applications,
+        "$.views", func.coalesce(Job.views, 0),
+        "$.hourly_wage", Job.hourly_wage,
+        # 저장값은 기준 시각 스케일 - 현재 시각 기준 감쇠 점수로 환산 (요청당 상수 1개로 나눔)
+        "$.trend_score", func.coalesce(Job.trend_score, 0.0) / trend_increment(1.0),
+    ).label("payload")
+
+
+def select_job_cards():
+    """SELECT (payload, id, 정렬 키들) - 목록 피드용. Employer/EmployerProfile JOIN 없음"""
+    return (
+        select(card_json(), Job.id, Job.postedAt, Job.hourly_wage, Job.trend_score)
+        .select_from(Job)
+        .join(JobCard, JobCard.job_id == Job.id)
+    )
+
+
+def job_to_dict(
+    job: Job,
+    employer: Optional[Employer],
+    employer_profile: Optional[EmployerProfile],
+    applications_count: Optional[int] = None,
+) -> dict:
+    """Serialize a job row the way /jobs and /jobs/{id} return it."""
+    try:
+        required_visas = json.loads(job.requiredVisa) if job.requiredVisa else []
+    except Exception:
+        required_visas = []
+
+    # visa_mask/lang_level/owner_user_id는 필터용 내부 컬럼 (requiredVisa/requiredLanguage/매장·고용주와 같은 정보)
+    job_dict = job.dict(exclude={"visa_mask", "lang_level", "owner_user_id"})
+    job_dict["employer"] = employer.dict() if employer else {}
+    job_dict["requiredVisa"] = required_visas
+    job_dict["applicationsCount"] = (
+        applications_count if applications_count is not None else (job.applications or 0)
+    )
+    job_dict["isTrusted"] = is_trusted_profile(employer_profile)
+    job_dict["wage_type"] = job.wage_type or "hourly"
+    job_dict["trend_score"] = current_trend(job.trend_score)
+    return job_dict
+
+
+def apply_job_filters(
+    statement,
+    query: Optional[str] = None,
+    location: Optional[str] = None,
+    industry: Optional[str] = None,
+    max_language_level: Optional[int] = None,
+    visa_type: Optional[str] = None,
+    store_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    status: Optional[str] = None,
+    sort: Optional[str] = None,
+    dialect: str = "sqlite",
+    near: Optional[Tuple[float, float, float]] = None,
+    cards: bool = False,
+):
+    """list_jobs 필터/프리셋 WHERE 절 적용 -> (statement, 검색 관련도 정렬식 또는 None)
+
+    목록(build_job_list_statement)과 facet 집계(job_facets)가 같은 조건을 사용합니다.
+    cards=True면 statement에 job_cards가 JOIN되어 있어야 합니다. (trusted 프리셋)
+    """
+    relevance_order = None
+    if query and query.strip():
+        # 전문 검색 (SQLite FTS5 / MySQL FULLTEXT)
+        statement, relevance_order = apply_search(statement, query.strip(), dialect)
+    if location:
+        statement = statement.where(Job.location.like(f"%{location}%"))
+    if industry:
+        statement = statement.where(Job.category.like(f"%{industry}%"))
+    if visa_type or max_language_level is not None:
+        # 정규화된 정수 컬럼 비교 (requiredVisa/requiredLanguage 문자열 LIKE 없음)
+        statement = statement.where(*eligibility_clause(visa_type, max_language_level))
+    if near:
+        # 반경 검색: 격자 셀 + bounding box로 인덱스 범위를 좁히고 거리 판정까지 SQL에서
+        lat, lng, radius_km = near
+        min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+        statement = statement.where(
+            Job.geo_cell.in_(covering_cells(lat, lng, radius_km)),
+            Job.latitude.between(min_lat, max_lat),
+            Job.longitude.between(min_lng, max_lng),
+            job_distance_sq(near) <= radius_km * radius_km,
+        )
+    if status:
+        statement = statement.where(Job.status == status)
+    if store_id:
+        statement = statement.where(Job.store_id == store_id)
+    if user_id and user_id.strip():
+        # 고용주의 모든 공고 (owner_user_id, app/services/job_owners.py)
+        statement = statement.where(Job.owner_user_id == user_id)
+
+    # Quick-menu preset filters
+    if sort == "high-wage":
+        # wage_type이 달라도 비교되도록 시급 환산 컬럼 사용
+        statement = statement.where(Job.hourly_wage >= HIGH_WAGE_THRESHOLD)
+    elif sort == "popular":
+        # 최근 조회/지원이 있는 공고 - trend_score는 이벤트마다 증가하는 시간 감쇠 점수 (job_trends)
+        statement = statement.where(Job.trend_score > 0)
+    elif sort == "trusted":
+        if cards:
+            statement = statement.where(JobCard.is_trusted == True)  # noqa: E712
+        else:
+            statement = statement.where(trusted_clause())
+    return statement, relevance_order
+
+
+def job_distance_sq(near: Tuple[float, float, float]):
+    """반경 검색 중심(near = (lat, lng, radius_km))까지의 거리 제곱 (km², SQL 식)"""
+    lat, lng, _ = near
+    return planar_distance_sq(Job.latitude, Job.longitude, lat, lng)
+
+
+def build_job_list_statement(
+    sort: Optional[str] = None,
+    cursor: Optional[str] = None,
+    cards: bool = False,
+    **filters,
+):
+    """Build a single SELECT for list_jobs with every filter, preset and sort in SQL.
+
+    Rows are (Job, Employer, EmployerProfile) tuples; employer and profile are
+    loaded by the same query so the page needs no per-job lookups.
+    With cards=True rows are (payload, id, postedAt, hourly_wage, trend_score) from
+    the job_cards projection instead (see select_job_cards).
+    With near (반경 검색) rows also carry distance_sq (km²), and without a sort
+    preset or search query they are ordered nearest first.
+    filters are the keyword arguments of apply_job_filters.
+    """
+    near = filters.get("near")
+    statement = select_job_cards() if cards else select_jobs_with_employer()
+    if near:
+        distance_sq = job_distance_sq(near)
+        statement = statement.add_columns(distance_sq.label("distance_sq"))
+    statement, relevance_order = apply_job_filters(statement, sort=sort, cards=cards, **filters)
+
+    if relevance_order is not None and not sort:
+        # 검색어가 있으면 관련도순 (관련도 정렬은 cursor 미지원 - offset 사용)
+        return statement.order_by(relevance_order, Job.id.desc())
+
+    if near and not sort:
+        # 가까운 순 (거리 제곱, id) 오름차순 + keyset cursor
+        return paginate_asc(statement, distance_sq, Job.id, cursor)
+
+    # (정렬 키, id) 내림차순 + keyset cursor - 정렬 키별 복합 인덱스 사용
+    return paginate_desc(statement, job_sort_column(sort), Job.id, cursor)
+
+
+def job_sort_column(sort: Optional[str]):
+    """프리셋별 keyset 정렬 키 (기본: 최신 등록순)"""
+    if sort == "high-wage":
+        return Job.hourly_wage
+    if sort == "popular":
+        return Job.trend_score
+    return Job.postedAt
+
+
+def job_cursor(rows, limit: int, sort: Optional[str], near: bool = False) -> Optional[str]:
+    """list_jobs 카드 행 (select_job_cards)으로 다음 페이지 cursor 생성
+
+    near=True면 반경 검색 행 (Job, Employer, EmployerProfile, distance_sq) 기준
+    """
+    if near and not sort:
+        return next_cursor(rows, limit, key=lambda row: (row.distance_sq, row[0].id))
+    column = job_sort_column(sort)
+    if near:
+        return next_cursor(rows, limit, key=lambda row: (getattr(row[0], column.key), row[0].id))
+    return next_cursor(rows, limit, key=lambda row: (getattr(row, column.key), row.id))
@@ -0,0 +1,226 @@
+"""
+Vectorized job recommendation
+
+활성 공고의 매칭 특성을 프로세스 메모리의 NumPy 배열(행 = 공고)로 유지하고,
+구직자 프로필 벡터를 모든 공고에 대해 한 번의 배열 연산으로 점수화합니다.
+
+특성 (app/services/matching.py 정규화 기준)
+- 지역/업종: 공고마다 어휘 인덱스 코드 1개 (one-hot의 열 번호). 구직자의 multi-hot
+  선호 벡터를 코드로 gather하면 one-hot 행렬과의 내적과 같은 값이며 메모리는 O(공고 수)
+- 근무 요일: 7비트 마스크 → 공고 요일 중 구직자 가능 요일 비율
+- 급여: 시급 환산 컬럼(jobs.hourly_wage)을 활성 공고 범위로 0~1 정규화
+- 비자: jobs.visa_mask (0 = 제한 없음, job_eligibility) - 구직자 비자가 허용되지 않으면 제외
+
+공고 생성/수정/상태 변경/삭제 시 해당 행만 갱신하고, 다른 워커 프로세스의 변경을
+반영하기 위해 JOB_RECOMMENDER_REFRESH_SECONDS(기본 300초)마다 전체를 다시 적재합니다.
+"""
+import os
+import threading
+import time
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+from sqlmodel import Session, select
+
+from app.models import Job, JobSeekerProfile
+from app.services.matching import (
+    OTHER_VISA_BIT,
+    job_region,
+    normalize_visa,
+    parse_json_list,
+    preferred_categories,
+    preferred_regions,
+    unlisted_visas,
+    visa_bit,
+    workday_mask,
+)
+
+REFRESH_SECONDS = float(os.getenv("JOB_RECOMMENDER_REFRESH_SECONDS", "300"))
+
+# 점수 가중치
+REGION_WEIGHT = 3.0
+CATEGORY_WEIGHT = 3.0
+WORKDAY_WEIGHT = 2.0
+WAGE_WEIGHT = 1.0
+
+# 7비트 요일 마스크별 켜진 비트 수
+_POPCOUNT = np.array([bin(mask).count("1") for mask in range(128)], dtype=np.float32)
+
+_INITIAL_CAPACITY = 1024
+
+
+class _Vocabulary:
+    """문자열 값 -> 정수 코드 (새 값은 뒤에 추가)"""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+
+    def code(self, value: Optional[str]) -> int:
+        if not value:
+            return -1
+        if value not in self.codes:
+            self.codes[value] = len(self.codes)
+        return self.codes[value]
+
+    def multi_hot(self, values) -> np.ndarray:
+        """선호 값 집합의 multi-hot 벡터. 마지막 칸은 코드 -1(값 없음)용으로 항상 False"""
+        vector = np.zeros(len(self.codes) + 1, dtype=bool)
+        for value in values:
+            code = self.codes.get(value)
+            if code is not None:
+                vector[code] = True
+        return vector
+
+
+class JobFeatureMatrix:
+    """활성 공고 특성 행렬 (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._loaded_at: Optional[float] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self.regions = _Vocabulary()
+        self.categories = _Vocabulary()
+        self._row_of: Dict[str, int] = {}
+        self._job_ids: List[Optional[str]] = []
+        self._free_rows: List[int] = []
+        # VISA_BITS에 없는 허용 비자 (행 -> 정규화 코드, OTHER_VISA_BIT가 켜진 공고만)
+        self._unlisted_visas: Dict[int, FrozenSet[str]] = {}
+        self._allocate(_INITIAL_CAPACITY)
+
+    def _allocate(self, capacity: int) -> None:
+        self.region = np.full(capacity, -1, dtype=np.int32)
+        self.category = np.full(capacity, -1, dtype=np.int32)
+        self.days = np.zeros(capacity, dtype=np.uint8)
+        self.wage = np.zeros(capacity, dtype=np.float32)
+        self.visa = np.zeros(capacity, dtype=np.uint64)
+        self.active = np.zeros(capacity, dtype=bool)
+
+    def _grow(self) -> None:
+        size = len(self.active)
+        old = (self.region, self.category, self.days, self.wage, self.visa, self.active)
+        self._allocate(size * 2)
+        for new_array, old_array in zip(
+            (self.region, self.category, self.days, self.wage, self.visa, self.active), old
+        ):
+            new_array[:size] = old_array
+
+    def _set_row(self, job) -> None:
+        row = self._row_of.get(job.id)
+        if row is None:
+            if self._free_rows:
+                row = self._free_rows.pop()
+            else:
+                row = len(self._job_ids)
+                self._job_ids.append(None)
+                if row >= len(self.active):
+                    self._grow()
+            self._row_of[job.id] = row
+            self._job_ids[row] = job.id
+        self.region[row] = self.regions.code(job_region(job.location, job.shop_address))
+        self.category[row] = self.categories.code(job.category)
+        self.days[row] = workday_mask(job.workDays)
+        self.wage[row] = job.hourly_wage or 0.0
+        self.visa[row] = job.visa_mask or 0
+        unlisted = unlisted_visas(parse_json_list(job.requiredVisa))
+        if unlisted:
+            self._unlisted_visas[row] = unlisted
+        else:
+            self._unlisted_visas.pop(row, None)
+        self.active[row] = True
+
+    def _clear_row(self, job_id: str) -> None:
+        row = self._row_of.pop(job_id, None)
+        if row is None:
+            return
+        self.active[row] = False
+        self._unlisted_visas.pop(row, None)
+        self._job_ids[row] = None
+        self._free_rows.append(row)
+
+    def load(self, session: Session) -> int:
+        """활성 공고 전체 재적재"""
+        # ORM 객체 대신 필요한 컬럼만 조회 (행은 속성 접근 가능)
+        jobs = session.exec(
+            select(
+                Job.id, Job.status, Job.location, Job.shop_address, Job.category,
+                Job.workDays, Job.hourly_wage, Job.visa_mask, Job.requiredVisa,
+            ).where(Job.status == "active")
+        ).all()
+        with self._lock:
+            self._reset()
+            for job in jobs:
+                self._set_row(job)
+            self._loaded_at = time.monotonic()
+        return len(jobs)
+
+    def ensure_loaded(self, session: Session) -> None:
+        with self._lock:
+            fresh = self._loaded_at is not None and time.monotonic() - self._loaded_at < REFRESH_SECONDS
+        if not fresh:
+            count = self.load(session)
+            print(f"[DEBUG] job_recommender - 활성 공고 {count}개 적재")
+
+    def upsert(self, job: Job) -> None:
+        """공고 쓰기 후 호출 (commit 이후). 활성 공고가 아니면 행 제거"""
+        with self._lock:
+            if self._loaded_at is None:
+                return  # 아직 적재 전 - 첫 추천 요청 시 전체 적재
+            if job.status == "active":
+                self._set_row(job)
+            else:
+                self._clear_row(job.id)
+
+    def remove(self, job_id: str) -> None:
+        with self._lock:
+            self._clear_row(job_id)
+
+    def top_k(self, profile: JobSeekerProfile, k: int) -> List[Tuple[str, float]]:
+        """구직자 프로필에 대한 상위 k개 (job_id, score)"""
+        regions = preferred_regions(parse_json_list(profile.preferred_regions))
+        categories = preferred_categories(parse_json_list(profile.preferred_jobs))
+        seeker_days = workday_mask(parse_json_list(profile.work_days_of_week))
+
+        with self._lock:
+            n = len(self._job_ids)
+            if n == 0:
+                return []
+            active = self.active[:n].copy()
+            if profile.visa_type:
+                visa = self.visa[:n]
+                bit = visa_bit(profile.visa_type)
+                allowed = (visa == 0) | ((visa & np.uint64(bit)) != 0)
+                if bit == 1 << OTHER_VISA_BIT:
+                    # 미등록 비자끼리는 비트가 같으므로 허용 목록에 같은 코드가 있는 공고만
+                    code = normalize_visa(profile.visa_type)
+                    allowed = visa == 0
+                    for row, codes in self._unlisted_visas.items():
+                        if row < n and code in codes:
+                            allowed[row] = True
+                active &= allowed
+
+            # one-hot(공고) · multi-hot(구직자) == 선호 벡터[공고 코드]
+            score = REGION_WEIGHT * self.regions.multi_hot(regions)[self.region[:n]]
+            score = score + CATEGORY_WEIGHT * self.categories.multi_hot(categories)[self.category[:n]]
+            if seeker_days:
+                days = self.days[:n]
+                overlap = _POPCOUNT[days & np.uint8(seeker_days)] / np.maximum(_POPCOUNT[days], 1)
+                score = score + WORKDAY_WEIGHT * overlap
+            wage = self.wage[:n]
+            if active.any():
+                low, high = wage[active].min(), wage[active].max()
+                if high > low:
+                    score = score + WAGE_WEIGHT * (wage - low) / (high - low)
+            score = np.where(active, score, -np.inf)
+
+            k = min(k, int(active.sum()))
+            if k <= 0:
+                return []
+            top = np.argpartition(-score, k - 1)[:k]
+            top = top[np.argsort(-score[top], kind="stable")]
+            return [(self._job_ids[row], float(score[row])) for row in top]
+
+
+job_recommender = JobFeatureMatrix()
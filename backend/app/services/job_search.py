@@ -0,0 +1,223 @@
+"""
+Job full-text search
+
+공고 제목/설명/업종/가게명에 대한 전문 검색 인덱스입니다.
+- SQLite (로컬): FTS5 가상 테이블 + BM25 랭킹. 한국어는 글자 2-gram으로 토큰화해 저장
+- MySQL (운영): jobs 테이블 FULLTEXT 인덱스 (ngram parser) + MATCH ... AGAINST 관련도
+- 그 외: LIKE 검색으로 대체
+
+SQLite 인덱스는 create/update/delete 시 index_job/remove_job으로 같은 트랜잭션에서 동기화합니다.
+MySQL FULLTEXT 인덱스는 DB가 자동으로 유지합니다.
+"""
+import re
+from typing import List, Optional
+
+from sqlalchemy import Float, String, or_, text
+from sqlmodel import Session, select
+
+from app.models import Job
+
+FTS_TABLE = "jobs_fts"
+FTS_DOCS_TABLE = "jobs_fts_docs"
+MYSQL_FULLTEXT_INDEX = "ft_jobs_search"
+
+# 검색 대상 컬럼과 BM25 가중치 (title > category = shop_name > description)
+SEARCH_COLUMNS = ("title", "description", "category", "shop_name")
+BM25_WEIGHTS = (4.0, 1.0, 2.0, 2.0)
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_CJK_RE = re.compile(r"[ᄀ-ᇿ㄰-㆏가-힣぀-ヿ一-鿿]")
+
+
+def tokenize(value: Optional[str]) -> List[str]:
+    """텍스트를 검색 토큰으로 분해
+
+    한글/CJK 단어는 글자 2-gram (한 글자 단어는 그대로), 그 외 단어는 소문자 단어 단위.
+    예: '바리스타 Cafe' -> ['바리', '리스', '스타', 'cafe']
+    """
+    if not value:
+        return []
+    tokens: List[str] = []
+    for word in _WORD_RE.findall(value.lower()):
+        if _CJK_RE.search(word) and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def _dialect(bind) -> str:
+    return bind.dialect.name
+
+
+def _fts_available(bind) -> bool:
+    with bind.connect() as conn:
+        row = conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type='table' AND name=:name"),
+            {"name": FTS_TABLE},
+        ).first()
+    return row is not None
+
+
+def ensure_search_index(engine) -> None:
+    """Create the search index for the current database if it does not exist yet."""
+    dialect = _dialect(engine)
+
+    if dialect == "sqlite":
+        if _fts_available(engine):
+            return
+        columns = ", ".join(SEARCH_COLUMNS)
+        with engine.begin() as conn:
+            conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {FTS_DOCS_TABLE} ("
+                "doc_id INTEGER PRIMARY KEY AUTOINCREMENT, job_id TEXT NOT NULL UNIQUE)"
+            ))
+            conn.execute(text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5({columns}, tokenize='unicode61')"
+            ))
+        with Session(engine) as session:
+            count = rebuild_search_index(session)
+        print(f"Search index created ({count} jobs indexed)")
+    elif dialect in ("mysql", "mariadb"):
+        with engine.connect() as conn:
+            exists = conn.execute(
+                text("SHOW INDEX FROM jobs WHERE Key_name = :name"),
+                {"name": MYSQL_FULLTEXT_INDEX},
+            ).first()
+        if exists:
+            return
+        columns = ", ".join(SEARCH_COLUMNS)
+        with engine.begin() as conn:
+            conn.execute(text(
+                f"ALTER TABLE jobs ADD FULLTEXT INDEX {MYSQL_FULLTEXT_INDEX} ({columns}) WITH PARSER ngram"
+            ))
+        print("Search index created (MySQL FULLTEXT ngram)")
+
+
+def _uses_fts(session: Session) -> bool:
+    return _dialect(session.get_bind()) == "sqlite"
+
+
+def _document_values(job: Job) -> dict:
+    return {column: " ".join(tokenize(getattr(job, column, None))) for column in SEARCH_COLUMNS}
+
+
+def remove_job(session: Session, job_id: str) -> None:
+    """검색 인덱스에서 공고 제거 (commit은 호출자가 수행)"""
+    if not _uses_fts(session):
+        return
+    session.execute(
+        text(f"DELETE FROM {FTS_TABLE} WHERE rowid IN (SELECT doc_id FROM {FTS_DOCS_TABLE} WHERE job_id = :job_id)"),
+        {"job_id": job_id},
+    )
+    session.execute(text(f"DELETE FROM {FTS_DOCS_TABLE} WHERE job_id = :job_id"), {"job_id": job_id})
+
+
+def index_job(session: Session, job: Job) -> None:
+    """공고를 검색 인덱스에 추가/갱신 (commit은 호출자가 수행)"""
+    if not _uses_fts(session):
+        return
+    remove_job(session, job.id)
+    session.execute(text(f"INSERT INTO {FTS_DOCS_TABLE} (job_id) VALUES (:job_id)"), {"job_id": job.id})
+    columns = ", ".join(SEARCH_COLUMNS)
+    placeholders = ", ".join(f":{column}" for column in SEARCH_COLUMNS)
+    session.execute(
+        text(
+            f"INSERT INTO {FTS_TABLE} (rowid, {columns}) "
+            f"SELECT doc_id, {placeholders} FROM {FTS_DOCS_TABLE} WHERE job_id = :job_id"
+        ),
+        {"job_id": job.id, **_document_values(job)},
+    )
+
+
+def index_new_jobs(session: Session, jobs: List[Job]) -> None:
+    """새로 추가된 공고들을 executemany로 한 번에 색인 (bulk import용, commit은 호출자가 수행)"""
+    if not jobs or not _uses_fts(session):
+        return
+    session.execute(
+        text(f"INSERT INTO {FTS_DOCS_TABLE} (job_id) VALUES (:job_id)"),
+        [{"job_id": job.id} for job in jobs],
+    )
+    columns = ", ".join(SEARCH_COLUMNS)
+    placeholders = ", ".join(f":{column}" for column in SEARCH_COLUMNS)
+    session.execute(
+        text(
+            f"INSERT INTO {FTS_TABLE} (rowid, {columns}) "
+            f"SELECT doc_id, {placeholders} FROM {FTS_DOCS_TABLE} WHERE job_id = :job_id"
+        ),
+        [{"job_id": job.id, **_document_values(job)} for job in jobs],
+    )
+
+
+def rebuild_search_index(session: Session) -> int:
+    """검색 인덱스를 jobs 테이블로부터 다시 생성 (backfill용)"""
+    if not _uses_fts(session):
+        return 0
+    session.execute(text(f"DELETE FROM {FTS_TABLE}"))
+    session.execute(text(f"DELETE FROM {FTS_DOCS_TABLE}"))
+    count = 0
+    for job in session.exec(select(Job)).all():
+        index_job(session, job)
+        count += 1
+    session.commit()
+    return count
+
+
+def _fts_match_expression(query: str) -> Optional[str]:
+    tokens = tokenize(query)
+    if not tokens:
+        return None
+    terms = []
+    for token in dict.fromkeys(tokens):
+        term = '"{}"'.format(token.replace('"', '""'))
+        if len(token) == 1 and _CJK_RE.match(token):
+            # 한 글자 검색어는 저장된 2-gram의 접두어로 매칭
+            term += "*"
+        terms.append(term)
+    return " AND ".join(terms)
+
+
+def apply_search(statement, query: str, dialect: str):
+    """Filter a Job SELECT by full-text query.
+
+    Returns (statement, relevance_order) where relevance_order is an ORDER BY
+    expression (best match first) or None when the backend has no ranking.
+    """
+    if dialect == "sqlite":
+        match = _fts_match_expression(query)
+        if match is None:
+            return statement, None
+        weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+        hits = (
+            text(
+                f"SELECT d.job_id AS job_id, bm25({FTS_TABLE}, {weights}) AS rank "
+                f"FROM {FTS_TABLE} JOIN {FTS_DOCS_TABLE} d ON d.doc_id = {FTS_TABLE}.rowid "
+                f"WHERE {FTS_TABLE} MATCH :match"
+            )
+            .bindparams(match=match)
+            .columns(job_id=String, rank=Float)
+            .subquery("search_hits")
+        )
+        statement = statement.join(hits, hits.c.job_id == Job.id)
+        # bm25()는 값이 작을수록 관련도가 높음
+        return statement, hits.c.rank.asc()
+
+    if dialect in ("mysql", "mariadb"):
+        from sqlalchemy.dialects.mysql import match
+
+        relevance = match(
+            Job.title, Job.description, Job.category, Job.shop_name, against=query
+        ).in_natural_language_mode()
+        statement = statement.where(relevance > 0)
+        return statement, relevance.desc()
+
+    pattern = f"%{query}%"
+    statement = statement.where(
+        or_(
+            Job.title.like(pattern),
+            Job.description.like(pattern),
+            Job.category.like(pattern),
+            Job.shop_name.like(pattern),
+        )
+    )
+    return statement, None
@@ -0,0 +1,90 @@
+"""
+Time-decayed trending score (jobs.trend_score)
+
+popular 정렬이 누적 지원자 수 기준이라 오래된 공고가 계속 상위에 남는 문제를 해결하기 위해,
+최근 조회/지원에 지수 감쇠를 적용한 점수를 공고별 컬럼에 유지합니다.
+
+점수 = Σ 가중치 × 2^(-(현재 - 이벤트 시각) / 반감기)
+
+모든 행을 주기적으로 감쇠시키는 대신, 이벤트 가중치에 2^((이벤트 시각 - 기준 시각) / 반감기)를
+곱해 더합니다. 현재 시각 기준 점수는 모든 공고에 같은 배수만큼 작아지므로 순서는 저장된 값의
+순서와 같고, 이벤트마다 UPDATE trend_score = trend_score + :증가분 한 번(O(1))이면 됩니다.
+(조회는 view_counter의 일괄 UPDATE, 지원은 application_counters의 UPDATE에 함께 반영)
+popular 정렬은 (trend_score, id) 인덱스를 사용합니다.
+
+- 반감기: JOB_TREND_HALF_LIFE_HOURS (기본 72시간)
+- 기준 시각(TREND_EPOCH)으로부터 약 1000 반감기(기본 설정에서 약 8년) 이후에는 float 범위를
+  넘으므로 그 전에 기준 시각을 옮기고 backfill.py trend-score로 다시 계산해야 합니다.
+"""
+import os
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import update
+from sqlmodel import Session, select
+
+from app.models import Application, Job
+
+HALF_LIFE_HOURS = float(os.getenv("JOB_TREND_HALF_LIFE_HOURS", "72"))
+TREND_EPOCH = datetime(2025, 1, 1)
+
+VIEW_WEIGHT = 1.0
+APPLICATION_WEIGHT = 10.0
+
+_BATCH_SIZE = 1000
+
+
+def trend_increment(weight: float, at: Optional[datetime] = None) -> float:
+    """at 시각 이벤트 1건의 trend_score 증가분"""
+    hours = ((at or datetime.utcnow()) - TREND_EPOCH).total_seconds() / 3600
+    return weight * 2 ** (hours / HALF_LIFE_HOURS)
+
+
+def current_trend(score: Optional[float], now: Optional[datetime] = None) -> float:
+    """저장된 trend_score를 현재 시각 기준 감쇠 점수로 환산 (표시용)"""
+    if not score:
+        return 0.0
+    return score / trend_increment(1.0, now)
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def rebuild_trend_scores(session: Session, missing_only: bool = False) -> int:
+    """지원 이력(appliedAt)으로 trend_score 재계산 (backfill용). 과거 조회 이력은 남아 있지 않아 제외"""
+    statement = select(Job.id)
+    if missing_only:
+        statement = statement.where(Job.trend_score.is_(None))
+    job_ids = session.exec(statement).all()
+
+    scores = {job_id: 0.0 for job_id in job_ids}
+    for start in range(0, len(job_ids), _BATCH_SIZE):
+        chunk = job_ids[start:start + _BATCH_SIZE]
+        applied = session.exec(
+            select(Application.jobId, Application.appliedAt).where(Application.jobId.in_(chunk))
+        ).all()
+        for job_id, applied_at in applied:
+            at = _parse_time(applied_at)
+            if at:
+                scores[job_id] += trend_increment(APPLICATION_WEIGHT, at)
+
+    rows = [{"id": job_id, "trend_score": score} for job_id, score in scores.items()]
+    # ORM bulk UPDATE by primary key (executemany)
+    for start in range(0, len(rows), _BATCH_SIZE):
+        session.execute(update(Job), rows[start:start + _BATCH_SIZE])
+    session.commit()
+    return len(rows)
+
+
+def ensure_trend_scores(engine) -> None:
+    """시작 시 trend_score가 비어 있는 공고(컬럼 추가 이전 데이터)를 채움"""
+    with Session(engine) as session:
+        missing = session.exec(select(Job.id).where(Job.trend_score.is_(None)).limit(1)).first()
+        if not missing:
+            return
+        count = rebuild_trend_scores(session, missing_only=True)
+    print(f"Job trend scores filled ({count} jobs)")
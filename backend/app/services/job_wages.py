@@ -0,0 +1,55 @@
+"""
+Hourly-equivalent wage column (jobs.hourly_wage)
+
+wage_type이 hourly/weekly/monthly로 섞여 있어 wage 원값으로는 비교/정렬할 수 없습니다.
+(월급 2,000,000이 모든 시급보다 큼) wage, wage_type, workDays, workHours로 시급을
+환산(matching.hourly_wage)해 정수 컬럼에 저장하고, high-wage 필터/정렬은 이 컬럼의
+(hourly_wage, id) 인덱스를 사용합니다.
+
+- 공고 생성/수정/bulk import 시 set_job_hourly_wage로 함께 저장
+- 기존 공고는 시작 시 ensure_hourly_wages, 또는 scripts/backfill.py hourly-wage로 채움
+"""
+from typing import Optional
+
+from sqlalchemy import update
+from sqlmodel import Session, select
+
+from app.models import Job
+from app.services.matching import hourly_wage
+
+_BATCH_SIZE = 1000
+
+
+def compute_hourly_wage(wage, wage_type, work_days, work_hours) -> Optional[int]:
+    value = hourly_wage(wage, wage_type, work_days, work_hours)
+    return round(value) if value is not None else None
+
+
+def set_job_hourly_wage(job: Job) -> None:
+    job.hourly_wage = compute_hourly_wage(job.wage, job.wage_type, job.workDays, job.workHours)
+
+
+def rebuild_hourly_wages(session: Session, missing_only: bool = False) -> int:
+    """jobs.hourly_wage 재계산 (backfill용). missing_only면 값이 없는 공고만"""
+    statement = select(Job.id, Job.wage, Job.wage_type, Job.workDays, Job.workHours)
+    if missing_only:
+        statement = statement.where(Job.hourly_wage.is_(None))
+    rows = [
+        {"id": job_id, "hourly_wage": compute_hourly_wage(wage, wage_type, work_days, work_hours)}
+        for job_id, wage, wage_type, work_days, work_hours in session.exec(statement).all()
+    ]
+    # ORM bulk UPDATE by primary key (executemany)
+    for start in range(0, len(rows), _BATCH_SIZE):
+        session.execute(update(Job), rows[start:start + _BATCH_SIZE])
+    session.commit()
+    return len(rows)
+
+
+def ensure_hourly_wages(engine) -> None:
+    """시작 시 hourly_wage가 비어 있는 공고(컬럼 추가 이전 데이터)를 채움"""
+    with Session(engine) as session:
+        missing = session.exec(select(Job.id).where(Job.hourly_wage.is_(None)).limit(1)).first()
+        if not missing:
+            return
+        count = rebuild_hourly_wages(session, missing_only=True)
+    print(f"Job hourly wages filled ({count} jobs)")
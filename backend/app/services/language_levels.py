@@ -0,0 +1,27 @@
+"""
+Korean language level labels
+
+레벨 테스트 결과(learning)와 공고/구직자 매칭(matching)이 같은 기준으로
+TOPIK 표기를 프론트엔드의 'Lv.N' 표기로 바꿉니다.
+"""
+
+
+def map_topik_to_lv(label: str) -> str:
+    """Map TOPIK-style labels to frontend 'Lv.x' labels.
+
+    Examples:
+      'TOPIK 1급' -> 'Lv.1 기초'
+      'TOPIK 2급' -> 'Lv.2 초급'
+      'TOPIK 3급' -> 'Lv.3 중급'
+      anything else -> 'Lv.4 상급'
+    """
+    if not label:
+        return "Lv.1 기초"
+    l = label.upper()
+    if "TOPIK 1" in l or "1급" in l:
+        return "Lv.1 기초"
+    if "TOPIK 2" in l or "2급" in l:
+        return "Lv.2 초급"
+    if "TOPIK 3" in l or "3급" in l:
+        return "Lv.3 중급"
+    return "Lv.4 상급"
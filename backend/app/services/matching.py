@@ -0,0 +1,250 @@
+"""
+Job ↔ job seeker matching features
+
+공고와 구직자 프로필을 같은 기준으로 비교하기 위한 정규화 함수 모음입니다.
+추천(job_recommender)과 후보자 매칭에서 함께 사용합니다.
+- 지역: 시/도 단위 ('서울특별시 강남구' -> '서울', 구직자 선호 지역도 시/도 단위)
+- 직종: 구직자 선호 직종 id ('kitchen' 등) -> 공고 업종(category) 집합
+- 요일: 월~일 7비트 마스크 ('월, 화, 수' / 'MON' / '평일' / '월~금')
+- 급여: 시급 환산 (근무 요일/시간으로 주 근로시간을 계산, 알 수 없으면 월 209시간/주 40시간 기준)
+- 한국어: 'Lv.N' 서수 (TOPIK 표기는 language_levels.map_topik_to_lv 기준으로 변환)
+- 비자: 고정 비트 번호의 비트마스크 (jobs.visa_mask, 0 = 제한 없음)
+  목록에 없는 비자는 OTHER_VISA_BIT를 함께 쓰므로 이 비트가 겹치면 requiredVisa 항목과 코드를 직접 비교
+"""
+import json
+import re
+from typing import FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from app.services.geo import province_of
+from app.services.language_levels import map_topik_to_lv
+
+# 월=bit0 ... 일=bit6
+_DAY_BITS = {
+    "월": 0, "화": 1, "수": 2, "목": 3, "금": 4, "토": 5, "일": 6,
+    "mon": 0, "tue": 1, "wed": 2, "thu": 3, "fri": 4, "sat": 5, "sun": 6,
+}
+WEEKDAYS_MASK = 0b0011111
+WEEKEND_MASK = 0b1100000
+ALL_DAYS_MASK = 0b1111111
+
+_DAY_WORDS_RE = re.compile(r"평일|주말|매일|요일 무관|무관|요일")
+_DAY_RANGE_RE = re.compile(r"(월|화|수|목|금|토|일)\s*[~\-]\s*(월|화|수|목|금|토|일)")
+_DAY_TOKEN_RE = re.compile(r"mon|tue|wed|thu|fri|sat|sun|월|화|수|목|금|토|일", re.IGNORECASE)
+
+_TIME_RANGE_RE = re.compile(r"(\d{1,2}):(\d{2})\s*[~\-]\s*(\d{1,2}):(\d{2})")
+_LEVEL_RE = re.compile(r"lv\.?\s*(\d)", re.IGNORECASE)
+_TOPIK_RE = re.compile(r"topik|\d\s*급", re.IGNORECASE)
+_LEVEL_WORDS = {
+    "기초": 1, "basic": 1, "초급": 2, "beginner": 2,
+    "중급": 3, "intermediate": 3, "상급": 4, "고급": 4, "advanced": 4, "fluent": 4,
+}
+MAX_LANGUAGE_LEVEL = 4
+
+# 비자 코드 -> 비트 번호. jobs.visa_mask에 저장되므로 기존 번호는 바꾸지 말고 뒤에 추가
+VISA_BITS = {
+    "E-9": 0, "H-2": 1, "F-4": 2, "F-5": 3, "F-6": 4, "D-10": 5,
+    "H-1": 6, "D-2": 7, "D-4": 8, "G-1": 9, "E-7": 10, "F-2": 11,
+}
+# 목록에 없는 비자 코드 (MySQL INT 범위 안의 마지막 비트, VISA_BITS의 번호와 겹치면 안 됨)
+OTHER_VISA_BIT = 30
+_VISA_CODE_RE = re.compile(r"^([A-Z])-?(\d{1,2})$")
+
+# 월 소정근로시간 (주 40시간 + 주휴) / 주 근로시간 - 근무 시간을 알 수 없을 때 기준
+MONTHLY_WORK_HOURS = 209
+WEEKLY_WORK_HOURS = 40
+WEEKS_PER_MONTH = 365 / 7 / 12
+# 주휴수당 대상 (주 15시간 이상)
+WEEKLY_HOLIDAY_MIN_HOURS = 15
+
+# 구직자 선호 직종 id (온보딩/프로필 화면) -> 공고 업종(category) 값
+PREFERRED_JOB_CATEGORIES = {
+    "store": {"매장관리", "판매", "편의점", "마트"},
+    "service": {"서비스", "고객상담", "숙박", "호텔"},
+    "serving": {"외식업", "서빙", "카페", "음식점"},
+    "kitchen": {"외식업", "주방", "음식점"},
+    "labor": {"생산", "단순노무", "물류", "택배", "제조"},
+    "delivery": {"배달", "운전", "운송"},
+    "event": {"미디어", "행사", "디자인"},
+    "office": {"사무직", "회계", "고객상담", "IT"},
+    "sales": {"영업", "마케팅"},
+}
+
+
+def parse_json_list(value: Optional[str]) -> List[str]:
+    """JSON 배열 문자열 컬럼을 list로 (형식이 깨졌으면 빈 list)"""
+    if not value:
+        return []
+    try:
+        parsed = json.loads(value)
+    except (TypeError, ValueError):
+        return []
+    return [str(item) for item in parsed] if isinstance(parsed, list) else []
+
+
+def job_region(location: Optional[str], shop_address: Optional[str] = None) -> Optional[str]:
+    """공고의 시/도 (location 우선, 없으면 가게 주소)"""
+    return province_of(location) or province_of(shop_address)
+
+
+def preferred_regions(regions: Iterable[str]) -> Set[str]:
+    return {region for region in (province_of(value) for value in regions) if region}
+
+
+def preferred_categories(preferred_jobs: Iterable[str]) -> Set[str]:
+    """선호 직종 id/라벨을 공고 업종 값 집합으로 확장"""
+    categories: Set[str] = set()
+    for value in preferred_jobs:
+        categories |= PREFERRED_JOB_CATEGORIES.get(value, set())
+        # 라벨('서빙', '매장관리 · 판매')을 그대로 저장한 경우
+        categories |= {part.strip() for part in value.split("·") if part.strip()}
+    return categories
+
+
+def workday_mask(days) -> int:
+    """요일 표기(문자열 또는 list)를 7비트 마스크로 변환"""
+    if not days:
+        return 0
+    text = " ".join(days) if isinstance(days, (list, tuple, set)) else str(days)
+    mask = 0
+    if "평일" in text:
+        mask |= WEEKDAYS_MASK
+    if "주말" in text:
+        mask |= WEEKEND_MASK
+    if "매일" in text or "무관" in text:
+        mask |= ALL_DAYS_MASK
+    # '평일'/'월요일'의 '일'이 일요일로 잡히지 않도록 제거
+    text = _DAY_WORDS_RE.sub(" ", text)
+    for start, end in _DAY_RANGE_RE.findall(text):
+        first, last = _DAY_BITS[start], _DAY_BITS[end]
+        if last < first:
+            last += 7  # '금~월' 처럼 주말을 넘어가는 범위
+        for bit in range(first, last + 1):
+            mask |= 1 << (bit % 7)
+    for token in _DAY_TOKEN_RE.findall(text):
+        mask |= 1 << _DAY_BITS[token.lower()]
+    return mask
+
+
+def weekly_paid_hours(work_days, work_hours: Optional[str]) -> Optional[float]:
+    """주 유급 시간 (근로시간 + 주휴시간). 요일/시간을 해석할 수 없으면 None
+
+    하루 근로시간은 법정 휴게시간(4시간 이상 30분, 8시간 이상 1시간)을 뺀 값이고,
+    주 15시간 이상이면 주휴시간(주 근로시간 / 5, 최대 8시간)을 더합니다.
+    """
+    days = bin(workday_mask(work_days)).count("1")
+    span = time_range(work_hours)
+    if not days or not span:
+        return None
+    hours = (span[1] - span[0]) / 60
+    if hours >= 8:
+        hours -= 1
+    elif hours >= 4:
+        hours -= 0.5
+    weekly = days * hours
+    if weekly <= 0:
+        return None
+    if weekly >= WEEKLY_HOLIDAY_MIN_HOURS:
+        weekly += min(weekly, WEEKLY_WORK_HOURS) / 5
+    return weekly
+
+
+def hourly_wage(
+    wage: Optional[int],
+    wage_type: Optional[str],
+    work_days=None,
+    work_hours: Optional[str] = None,
+) -> Optional[float]:
+    """급여를 시급으로 환산 (비교/정렬용)
+
+    근무 요일/시간이 주어지면 실제 주 유급 시간으로, 없으면 월 209시간/주 40시간으로 나눕니다.
+    """
+    if wage is None:
+        return None
+    if wage_type not in ("monthly", "weekly"):
+        return float(wage)
+    weekly = weekly_paid_hours(work_days, work_hours) if work_days and work_hours else None
+    if wage_type == "monthly":
+        return wage / (weekly * WEEKS_PER_MONTH if weekly else MONTHLY_WORK_HOURS)
+    return wage / (weekly or WEEKLY_WORK_HOURS)
+
+
+def language_level(label: Optional[str]) -> int:
+    """한국어 수준 표기를 서수로 ('Lv.2 초급' / 'TOPIK 2급' -> 2, 없음/무관 -> 0)"""
+    if not label:
+        return 0
+    if not _LEVEL_RE.search(label) and _TOPIK_RE.search(label):
+        label = map_topik_to_lv(label)
+    match = _LEVEL_RE.search(label)
+    if match:
+        return min(int(match.group(1)), MAX_LANGUAGE_LEVEL)
+    lowered = label.lower()
+    for word, level in _LEVEL_WORDS.items():
+        if word in lowered:
+            return level
+    return 0
+
+
+def normalize_visa(value: Optional[str]) -> Optional[str]:
+    """'e9' / 'E 9' / 'E-9' -> 'E-9' (형식이 다르면 대문자로만 정리)"""
+    if not value:
+        return None
+    code = re.sub(r"\s+", "", str(value)).upper()
+    match = _VISA_CODE_RE.match(code)
+    return f"{match.group(1)}-{match.group(2)}" if match else code or None
+
+
+def visa_bit(visa: Optional[str]) -> int:
+    """구직자 비자 1개의 비트 (비자 없음 -> 0)"""
+    code = normalize_visa(visa)
+    if not code:
+        return 0
+    return 1 << VISA_BITS.get(code, OTHER_VISA_BIT)
+
+
+def visa_mask(visas: Iterable[str]) -> int:
+    """공고 허용 비자 목록의 비트마스크 (빈 목록 -> 0 = 제한 없음)"""
+    mask = 0
+    for visa in visas:
+        mask |= visa_bit(visa)
+    return mask
+
+
+def unlisted_visas(visas: Iterable[str]) -> FrozenSet[str]:
+    """VISA_BITS에 없는 비자 코드 (정규화) - OTHER_VISA_BIT 하나로는 구분되지 않는 코드"""
+    codes = (normalize_visa(visa) for visa in visas)
+    return frozenset(code for code in codes if code and code not in VISA_BITS)
+
+
+def visa_allowed(job_visa_mask: Optional[int], required_visas: Iterable[str], visa: Optional[str]) -> bool:
+    """공고(visa_mask, requiredVisa 목록)에 비자 visa로 지원 가능한지 (eligibility_clause와 같은 기준)"""
+    if not job_visa_mask:
+        return True
+    code = normalize_visa(visa)
+    if not code:
+        return False
+    if code in VISA_BITS:
+        return bool(job_visa_mask & (1 << VISA_BITS[code]))
+    return bool(job_visa_mask & (1 << OTHER_VISA_BIT)) and code in unlisted_visas(required_visas)
+
+
+def _minutes(hour: str, minute: str) -> int:
+    return int(hour) * 60 + int(minute)
+
+
+def time_range(value: Optional[str]) -> Optional[Tuple[int, int]]:
+    """'09:00-18:00' / '09:00~18:00' -> (540, 1080) 분 단위. 형식이 다르면 None"""
+    if not value:
+        return None
+    match = _TIME_RANGE_RE.search(value)
+    if not match:
+        return None
+    start = _minutes(match.group(1), match.group(2))
+    end = _minutes(match.group(3), match.group(4))
+    return start, end if end > start else end + 24 * 60  # 자정을 넘기는 근무
+
+
+def covers_hours(available: Optional[Tuple[int, int]], required: Optional[Tuple[int, int]]) -> bool:
+    """가능 시간대가 근무 시간을 모두 포함하는지"""
+    if not available or not required:
+        return False
+    return available[0] <= required[0] and required[1] <= available[1]
@@ -0,0 +1,63 @@
+"""
+User notifications (notifications 테이블)
+
+백그라운드 작업(공고 마감 스케줄러 등)이 사용자에게 남기는 이벤트입니다.
+여러 건을 한 번에 남길 때는 executemany INSERT 한 번으로 저장합니다.
+조회는 GET /notifications?user_id= (routers/notifications.py)
+"""
+import json
+import uuid
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import insert
+from sqlmodel import Session
+
+from app.models import Notification
+
+
+def notification_values(
+    user_id: str,
+    type: str,
+    message: str,
+    job_id: Optional[str] = None,
+    application_id: Optional[str] = None,
+    payload: Optional[dict] = None,
+    created_at: Optional[datetime] = None,
+) -> dict:
+    return {
+        "id": f"ntf-{uuid.uuid4().hex[:12]}",
+        "user_id": user_id,
+        "type": type,
+        "job_id": job_id,
+        "application_id": application_id,
+        "message": message,
+        "payload": json.dumps(payload, ensure_ascii=False) if payload is not None else None,
+        "created_at": created_at or datetime.utcnow(),
+        "read_at": None,
+    }
+
+
+def add_notifications(session: Session, rows: List[dict]) -> int:
+    """notification_values 목록을 한 번에 INSERT (commit은 호출자가 수행)"""
+    if rows:
+        session.execute(insert(Notification), rows)
+    return len(rows)
+
+
+def notification_to_dict(notification: Notification) -> dict:
+    try:
+        payload = json.loads(notification.payload) if notification.payload else None
+    except ValueError:
+        payload = None
+    return {
+        "id": notification.id,
+        "user_id": notification.user_id,
+        "type": notification.type,
+        "job_id": notification.job_id,
+        "application_id": notification.application_id,
+        "message": notification.message,
+        "payload": payload,
+        "created_at": notification.created_at,
+        "read_at": notification.read_at,
+    }
@@ -0,0 +1,85 @@
+"""
+Keyset (cursor) pagination helpers
+
+목록을 (정렬 키, id) 기준 내림차순으로 정렬하고, 마지막 행의 (정렬 키, id)를
+불투명한 cursor 토큰으로 돌려줍니다. 다음 페이지는 OFFSET 대신
+"정렬 키가 cursor보다 뒤인 행" 조건으로 조회하므로 페이지 깊이와 무관하게
+같은 인덱스 범위 스캔 비용이 들고, 동시 삽입에도 행이 밀리지 않습니다.
+"""
+import base64
+import json
+from typing import Any, List, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps(list(values), separators=(",", ":"), ensure_ascii=False, default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, size: int) -> List[Any]:
+    """cursor 토큰을 값 목록으로 복원 (형식이 맞지 않으면 400)"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except Exception:
+        raise HTTPException(status_code=400, detail="잘못된 cursor입니다.")
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="잘못된 cursor입니다.")
+    return values
+
+
+def after_cursor(sort_column, id_column, sort_value: Any, id_value: Any):
+    """WHERE condition for rows after (sort_value, id_value) in (sort DESC, id DESC) order.
+
+    NULL 정렬 키는 내림차순에서 가장 뒤에 오므로 (SQLite/MySQL 공통) 별도로 처리합니다.
+    """
+    if sort_value is None:
+        return and_(sort_column.is_(None), id_column < id_value)
+    return or_(
+        sort_column < sort_value,
+        and_(sort_column == sort_value, id_column < id_value),
+        sort_column.is_(None),
+    )
+
+
+def paginate_desc(statement, sort_column, id_column, cursor: Optional[str], parse_sort_value=None):
+    """Order a SELECT by (sort_column DESC, id_column DESC) and apply the cursor.
+
+    parse_sort_value converts the JSON cursor value back to the column's Python
+    type (e.g. datetime.fromisoformat for DateTime columns).
+    """
+    if cursor:
+        sort_value, id_value = decode_cursor(cursor, 2)
+        if sort_value is not None and parse_sort_value:
+            try:
+                sort_value = parse_sort_value(sort_value)
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=400, detail="잘못된 cursor입니다.")
+        statement = statement.where(after_cursor(sort_column, id_column, sort_value, id_value))
+    return statement.order_by(sort_column.desc(), id_column.desc())
+
+
+def paginate_asc(statement, sort_expression, id_column, cursor: Optional[str]):
+    """Order a SELECT by (sort_expression ASC, id_column ASC) and apply the cursor.
+
+    sort_expression은 NULL이 아닌 값이어야 합니다. (반경 검색의 거리처럼 WHERE로 보장되는 식)
+    """
+    if cursor:
+        sort_value, id_value = decode_cursor(cursor, 2)
+        statement = statement.where(or_(
+            sort_expression > sort_value,
+            and_(sort_expression == sort_value, id_column > id_value),
+        ))
+    return statement.order_by(sort_expression.asc(), id_column.asc())
+
+
+def next_cursor(rows: Sequence[Any], limit: Optional[int], key) -> Optional[str]:
+    """페이지가 가득 찼으면 마지막 행의 key(row) = (sort_value, id)로 다음 cursor 생성"""
+    if not limit or len(rows) < limit:
+        return None
+    return encode_cursor(key(rows[-1]))
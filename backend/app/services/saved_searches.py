@@ -0,0 +1,140 @@
+"""
+Saved searches and new-job alerts
+
+구직자가 같은 /jobs 조건을 반복 조회하는 대신, 조건을 저장해 두면 조건에 맞는 공고가
+등록될 때 알림함(notifications, type='saved_search_match')에 넣어줍니다.
+
+조건 (모두 만족해야 매칭, list_jobs와 같은 기준)
+- query: 검색어 토큰(job_search.tokenize)이 모두 공고 제목/설명/업종/가게명에 포함
+- location / industry: 공고 location / category에 포함
+- visa_type: 공고가 해당 비자를 허용 (visa_mask = 0 또는 비트 일치)
+- min_hourly_wage: 공고 시급 환산 급여(hourly_wage) 이상
+
+역색인 (saved_search_keys)
+저장 검색마다 대표 조건 토큰 1개(검색어 > 지역 > 업종 순, 조건이 없으면 '*')를 키로 저장합니다.
+공고 등록 시 공고에서 나올 수 있는 키 집합으로 후보 저장 검색만 조회한 뒤 나머지 조건을
+Python에서 확인하므로, 저장 검색 전체를 훑지 않습니다.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import delete
+from sqlmodel import Session, select
+
+from app.models import Job, SavedSearch, SavedSearchKey
+from app.services.job_search import SEARCH_COLUMNS, tokenize
+from app.services.matching import parse_json_list, visa_allowed
+from app.services.notifications import add_notifications, notification_values
+
+MAX_SAVED_SEARCHES_PER_USER = 20
+WILDCARD_KEY = "*"
+# IN (...) 한 번에 넣을 키 수
+_KEY_CHUNK_SIZE = 500
+
+
+def _anchor_token(value: Optional[str]) -> Optional[str]:
+    """조건 값에서 대표 토큰 (가장 뒤의 2글자 이상 토큰 - 보통 더 구체적인 부분)"""
+    tokens = [token for token in tokenize(value) if len(token) > 1]
+    return tokens[-1] if tokens else None
+
+
+def search_key(search: SavedSearch) -> str:
+    """저장 검색의 역색인 키"""
+    for prefix, value in (("q", search.query), ("loc", search.location), ("cat", search.industry)):
+        token = _anchor_token(value)
+        if token:
+            return f"{prefix}:{token}"
+    return WILDCARD_KEY
+
+
+def _document_tokens(job: Job) -> Set[str]:
+    tokens: Set[str] = set()
+    for column in SEARCH_COLUMNS:
+        tokens.update(tokenize(getattr(job, column)))
+    return tokens
+
+
+def job_keys(job: Job, document_tokens: Set[str]) -> Set[str]:
+    """공고와 매칭될 수 있는 저장 검색 키 전체"""
+    keys = {WILDCARD_KEY}
+    keys.update(f"q:{token}" for token in document_tokens)
+    keys.update(f"loc:{token}" for token in tokenize(job.location))
+    keys.update(f"cat:{token}" for token in tokenize(job.category))
+    return keys
+
+
+def search_matches(search: SavedSearch, job: Job, document_tokens: Set[str]) -> bool:
+    """저장 검색의 모든 조건을 공고가 만족하는지"""
+    if search.query:
+        for token in tokenize(search.query):
+            if token in document_tokens:
+                continue
+            # 한 글자 검색어는 2-gram 접두어로 (apply_search와 같은 기준)
+            if len(token) == 1 and any(candidate.startswith(token) for candidate in document_tokens):
+                continue
+            return False
+    if search.location and search.location not in (job.location or ""):
+        return False
+    if search.industry and search.industry not in (job.category or ""):
+        return False
+    if search.visa_type and not visa_allowed(job.visa_mask, parse_json_list(job.requiredVisa), search.visa_type):
+        return False
+    if search.min_hourly_wage and (job.hourly_wage or 0) < search.min_hourly_wage:
+        return False
+    return True
+
+
+def index_saved_search(session: Session, search: SavedSearch) -> None:
+    """저장 검색의 역색인 키 저장 (commit은 호출자가 수행)"""
+    session.execute(delete(SavedSearchKey).where(SavedSearchKey.search_id == search.id))
+    session.add(SavedSearchKey(key=search_key(search), search_id=search.id))
+
+
+def remove_saved_search(session: Session, search: SavedSearch) -> None:
+    session.execute(delete(SavedSearchKey).where(SavedSearchKey.search_id == search.id))
+    session.delete(search)
+
+
+def _candidates(session: Session, keys: Iterable[str]) -> Dict[str, List[SavedSearch]]:
+    """키 -> 해당 키로 색인된 저장 검색 목록"""
+    keys = list(keys)
+    by_key: Dict[str, List[SavedSearch]] = defaultdict(list)
+    for start in range(0, len(keys), _KEY_CHUNK_SIZE):
+        rows = session.exec(
+            select(SavedSearchKey.key, SavedSearch)
+            .join(SavedSearch, SavedSearch.id == SavedSearchKey.search_id)
+            .where(SavedSearchKey.key.in_(keys[start:start + _KEY_CHUNK_SIZE]))
+        ).all()
+        for key, search in rows:
+            by_key[key].append(search)
+    return by_key
+
+
+def notify_matching_searches(session: Session, jobs: List[Job]) -> int:
+    """새 공고(들)에 맞는 저장 검색의 사용자에게 알림 추가 - 사용자/공고당 1건 (commit은 호출자가 수행)"""
+    jobs = [job for job in jobs if job.status == "active"]
+    if not jobs:
+        return 0
+    documents = {job.id: _document_tokens(job) for job in jobs}
+    keys_by_job = {job.id: job_keys(job, documents[job.id]) for job in jobs}
+    candidates = _candidates(session, set().union(*keys_by_job.values()))
+    if not candidates:
+        return 0
+
+    rows = []
+    for job in jobs:
+        matched: Dict[str, List[SavedSearch]] = defaultdict(list)
+        for key in keys_by_job[job.id]:
+            for search in candidates.get(key, ()):
+                if search_matches(search, job, documents[job.id]):
+                    matched[search.user_id].append(search)
+        for user_id, searches in matched.items():
+            names = ", ".join(search.name for search in searches)
+            rows.append(notification_values(
+                user_id=user_id,
+                type="saved_search_match",
+                message=f"저장한 검색 '{names}'에 맞는 새 공고: {job.title}",
+                job_id=job.id,
+                payload={"saved_search_ids": [search.id for search in searches]},
+            ))
+    return add_notifications(session, rows)
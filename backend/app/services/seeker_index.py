@@ -0,0 +1,328 @@
+"""
+Job seeker matching index
+
+구직자 프로필을 프로세스 메모리의 비트셋(파이썬 int, 비트 i = 색인 행 i)으로 색인합니다.
+- 선호 지역(시/도)별, 선호 직종이 포함하는 공고 업종별, 비자(정규화 코드)별, 근무 가능 요일별 비트셋
+- 근무 가능 시간대는 (시작, 종료)별 비트셋 - 공고 근무 시간을 포함하는 시간대의 비트셋을 OR
+- 한국어 수준은 'Lv.N 이상' 비트셋 (N = 1..4)
+
+공고 하나에 대한 후보자 점수는 공고 조건에 해당하는 비트셋 몇 개를 OR/AND한 뒤
+NumPy로 풀어(unpackbits) 한 번에 계산합니다. 프로필 행 전체를 다시 읽거나
+구직자마다 조회할 필요가 없습니다.
+
+프로필 생성/수정 시 해당 행만 갱신하고, 다른 워커 프로세스의 변경을 반영하기 위해
+SEEKER_INDEX_REFRESH_SECONDS(기본 300초)마다 전체를 다시 적재합니다.
+"""
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlmodel import Session, select
+
+from app.models import Job, JobSeeker, JobSeekerProfile
+from app.services.matching import (
+    MAX_LANGUAGE_LEVEL,
+    covers_hours,
+    job_region,
+    language_level,
+    normalize_visa,
+    parse_json_list,
+    preferred_categories,
+    preferred_regions,
+    time_range,
+    workday_mask,
+)
+
+REFRESH_SECONDS = float(os.getenv("SEEKER_INDEX_REFRESH_SECONDS", "300"))
+
+# 점수 가중치 (job_recommender와 같은 기준)
+REGION_WEIGHT = 3.0
+CATEGORY_WEIGHT = 3.0
+WORKDAY_WEIGHT = 2.0
+HOURS_WEIGHT = 1.0
+LANGUAGE_WEIGHT = 1.0
+
+_DAY_NAMES = ("월", "화", "수", "목", "금", "토", "일")
+
+
+def _pack(rows: List[int], size: int) -> int:
+    """행 번호 목록 -> 비트셋 int (전체 적재 시 한 번에 생성)"""
+    flags = np.zeros(size, dtype=bool)
+    flags[rows] = True
+    return int.from_bytes(np.packbits(flags, bitorder="little").tobytes(), "little")
+
+
+def _unpack(bits: int, size: int) -> np.ndarray:
+    """비트셋 int -> 길이 size의 bool 배열"""
+    raw = np.frombuffer(bits.to_bytes((size + 7) // 8 or 1, "little"), dtype=np.uint8)
+    return np.unpackbits(raw, bitorder="little")[:size].astype(bool)
+
+
+class _SeekerRow:
+    __slots__ = ("user_id", "regions", "categories", "visa", "days", "level", "hours")
+
+    def __init__(self, user_id, regions, categories, visa, days, level, hours):
+        self.user_id = user_id
+        self.regions: Set[str] = regions
+        self.categories: Set[str] = categories
+        self.visa: Optional[str] = visa
+        self.days: int = days
+        self.level: int = level
+        self.hours: Optional[Tuple[int, int]] = hours
+
+
+class SeekerIndex:
+    """구직자 프로필 비트셋 색인 (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._loaded_at: Optional[float] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._rows: List[Optional[_SeekerRow]] = []
+        self._row_of: Dict[str, int] = {}
+        self._free_rows: List[int] = []
+        self._present = 0
+        self._by_region: Dict[str, int] = {}
+        self._by_category: Dict[str, int] = {}
+        self._by_visa: Dict[str, int] = {}
+        self._no_visa = 0
+        self._by_day = [0] * 7
+        self._by_hours: Dict[Tuple[int, int], int] = {}
+        self._level_at_least = [0] * (MAX_LANGUAGE_LEVEL + 1)
+
+    # --- 색인 갱신 ---
+
+    @staticmethod
+    def _add_bit(table: Dict[str, int], keys: Iterable[str], bit: int) -> None:
+        for key in keys:
+            table[key] = table.get(key, 0) | bit
+
+    @staticmethod
+    def _clear_bit(table: Dict[str, int], keys: Iterable[str], bit: int) -> None:
+        for key in keys:
+            remaining = table.get(key, 0) & ~bit
+            if remaining:
+                table[key] = remaining
+            else:
+                table.pop(key, None)
+
+    def _remove_row(self, user_id: str) -> None:
+        row_index = self._row_of.pop(user_id, None)
+        if row_index is None:
+            return
+        row = self._rows[row_index]
+        bit = 1 << row_index
+        self._present &= ~bit
+        self._clear_bit(self._by_region, row.regions, bit)
+        self._clear_bit(self._by_category, row.categories, bit)
+        if row.visa:
+            self._clear_bit(self._by_visa, [row.visa], bit)
+        self._no_visa &= ~bit
+        self._by_day = [bits & ~bit for bits in self._by_day]
+        if row.hours:
+            self._clear_bit(self._by_hours, [row.hours], bit)
+        self._level_at_least = [bits & ~bit for bits in self._level_at_least]
+        self._rows[row_index] = None
+        self._free_rows.append(row_index)
+
+    @staticmethod
+    def _make_row(profile: JobSeekerProfile, language_label: Optional[str]) -> _SeekerRow:
+        return _SeekerRow(
+            user_id=profile.user_id,
+            regions=preferred_regions(parse_json_list(profile.preferred_regions)),
+            categories=preferred_categories(parse_json_list(profile.preferred_jobs)),
+            visa=normalize_visa(profile.visa_type),
+            days=workday_mask(parse_json_list(profile.work_days_of_week)),
+            level=language_level(language_label),
+            hours=time_range(f"{profile.work_start_time}-{profile.work_end_time}"),
+        )
+
+    def _add_row(self, profile: JobSeekerProfile, language_label: Optional[str]) -> None:
+        self._remove_row(profile.user_id)
+        if self._free_rows:
+            row_index = self._free_rows.pop()
+        else:
+            row_index = len(self._rows)
+            self._rows.append(None)
+        row = self._make_row(profile, language_label)
+        bit = 1 << row_index
+        self._rows[row_index] = row
+        self._row_of[row.user_id] = row_index
+        self._present |= bit
+        self._add_bit(self._by_region, row.regions, bit)
+        self._add_bit(self._by_category, row.categories, bit)
+        if row.visa:
+            self._add_bit(self._by_visa, [row.visa], bit)
+        else:
+            self._no_visa |= bit
+        for day in range(7):
+            if row.days & (1 << day):
+                self._by_day[day] |= bit
+        if row.hours:
+            self._add_bit(self._by_hours, [row.hours], bit)
+        for level in range(1, row.level + 1):
+            self._level_at_least[level] |= bit
+
+    def load(self, session: Session) -> int:
+        """구직자 프로필 전체 재적재 (한국어 수준은 jobseekers.languageLevel)"""
+        rows = session.exec(
+            select(JobSeekerProfile, JobSeeker.languageLevel).outerjoin(
+                JobSeeker, JobSeeker.id == JobSeekerProfile.user_id
+            )
+        ).all()
+        # user_id당 한 행 (중복 프로필이 있으면 마지막 것)
+        seekers = list({
+            profile.user_id: self._make_row(profile, language_label) for profile, language_label in rows
+        }.values())
+        with self._lock:
+            self._reset()
+            self._build(seekers)
+            self._loaded_at = time.monotonic()
+        return len(seekers)
+
+    def _build(self, seekers: List[_SeekerRow]) -> None:
+        """전체 적재: 키별 행 번호를 모은 뒤 비트셋을 한 번에 생성 (행마다 큰 int를 OR하지 않음)"""
+        size = len(seekers)
+        by_region: Dict[str, List[int]] = {}
+        by_category: Dict[str, List[int]] = {}
+        by_visa: Dict[str, List[int]] = {}
+        no_visa: List[int] = []
+        by_day: List[List[int]] = [[] for _ in range(7)]
+        by_hours: Dict[Tuple[int, int], List[int]] = {}
+        level_at_least: List[List[int]] = [[] for _ in range(MAX_LANGUAGE_LEVEL + 1)]
+        for row_index, row in enumerate(seekers):
+            self._rows.append(row)
+            self._row_of[row.user_id] = row_index
+            for region in row.regions:
+                by_region.setdefault(region, []).append(row_index)
+            for category in row.categories:
+                by_category.setdefault(category, []).append(row_index)
+            if row.visa:
+                by_visa.setdefault(row.visa, []).append(row_index)
+            else:
+                no_visa.append(row_index)
+            for day in range(7):
+                if row.days & (1 << day):
+                    by_day[day].append(row_index)
+            if row.hours:
+                by_hours.setdefault(row.hours, []).append(row_index)
+            for level in range(1, row.level + 1):
+                level_at_least[level].append(row_index)
+
+        self._present = _pack(list(range(size)), size)
+        self._by_region = {key: _pack(rows, size) for key, rows in by_region.items()}
+        self._by_category = {key: _pack(rows, size) for key, rows in by_category.items()}
+        self._by_visa = {key: _pack(rows, size) for key, rows in by_visa.items()}
+        self._no_visa = _pack(no_visa, size)
+        self._by_day = [_pack(rows, size) for rows in by_day]
+        self._by_hours = {key: _pack(rows, size) for key, rows in by_hours.items()}
+        self._level_at_least = [_pack(rows, size) for rows in level_at_least]
+
+    def ensure_loaded(self, session: Session) -> None:
+        with self._lock:
+            fresh = self._loaded_at is not None and time.monotonic() - self._loaded_at < REFRESH_SECONDS
+        if not fresh:
+            count = self.load(session)
+            print(f"[DEBUG] seeker_index - 구직자 프로필 {count}개 적재")
+
+    def upsert(self, session: Session, profile: JobSeekerProfile) -> None:
+        """프로필 쓰기 후 호출 (commit 이후)"""
+        with self._lock:
+            if self._loaded_at is None:
+                return  # 아직 적재 전 - 첫 후보자 조회 시 전체 적재
+        jobseeker = session.get(JobSeeker, profile.user_id)
+        with self._lock:
+            self._add_row(profile, jobseeker.languageLevel if jobseeker else None)
+
+    # --- 매칭 ---
+
+    def _union(self, table: Dict[str, int], keys: Iterable[str]) -> int:
+        bits = 0
+        for key in keys:
+            bits |= table.get(key, 0)
+        return bits
+
+    def _covering_hours(self, hours: Optional[Tuple[int, int]]) -> int:
+        """공고 근무 시간을 모두 포함하는 근무 가능 시간대의 구직자 비트셋 (서로 다른 시간대 수만큼 비교)"""
+        if not hours:
+            return 0
+        covering = [available for available in self._by_hours if covers_hours(available, hours)]
+        return self._union(self._by_hours, covering)
+
+    def _reasons(self, row: _SeekerRow, job: Job, region: Optional[str], days: int,
+                 hours: Optional[Tuple[int, int]], visas: List[str], level: int) -> List[str]:
+        reasons = []
+        if region and region in row.regions:
+            reasons.append(f"선호 지역 일치 ({region})")
+        if job.category in row.categories:
+            reasons.append(f"선호 직종 일치 ({job.category})")
+        if days and row.days & days:
+            matched = [_DAY_NAMES[d] for d in range(7) if row.days & days & (1 << d)]
+            reasons.append(f"근무 가능 요일 {len(matched)}/{bin(days).count('1')}일 ({', '.join(matched)})")
+        if covers_hours(row.hours, hours):
+            reasons.append(f"근무 가능 시간 ({job.workHours})")
+        if visas and row.visa in visas:
+            reasons.append(f"비자 요건 충족 ({row.visa})")
+        if level and row.level >= level:
+            reasons.append(f"한국어 Lv.{row.level} (요구 Lv.{level} 이상)")
+        return reasons
+
+    def top_k(self, job: Job, k: int, exclude: Iterable[str] = ()) -> List[dict]:
+        """공고에 맞는 상위 k명 [{user_id, score, reasons}]
+
+        공고가 요구하는 비자가 있으면 해당 비자가 아닌 구직자는 제외합니다. ('E9'/'e-9 '/'E-9'는 같은 비자)
+        (비자 정보가 없는 구직자는 후보로 남기되 비자 사유는 붙지 않음)
+        """
+        region = job_region(job.location, job.shop_address)
+        visas = [code for code in map(normalize_visa, parse_json_list(job.requiredVisa)) if code]
+        days = workday_mask(job.workDays)
+        hours = time_range(job.workHours)
+        level = language_level(job.requiredLanguage)
+
+        with self._lock:
+            size = len(self._rows)
+            if size == 0:
+                return []
+            eligible = self._present
+            if visas:
+                eligible &= self._union(self._by_visa, visas) | self._no_visa
+            for user_id in exclude:
+                if user_id in self._row_of:
+                    eligible &= ~(1 << self._row_of[user_id])
+            if not eligible:
+                return []
+
+            score = np.zeros(size, dtype=np.float32)
+            if region:
+                score += REGION_WEIGHT * _unpack(self._by_region.get(region, 0), size)
+            score += CATEGORY_WEIGHT * _unpack(self._by_category.get(job.category, 0), size)
+            if days:
+                overlap = np.zeros(size, dtype=np.float32)
+                for day in range(7):
+                    if days & (1 << day):
+                        overlap += _unpack(self._by_day[day], size)
+                score += WORKDAY_WEIGHT * overlap / bin(days).count("1")
+            if hours:
+                score += HOURS_WEIGHT * _unpack(self._covering_hours(hours), size)
+            if level:
+                score += LANGUAGE_WEIGHT * _unpack(self._level_at_least[min(level, MAX_LANGUAGE_LEVEL)], size)
+            score = np.where(_unpack(eligible, size), score, -np.inf)
+
+            k = min(k, bin(eligible).count("1"))
+            top = np.argpartition(-score, k - 1)[:k]
+            top = top[np.argsort(-score[top], kind="stable")]
+            return [
+                {
+                    "user_id": self._rows[row_index].user_id,
+                    "score": round(float(score[row_index]), 3),
+                    "reasons": self._reasons(self._rows[row_index], job, region, days, hours, visas, level),
+                }
+                for row_index in top
+            ]
+
+
+seeker_index = SeekerIndex()
@@ -0,0 +1,65 @@
+"""
+Process-local TTL cache
+
+집계성 조회(공고 facet 등)를 짧은 시간 동안 프로세스 메모리에 보관합니다.
+- 항목은 ttl초 후 만료, 가장 오래된 항목부터 max_entries개까지만 유지
+- 쓰기 경로에서 invalidate()를 호출하면 즉시 비움
+  (계산 도중에 invalidate된 결과는 저장하지 않음 - 세대 번호 비교)
+다른 워커 프로세스의 쓰기는 ttl 이내에 반영됩니다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache:
+    def __init__(self, ttl: float, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, object]]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[object]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def _store(self, key: Hashable, value: object, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return  # 계산 중에 무효화됨
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """캐시된 값 또는 compute() 결과 (결과를 캐시에 저장)"""
+        value = self.get(key)
+        if value is not None:
+            return value
+        with self._lock:
+            generation = self._generation
+        value = compute()
+        self._store(key, value, generation)
+        return value
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> None:
+        """전체(또는 predicate(key)가 참인 항목) 무효화"""
+        with self._lock:
+            self._generation += 1
+            if predicate is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
@@ -0,0 +1,97 @@
+"""
+Buffered job view counter
+
+공고 상세 조회마다 jobs.views를 UPDATE/commit하던 방식 대신, 프로세스 메모리에
+공고별 증가분을 모아두었다가 주기적으로 한 번의 UPDATE ... CASE 문으로 반영합니다.
+- 상세 조회(GET /jobs/{id})는 읽기 전용 트랜잭션이 됨
+- 인기 공고 행에 대한 쓰기 잠금 경합이 사라짐
+- 증가분은 누적(views = views + n)으로 반영하므로 여러 워커 프로세스에서도 안전
+- 같은 UPDATE에서 인기 점수(trend_score)도 조회 수만큼 증가 (job_trends)
+
+flush 주기는 JOB_VIEW_FLUSH_SECONDS (기본 10초)이며, 서버 종료 시에도 flush합니다.
+프로세스가 비정상 종료되면 마지막 주기 동안의 조회수는 유실될 수 있습니다.
+"""
+import asyncio
+import os
+import threading
+from typing import Dict
+
+from sqlalchemy import case, func, update
+
+from app.models import Job
+from app.services.job_trends import VIEW_WEIGHT, trend_increment
+
+FLUSH_INTERVAL_SECONDS = float(os.getenv("JOB_VIEW_FLUSH_SECONDS", "10"))
+
+
+class ViewCounter:
+    """공고별 조회수 증가분 버퍼 (thread-safe)"""
+
+    def __init__(self):
+        self._pending: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, job_id: str) -> int:
+        """조회 1회 기록 후 아직 반영되지 않은 증가분 반환"""
+        with self._lock:
+            count = self._pending.get(job_id, 0) + 1
+            self._pending[job_id] = count
+            return count
+
+    def pending(self, job_id: str) -> int:
+        with self._lock:
+            return self._pending.get(job_id, 0)
+
+    def discard(self, job_id: str) -> None:
+        """삭제된 공고의 증가분 제거"""
+        with self._lock:
+            self._pending.pop(job_id, None)
+
+    def _drain(self) -> Dict[str, int]:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            return pending
+
+    def _restore(self, counts: Dict[str, int]) -> None:
+        with self._lock:
+            for job_id, count in counts.items():
+                self._pending[job_id] = self._pending.get(job_id, 0) + count
+
+    def flush(self, engine) -> int:
+        """버퍼를 한 번의 UPDATE로 반영. 반영한 공고 수 반환 (실패 시 버퍼에 되돌림)"""
+        counts = self._drain()
+        if not counts:
+            return 0
+        increment = case(counts, value=Job.id, else_=0)
+        # flush 시각 기준 감쇠 가중치 (조회 시각과의 차이는 flush 주기 이내)
+        unit = trend_increment(VIEW_WEIGHT)
+        trend = case({job_id: count * unit for job_id, count in counts.items()}, value=Job.id, else_=0.0)
+        statement = (
+            update(Job)
+            .where(Job.id.in_(list(counts)))
+            .values(
+                views=func.coalesce(Job.views, 0) + increment,
+                trend_score=func.coalesce(Job.trend_score, 0.0) + trend,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            with engine.begin() as conn:
+                conn.execute(statement)
+        except Exception as exc:
+            print(f"[ERROR] view_counter.flush - 조회수 반영 실패 ({len(counts)}건, 다음 주기에 재시도): {exc}")
+            self._restore(counts)
+            return 0
+        return len(counts)
+
+
+view_counter = ViewCounter()
+
+
+async def run_periodic_flush(engine, interval: float = FLUSH_INTERVAL_SECONDS) -> None:
+    """lifespan에서 백그라운드 task로 실행 - interval마다 버퍼 flush"""
+    while True:
+        await asyncio.sleep(interval)
+        flushed = await asyncio.to_thread(view_counter.flush, engine)
+        if flushed:
+            print(f"[DEBUG] view_counter - {flushed}개 공고 조회수 반영")
@@ -0,0 +1,52 @@
+-- Migration: Add search/counter/ownership columns and indexes to existing MySQL tables
+-- 앱 시작 시 scripts/ensure_schema.py(ensure_columns/ensure_indexes)가 같은 작업을 하지만,
+-- 운영 DB는 배포 전에 이 SQL로 먼저 적용하는 것을 권장합니다.
+-- 새 테이블(job_cards, job_application_stats, coordination_messages, *_archive 등)은
+-- 앱 시작 시 create_all로 생성되고, 새 컬럼 값(NULL)은 시작 시 ensure_* 작업이 채웁니다.
+-- NULL로 남겨야 backfill 대상이 되므로 version 외에는 DEFAULT를 두지 않습니다.
+
+ALTER TABLE jobs
+ADD COLUMN latitude DOUBLE NULL COMMENT '위도 (오프라인 지오코딩)',
+ADD COLUMN longitude DOUBLE NULL COMMENT '경도 (오프라인 지오코딩)',
+ADD COLUMN geo_cell VARCHAR(64) NULL COMMENT '반경 검색용 격자 셀 키',
+ADD COLUMN visa_mask INT NULL COMMENT 'requiredVisa 비트마스크 (0 = 제한 없음)',
+ADD COLUMN lang_level INT NULL COMMENT 'requiredLanguage 서수 (0 = 무관, 1~4)',
+ADD COLUMN hourly_wage INT NULL COMMENT '시급 환산 급여 (원)',
+ADD COLUMN trend_score DOUBLE NULL COMMENT '시간 감쇠 인기 점수',
+ADD COLUMN owner_user_id VARCHAR(50) NULL COMMENT '공고 소유 고용주 (signup_users.id)';
+
+ALTER TABLE stores
+ADD COLUMN latitude DOUBLE NULL COMMENT '위도 (오프라인 지오코딩)',
+ADD COLUMN longitude DOUBLE NULL COMMENT '경도 (오프라인 지오코딩)';
+
+-- 낙관적 동시성 제어 - 기존 지원서는 1로 채워짐
+ALTER TABLE applications
+ADD COLUMN version INT NOT NULL DEFAULT 1 COMMENT '낙관적 잠금 버전';
+
+-- jobs
+CREATE INDEX ix_jobs_employerId ON jobs (employerId);
+CREATE INDEX ix_jobs_category ON jobs (category);
+CREATE INDEX ix_jobs_status ON jobs (status);
+CREATE INDEX ix_jobs_store_id ON jobs (store_id);
+CREATE INDEX ix_jobs_geo_cell ON jobs (geo_cell);
+CREATE INDEX ix_jobs_postedAt_id ON jobs (postedAt, id);
+CREATE INDEX ix_jobs_wage_id ON jobs (wage, id);
+CREATE INDEX ix_jobs_hourly_wage_id ON jobs (hourly_wage, id);
+CREATE INDEX ix_jobs_applications_id ON jobs (applications, id);
+CREATE INDEX ix_jobs_trend_score_id ON jobs (trend_score, id);
+CREATE INDEX ix_jobs_status_deadline ON jobs (status, deadline);
+CREATE INDEX ix_jobs_lang_level_visa_mask ON jobs (lang_level, visa_mask);
+CREATE INDEX ix_jobs_owner_user_id_postedAt ON jobs (owner_user_id, postedAt);
+
+-- applications
+CREATE INDEX ix_applications_seekerId ON applications (seekerId);
+CREATE INDEX ix_applications_jobId ON applications (jobId);
+CREATE INDEX ix_applications_appliedAt_applicationId ON applications (appliedAt, applicationId);
+CREATE INDEX ix_applications_updatedAt_applicationId ON applications (updatedAt, applicationId);
+
+-- 기타
+CREATE INDEX ix_employers_businessNo ON employers (businessNo);
+CREATE INDEX ix_employer_profiles_user_id ON employer_profiles (user_id);
+CREATE INDEX ix_stores_user_id ON stores (user_id);
+CREATE INDEX ix_job_seeker_profiles_visa_type ON job_seeker_profiles (visa_type);
+CREATE INDEX ix_job_seeker_profiles_created_at_id ON job_seeker_profiles (created_at, id);
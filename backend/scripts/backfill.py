@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Backfill / reconcile denormalized data from the source tables.
+
+Each subcommand is idempotent and can be re-run at any time:
+  python scripts/backfill.py application-counts   # Job.applications + job_application_stats + application_status_rollups
+  python scripts/backfill.py search-index         # SQLite FTS5 job search index
+  python scripts/backfill.py geo                  # stores/jobs latitude, longitude, geo_cell
+  python scripts/backfill.py job-cards            # job_cards list projection
+  python scripts/backfill.py job-owners           # jobs/jobs_archive.owner_user_id
+  python scripts/backfill.py eligibility          # jobs.visa_mask / jobs.lang_level
+  python scripts/backfill.py hourly-wage          # jobs.hourly_wage
+  python scripts/backfill.py trend-score          # jobs.trend_score (from application history)
+  python scripts/backfill.py coordination-messages  # applications.coordinationMessages -> coordination_messages
+
+Uses the same database settings as the app (app.db).
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlmodel import Session  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.db import create_db_and_tables, engine  # noqa: E402
+
+
+def backfill_application_counts(session: Session) -> None:
+    from app.services.application_counters import reconcile_application_counts
+
+    changed = reconcile_application_counts(session)
+    print(f"Application counters reconciled ({changed} jobs corrected)")
+
+
+def backfill_search_index(session: Session) -> None:
+    from app.services.job_search import ensure_search_index, rebuild_search_index
+
+    ensure_search_index(engine)
+    count = rebuild_search_index(session)
+    print(f"Search index rebuilt ({count} jobs indexed)")
+
+
+def backfill_geo(session: Session) -> None:
+    from sqlmodel import select
+
+    from app.models import Job, Store
+    from app.services.geo import geocode_address, set_job_coordinates
+
+    store_points = {}
+    for store in session.exec(select(Store)).all():
+        point = geocode_address(store.address)
+        store.latitude, store.longitude = point or (None, None)
+        store_points[store.id] = point
+        session.add(store)
+
+    located = 0
+    jobs = session.exec(select(Job)).all()
+    for job in jobs:
+        point = store_points.get(job.store_id) or geocode_address(job.shop_address, job.location)
+        set_job_coordinates(job, point)
+        located += point is not None
+        session.add(job)
+    session.commit()
+    print(f"Geocoded {len(store_points)} stores, {located}/{len(jobs)} jobs")
+
+
+def backfill_job_cards(session: Session) -> None:
+    from app.services.job_cards import rebuild_job_cards
+
+    count = rebuild_job_cards(session)
+    print(f"Job cards rebuilt ({count} jobs)")
+
+
+def backfill_job_owners(session: Session) -> None:
+    from app.services.job_owners import rebuild_job_owners
+
+    count = rebuild_job_owners(session)
+    print(f"Job owners rebuilt ({count} jobs)")
+
+
+def backfill_coordination_messages(session: Session) -> None:
+    from app.services.coordination_messages import migrate_coordination_blobs
+
+    count = migrate_coordination_blobs(session)
+    print(f"Coordination messages migrated ({count} messages)")
+
+
+def backfill_eligibility(session: Session) -> None:
+    from app.services.job_eligibility import rebuild_job_eligibility
+
+    count = rebuild_job_eligibility(session)
+    print(f"Job eligibility columns rebuilt ({count} jobs)")
+
+
+def backfill_hourly_wage(session: Session) -> None:
+    from app.services.job_wages import rebuild_hourly_wages
+
+    count = rebuild_hourly_wages(session)
+    print(f"Job hourly wages rebuilt ({count} jobs)")
+
+
+def backfill_trend_score(session: Session) -> None:
+    from app.services.job_trends import rebuild_trend_scores
+
+    count = rebuild_trend_scores(session)
+    print(f"Job trend scores rebuilt ({count} jobs)")
+
+
+COMMANDS = {
+    "application-counts": backfill_application_counts,
+    "search-index": backfill_search_index,
+    "geo": backfill_geo,
+    "job-cards": backfill_job_cards,
+    "job-owners": backfill_job_owners,
+    "eligibility": backfill_eligibility,
+    "hourly-wage": backfill_hourly_wage,
+    "trend-score": backfill_trend_score,
+    "coordination-messages": backfill_coordination_messages,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=sorted(COMMANDS) + ["all"])
+    args = parser.parse_args()
+
+    create_db_and_tables()
+    commands = list(COMMANDS) if args.command == "all" else [args.command]
+    for name in commands:
+        with Session(engine) as session:
+            print(f"== {name}")
+            COMMANDS[name](session)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,12 @@ This script is idempotent and safe:
 - It inspects SQLModel.metadata to find table/column definitions.
 - For each table it queries the live database with SQLAlchemy inspector to get existing columns.
 - It only issues ALTER TABLE ... ADD COLUMN for columns that are missing.
-- New columns are added without NOT NULL constraints or non-trivial defaults to avoid destructive changes.
+- New columns are added as nullable (existing rows stay NULL so the startup backfills can
+  find them), except columns the models declare NOT NULL with a scalar default
+  (e.g. applications.version), which get NOT NULL DEFAULT <value> so existing rows are filled.
+- DDL is dialect-aware: identifiers are quoted by the target dialect (backticks on MySQL)
+  and types are compiled for it (VARCHAR(n)/DOUBLE on MySQL so the columns can be indexed).
+  For a manual MySQL upgrade see migrations/add_performance_columns.sql.
 
 Run with the project's Python (use the venv for exact environment):
   ./venv/bin/python3 scripts/ensure_schema.py
@@ -32,8 +37,11 @@ def sqlite_type_for_column(col):
     try:
         t = col.type
         # Use isinstance checks for common SQLAlchemy types
-        if isinstance(t, sqltypes.Integer):
+        if isinstance(t, (sqltypes.Integer, sqltypes.Boolean)):
             return "INTEGER"
+        # Float/Double -> REAL (TEXT affinity would store numbers as text and break ordering)
+        if isinstance(t, sqltypes.Float):
+            return "REAL"
         # Treat String/VARCHAR/CHAR/etc as TEXT in SQLite
         if isinstance(t, (sqltypes.String, sqltypes.VARCHAR, sqltypes.Text)):
             return "TEXT"
@@ -46,6 +54,53 @@ def sqlite_type_for_column(col):
         return "TEXT"
 
 
+def mysql_type_for_column(col, dialect):
+    """Return a MySQL column type for a SQLAlchemy Column object.
+
+    Length-less strings become VARCHAR(255) instead of TEXT so they can be indexed
+    without a key prefix, and floats become DOUBLE (FLOAT is single precision).
+    """
+    t = col.type
+    if isinstance(t, sqltypes.Text):
+        return "TEXT"
+    if isinstance(t, sqltypes.String):
+        return f"VARCHAR({t.length or 255})"
+    if isinstance(t, sqltypes.Float):
+        return "DOUBLE"
+    return t.compile(dialect=dialect)
+
+
+def column_type_for_dialect(col, dialect):
+    if dialect.name == "sqlite":
+        return sqlite_type_for_column(col)
+    if dialect.name in ("mysql", "mariadb"):
+        return mysql_type_for_column(col, dialect)
+    return col.type.compile(dialect=dialect)
+
+
+def default_clause_for_column(col):
+    """Return ' NOT NULL DEFAULT <literal>' for NOT NULL columns with a scalar default, else ''."""
+    default = col.default
+    if col.nullable or default is None or not getattr(default, "is_scalar", False):
+        return ""
+    value = default.arg
+    if isinstance(value, bool):
+        literal = "1" if value else "0"
+    elif isinstance(value, (int, float)):
+        literal = repr(value)
+    elif isinstance(value, str):
+        literal = "'" + value.replace("'", "''") + "'"
+    else:
+        return ""
+    return f" NOT NULL DEFAULT {literal}"
+
+
+def add_column_sql(dialect, tname, col):
+    quote = dialect.identifier_preparer.quote
+    col_type = column_type_for_dialect(col, dialect)
+    return f"ALTER TABLE {quote(tname)} ADD COLUMN {quote(col.name)} {col_type}{default_clause_for_column(col)}"
+
+
 def ensure_columns(engine):
     inspector = inspect(engine)
     created = []
@@ -67,9 +122,9 @@ def ensure_columns(engine):
             if cname in existing_cols:
                 continue
 
-            col_type = sqlite_type_for_column(col)
-            # Add column as nullable TEXT/INTEGER to avoid breaking existing rows
-            stmt = text(f'ALTER TABLE "{tname}" ADD COLUMN "{cname}" {col_type}')
+            # Nullable unless the model has a NOT NULL column with a scalar default
+            stmt = text(add_column_sql(engine.dialect, tname, col))
+            col_type = column_type_for_dialect(col, engine.dialect)
             try:
                 with engine.begin() as conn:
                     conn.execute(stmt)
@@ -82,13 +137,50 @@ def ensure_columns(engine):
     return created, skipped, errors
 
 
+def ensure_indexes(engine):
+    """Create indexes declared on the models that are missing in the live database.
+
+    SQLModel.metadata.create_all only creates indexes together with new tables,
+    so indexes added to existing tables must be created here.
+    """
+    inspector = inspect(engine)
+    created = []
+    errors = []
+
+    for table in SQLModel.metadata.sorted_tables:
+        try:
+            existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        except Exception:
+            continue
+
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            try:
+                index.create(bind=engine, checkfirst=True)
+                print(f"Created index {table.name}.{index.name}")
+                created.append((table.name, index.name))
+            except Exception as e:
+                print(f"Failed to create index {table.name}.{index.name}: {e}")
+                errors.append((table.name, index.name, str(e)))
+
+    return created, errors
+
+
 def main():
+    # Register the models on SQLModel.metadata when run as a standalone script
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+    import app.models  # noqa: F401
+
     db_url = get_database_url()
     print(f"Using database URL: {db_url}")
 
-    engine = create_engine(db_url, connect_args={"check_same_thread": False})
+    connect_args = {"check_same_thread": False} if db_url.startswith("sqlite") else {}
+    engine = create_engine(db_url, connect_args=connect_args)
 
     created, skipped, errors = ensure_columns(engine)
+    created_indexes, index_errors = ensure_indexes(engine)
+    errors.extend(index_errors)
 
     print("Summary:")
     print(f"  Columns added: {len(created)}")
@@ -97,9 +189,12 @@ def main():
     print(f"  Tables skipped (missing): {len(skipped)}")
     for t, reason in skipped:
         print(f"    - {t}: {reason}")
+    print(f"  Indexes added: {len(created_indexes)}")
+    for t, name in created_indexes:
+        print(f"    - {t}.{name}")
     print(f"  Errors: {len(errors)}")
-    for t, c, err in errors:
-        print(f"    - {t}.{c}: {err}")
+    for t, name, err in errors:
+        print(f"    - {t}.{name}: {err}")
 
     if errors:
         print("One or more ALTER statements failed. Inspect output above.")
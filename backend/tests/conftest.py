@@ -0,0 +1,100 @@
+"""
+Test setup - 임시 SQLite DB로 앱을 띄우고 고용주 2명 + 공고를 만들어 둠
+
+app.db의 engine은 import 시점에 DATABASE_URL로 만들어지므로 app을 import하기 전에 설정합니다.
+"""
+import os
+import sys
+import tempfile
+
+_DB_DIR = tempfile.mkdtemp(prefix="workfair-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, 'test.db')}"
+for name in ("DB_HOST", "DB_NAME", "DB_USER", "DB_PASSWORD"):
+    os.environ.pop(name, None)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+
+from app.db import engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import EmployerProfile, SignupUser, Store  # noqa: E402
+
+EMPLOYERS = [
+    ("emp-1", "profile-1", "store-1", "카페", "서울 강남구 역삼동 1"),
+    ("emp-2", "profile-2", "store-2", "식당", "부산 해운대구 우동 2"),
+]
+JOBS_PER_EMPLOYER = 6
+
+
+def _create_job(client: TestClient, employer: tuple, title: str, **fields) -> str:
+    _, profile_id, store_id, name, address = employer
+    response = client.post("/jobs", json={
+        "employer_profile_id": profile_id,
+        "title": title,
+        "description": "주 5일 근무",
+        "category": name,
+        "wage": 10000,
+        "work_days": "월,화,수,목,금",
+        "work_hours": "09:00-18:00",
+        "deadline": "2099-12-31",
+        "positions": 1,
+        "required_language": "Lv.2 초급",
+        "required_visa": ["E-9"],
+        "shop_name": name,
+        "shop_address": address,
+        "store_id": store_id,
+        **fields,
+    })
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def _seed(client: TestClient) -> list:
+    with Session(engine) as session:
+        for user_id, profile_id, store_id, name, address in EMPLOYERS:
+            session.add(SignupUser(id=user_id, role="employer", name=name, email=f"{user_id}@example.com"))
+            session.add(EmployerProfile(
+                id=profile_id, user_id=user_id, business_type="business", company_name=name, address=address,
+            ))
+            session.add(Store(
+                id=store_id, user_id=user_id, store_name=name, address=address, phone="010",
+                industry=name, management_role="본사 관리자", store_type="직영점",
+            ))
+        session.commit()
+
+    job_ids = []
+    for index in range(JOBS_PER_EMPLOYER):
+        for employer in EMPLOYERS:
+            job_ids.append(_create_job(client, employer, f"{employer[3]} 직원 {index}", wage=10000 + index * 100))
+    return job_ids
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as test_client:
+        test_client.job_ids = _seed(test_client)
+        yield test_client
+
+
+@pytest.fixture
+def create_job(client):
+    """create_job(employer_index, title, **fields) -> 새 공고 id (POST /jobs)"""
+    return lambda employer_index, title, **fields: _create_job(client, EMPLOYERS[employer_index], title, **fields)
+
+
+def _apply(client: TestClient, job_id: str, seeker_id: str) -> str:
+    with Session(engine) as session:
+        if not session.get(SignupUser, seeker_id):
+            session.add(SignupUser(id=seeker_id, role="job_seeker", name="구직자", phone="0", nationality_code="VN"))
+            session.commit()
+    response = client.post("/applications", json={"seekerId": seeker_id, "jobId": job_id})
+    assert response.status_code == 201, response.text
+    return response.json()["applicationId"]
+
+
+@pytest.fixture
+def apply(client):
+    """apply(job_id, seeker_id) -> 지원서 id (구직자가 없으면 만든 뒤 POST /applications)"""
+    return lambda job_id, seeker_id: _apply(client, job_id, seeker_id)
@@ -0,0 +1,119 @@
+"""
+지원자 수 카운터 - Job.applications / job_application_stats / 매장·고용주 카운터
+"""
+from sqlalchemy import delete, insert, update
+from sqlmodel import Session, select
+
+from app.db import engine
+from app.models import Application, ApplicationStatusRollup, Job, JobApplicationStat
+from app.services.application_counters import ensure_application_counts, get_status_counts
+
+
+def _status_counts(job_id):
+    with Session(engine) as session:
+        return get_status_counts(session, job_id)
+
+
+def _rollup(scope, scope_id):
+    with Session(engine) as session:
+        rows = session.exec(
+            select(ApplicationStatusRollup.status, ApplicationStatusRollup.count).where(
+                ApplicationStatusRollup.scope == scope, ApplicationStatusRollup.scope_id == scope_id
+            )
+        ).all()
+    return {status: count for status, count in rows if count}
+
+
+def _add_legacy_applications(job_id, statuses):
+    """카운터를 거치지 않고 applications 행만 INSERT (카운터 도입 이전 데이터)"""
+    with Session(engine) as session:
+        session.execute(insert(Application), [
+            {"applicationId": f"legacy-{job_id}-{index}", "seekerId": f"legacy-seeker-{index}", "jobId": job_id,
+             "status": status}
+            for index, status in enumerate(statuses)
+        ])
+        session.execute(update(Job).where(Job.id == job_id).values(applications=0))
+        session.commit()
+
+
+def test_startup_fills_counters_for_legacy_applications(client, create_job):
+    job_id = create_job(1, "카운터 이전 공고")
+    _add_legacy_applications(job_id, ["applied", "applied", "reviewed"])
+    before = _rollup("employer", "emp-2")
+    with Session(engine) as session:
+        session.execute(delete(JobApplicationStat))
+        session.commit()
+
+    ensure_application_counts(engine)
+
+    assert client.get(f"/jobs/{job_id}").json()["applicationsCount"] == 3
+    assert _status_counts(job_id) == {"applied": 2, "reviewed": 1}
+    after = _rollup("employer", "emp-2")
+    assert after.get("applied", 0) == before.get("applied", 0) + 2
+    assert after.get("reviewed", 0) == before.get("reviewed", 0) + 1
+
+
+def test_ensure_application_counts_keeps_existing_counters(client, create_job):
+    job_id = create_job(1, "카운터 유지 공고")
+    _add_legacy_applications(job_id, ["applied"])
+
+    ensure_application_counts(engine)  # job_application_stats가 비어 있지 않으면 아무것도 하지 않음
+    assert _status_counts(job_id) == {}
+
+
+def _snapshot(job_id):
+    return {
+        "job": _status_counts(job_id),
+        "store": _rollup("store", "store-2"),
+        "employer": _rollup("employer", "emp-2"),
+    }
+
+
+def _moved(before, after):
+    """상태별 증감 (0인 상태는 생략)"""
+    statuses = set(before) | set(after)
+    return {status: after.get(status, 0) - before.get(status, 0) for status in statuses
+            if after.get(status, 0) != before.get(status, 0)}
+
+
+def test_counters_follow_create_status_change_and_delete(client, create_job, apply):
+    job_id = create_job(1, "카운터 흐름")
+    before = _snapshot(job_id)
+    first = apply(job_id, "counter-seeker-1")
+    others = [apply(job_id, "counter-seeker-2"), apply(job_id, "counter-seeker-3")]
+
+    assert client.patch(f"/applications/{first}", json={"status": "reviewed"}).status_code == 200
+    assert client.patch(f"/applications/{first}", json={"status": "accepted"}).status_code == 200
+    assert client.patch(f"/applications/{first}", json={"status": "accepted"}).status_code == 200  # 같은 상태
+    response = client.post("/applications/bulk-status", json={"status": "rejected", "applicationIds": others})
+    assert response.status_code == 200, response.text
+
+    after = _snapshot(job_id)
+    assert after["job"] == {"accepted": 1, "rejected": 2}
+    assert client.get(f"/jobs/{job_id}").json()["applicationsCount"] == 3
+    for scope in ("store", "employer"):
+        assert _moved(before[scope], after[scope]) == {"accepted": 1, "rejected": 2}
+    history = client.get(f"/applications/{first}/status-history").json()
+    assert [(event["from"], event["to"]) for event in history] == [
+        (None, "applied"), ("applied", "reviewed"), ("reviewed", "accepted"),
+    ]
+
+    assert client.delete(f"/jobs/{job_id}").status_code == 200
+    assert _status_counts(job_id) == {}
+    assert _rollup("store", "store-2") == before["store"]
+    assert _rollup("employer", "emp-2") == before["employer"]
+
+
+def test_transition_on_legacy_application_after_startup_fill(client, create_job):
+    job_id = create_job(1, "카운터 이전 후 상태 변경")
+    _add_legacy_applications(job_id, ["applied", "applied"])
+    with Session(engine) as session:
+        session.execute(delete(JobApplicationStat))
+        session.commit()
+    ensure_application_counts(engine)
+    before = _rollup("employer", "emp-2")
+
+    response = client.patch(f"/applications/legacy-{job_id}-0", json={"status": "reviewed"})
+    assert response.status_code == 200, response.text
+    assert _status_counts(job_id) == {"applied": 1, "reviewed": 1}
+    assert _moved(before, _rollup("employer", "emp-2")) == {"applied": -1, "reviewed": 1}
@@ -0,0 +1,57 @@
+"""
+GET /applications - 기본 페이지 크기, cursor 페이지네이션, 페이지당 고정 쿼리 수
+"""
+import pytest
+from sqlmodel import Session
+
+from app.db import count_queries, engine
+from app.models import SignupUser
+
+APPLICANTS = 55
+
+
+@pytest.fixture(scope="module")
+def applied_job(client):
+    """emp-1의 공고 하나에 구직자 APPLICANTS명이 지원"""
+    job_id = client.job_ids[0]
+    with Session(engine) as session:
+        for index in range(APPLICANTS):
+            session.add(SignupUser(
+                id=f"seeker-{index}", role="job_seeker", name=f"구직자{index}", phone=f"010{index}",
+                nationality_code="VN",
+            ))
+        session.commit()
+    for index in range(APPLICANTS):
+        response = client.post("/applications", json={"seekerId": f"seeker-{index}", "jobId": job_id})
+        assert response.status_code == 201, response.text
+    return job_id
+
+
+def test_employer_list_is_paged_by_default(client, applied_job):
+    first = client.get("/applications", params={"userId": "emp-1"})
+    assert first.status_code == 200, first.text
+    assert len(first.json()) == 50
+    cursor = first.headers.get("X-Next-Cursor")
+    assert cursor
+
+    second = client.get("/applications", params={"userId": "emp-1", "cursor": cursor})
+    assert second.status_code == 200, second.text
+    assert "X-Next-Cursor" not in second.headers
+    ids = [row["applicationId"] for row in first.json() + second.json()]
+    assert len(ids) == len(set(ids)) == APPLICANTS
+
+
+def test_employer_list_query_count_does_not_grow_with_page_size(client, applied_job):
+    counts = []
+    for limit in (5, 50):
+        with count_queries() as queries:
+            response = client.get("/applications", params={"userId": "emp-1", "limit": limit})
+        assert len(response.json()) == limit
+        counts.append(len(queries))
+    assert counts[0] == counts[1]
+
+
+def test_user_and_seeker_filters_combine(client, applied_job):
+    mine = client.get("/applications", params={"userId": "emp-1", "seekerId": "seeker-3"}).json()
+    assert [row["seekerId"] for row in mine] == ["seeker-3"]
+    assert client.get("/applications", params={"userId": "emp-2", "seekerId": "seeker-3"}).json() == []
@@ -0,0 +1,71 @@
+"""
+지원서 낙관적 동시성 제어 - 오래된 version으로 쓰면 409, 카운터/상태는 그대로
+"""
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm.exc import StaleDataError
+from sqlmodel import Session
+
+from app.db import engine
+from app.models import Application
+from app.services.application_counters import get_status_counts, set_application_status
+from app.services.application_versions import CONFLICT_MESSAGE
+
+
+def _status_counts(job_id):
+    with Session(engine) as session:
+        return get_status_counts(session, job_id)
+
+
+def test_patch_with_stale_version_is_409(client, create_job, apply):
+    job_id = create_job(1, "버전 충돌")
+    application_id = apply(job_id, "version-seeker-1")
+
+    first = client.patch(f"/applications/{application_id}", json={"status": "reviewed", "version": 1})
+    assert first.status_code == 200, first.text
+    assert first.json()["version"] == 2
+
+    stale = client.patch(f"/applications/{application_id}", json={"status": "rejected", "version": 1})
+    assert stale.status_code == 409
+    detail = stale.json()["detail"]
+    assert detail["currentVersion"] == 2
+    assert detail["retryable"] is True
+    assert _status_counts(job_id) == {"reviewed": 1}
+
+
+def test_concurrent_write_is_rejected_and_counters_roll_back(client, create_job, apply):
+    """읽은 뒤 다른 요청이 먼저 변경 -> version 조건 UPDATE 0행 (StaleDataError, API에서는 409)"""
+    job_id = create_job(1, "동시 변경")
+    application_id = apply(job_id, "version-seeker-2")
+
+    with Session(engine) as session:
+        application = session.get(Application, application_id)
+        with Session(engine) as other:
+            other.execute(
+                update(Application)
+                .where(Application.applicationId == application_id)
+                .values(version=Application.version + 1)
+            )
+            other.commit()
+        set_application_status(session, application, "hold")
+        session.add(application)
+        with pytest.raises(StaleDataError):
+            session.commit()
+
+    assert _status_counts(job_id) == {"applied": 1}
+    assert client.get(f"/applications/{application_id}/status-history").json()[-1]["to"] == "applied"
+
+
+def test_bulk_status_with_stale_version_reports_conflict(client, create_job, apply):
+    job_id = create_job(1, "일괄 변경 버전")
+    fresh = apply(job_id, "version-seeker-3")
+    stale = apply(job_id, "version-seeker-4")
+
+    response = client.post("/applications/bulk-status", json={
+        "status": "rejected", "applicationIds": [fresh, stale], "versions": {fresh: 1, stale: 0},
+    })
+    assert response.status_code == 200, response.text
+    results = {result["applicationId"]: result for result in response.json()["results"]}
+    assert results[fresh]["result"] == "updated"
+    assert results[stale] == {**results[stale], "result": "error", "error": CONFLICT_MESSAGE}
+    assert _status_counts(job_id) == {"applied": 1, "rejected": 1}
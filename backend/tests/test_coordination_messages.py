@@ -0,0 +1,73 @@
+"""
+조율 메시지 - 레거시 배열 항목의 id 고정, 보관 기간이 지난 공고 purge 시 메시지/상태 이력 정리
+"""
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+from sqlmodel import Session, select
+
+from app.db import engine
+from app.models import Application, ApplicationStatusEvent, CoordinationMessage, jobs_archive
+from app.services.job_archive import purge_archive
+
+
+def _message_ids(messages):
+    return [message["id"] for message in messages]
+
+
+def test_legacy_message_ids_are_stable_across_reads_and_migration(client, create_job, apply):
+    application_id = apply(create_job(1, "조율 메시지"), "coordination-seeker")
+    blob = [
+        {"message": "화요일 가능합니다", "sentAt": "2024-01-01T09:00:00", "from": "jobseeker"},
+        {"message": "확인했습니다", "sentAt": "2024-01-01T10:00:00", "from": "employer"},
+    ]
+    with Session(engine) as session:
+        session.execute(
+            update(Application)
+            .where(Application.applicationId == application_id)
+            .values(coordinationMessages=json.dumps(blob))
+        )
+        session.commit()
+
+    def listed_ids():
+        rows = client.get("/applications", params={"seekerId": "coordination-seeker"}).json()
+        return _message_ids(rows[0]["coordinationMessages"])
+
+    ids = listed_ids()
+    assert len(set(ids)) == 2
+    assert listed_ids() == ids
+
+    migrated = client.get(f"/applications/{application_id}/coordination-messages").json()
+    assert sorted(_message_ids(migrated)) == sorted(ids)
+    assert listed_ids() == ids
+
+
+def test_purge_removes_messages_and_status_events(client, create_job, apply):
+    job_id = create_job(1, "보관 purge")
+    application_id = apply(job_id, "purge-seeker")
+    client.post(f"/applications/{application_id}/coordination-message", json={"message": "안녕하세요"})
+    assert client.patch(f"/applications/{application_id}", json={"status": "reviewed"}).status_code == 200
+    assert client.delete(f"/jobs/{job_id}").status_code == 200
+
+    def remaining():
+        with Session(engine) as session:
+            messages = session.exec(
+                select(CoordinationMessage.id).where(CoordinationMessage.applicationId == application_id)
+            ).all()
+            events = session.exec(
+                select(ApplicationStatusEvent.id).where(ApplicationStatusEvent.applicationId == application_id)
+            ).all()
+            return len(messages), len(events)
+
+    # 보관 중에는 복원에 대비해 그대로 유지
+    assert remaining() == (1, 2)
+    with Session(engine) as session:
+        session.execute(
+            update(jobs_archive)
+            .where(jobs_archive.c.id == job_id)
+            .values(archived_at=datetime.utcnow() - timedelta(days=400))
+        )
+        session.commit()
+        assert purge_archive(session, retention_days=365) == (1, 1)
+    assert remaining() == (0, 0)
@@ -0,0 +1,65 @@
+"""
+공고 삭제/복원 - 보관 테이블로 집합 단위 이동, 복원 시 카운터 재계산, 삭제 문장 수는 지원자 수와 무관
+"""
+from sqlmodel import Session, select
+
+from app.db import count_queries, engine
+from app.models import ApplicationStatusRollup
+from app.services.application_counters import get_status_counts
+
+
+def _employer_rollup():
+    with Session(engine) as session:
+        rows = session.exec(
+            select(ApplicationStatusRollup.status, ApplicationStatusRollup.count).where(
+                ApplicationStatusRollup.scope == "employer", ApplicationStatusRollup.scope_id == "emp-2"
+            )
+        ).all()
+    return {status: count for status, count in rows if count}
+
+
+def _delete_statements(client, job_id):
+    with count_queries() as statements:
+        response = client.delete(f"/jobs/{job_id}", params={"user_id": "emp-2"})
+    assert response.status_code == 200, response.text
+    return len(statements), response.json()["archivedApplications"]
+
+
+def test_delete_and_restore_round_trip(client, create_job, apply):
+    job_id = create_job(1, "보관 후 복원")
+    before = _employer_rollup()
+    first = apply(job_id, "archive-seeker-1")
+    apply(job_id, "archive-seeker-2")
+    assert client.patch(f"/applications/{first}", json={"status": "reviewed"}).status_code == 200
+    with_applications = _employer_rollup()
+
+    _, archived = _delete_statements(client, job_id)
+    assert archived == 2
+    assert client.get(f"/jobs/{job_id}").status_code == 404
+    assert client.get("/applications", params={"jobId": job_id}).json() == []
+    assert _employer_rollup() == before
+    listed = {job["id"]: job for job in client.get("/jobs/archived", params={"user_id": "emp-2"}).json()}
+    assert listed[job_id]["applicationsCount"] == 2
+
+    assert client.post(f"/jobs/{job_id}/restore", params={"user_id": "emp-1"}).status_code == 403
+    restored = client.post(f"/jobs/{job_id}/restore", params={"user_id": "emp-2"})
+    assert restored.status_code == 200, restored.text
+    assert restored.json()["restoredApplications"] == 2
+    assert client.get(f"/jobs/{job_id}").json()["applicationsCount"] == 2
+    with Session(engine) as session:
+        assert get_status_counts(session, job_id) == {"applied": 1, "reviewed": 1}
+    assert _employer_rollup() == with_applications
+    assert job_id not in {job["id"] for job in client.get("/jobs/archived", params={"user_id": "emp-2"}).json()}
+    assert client.post(f"/jobs/{job_id}/restore").status_code == 404
+
+
+def test_delete_statement_count_does_not_grow_with_applicants(client, create_job, apply):
+    counts = []
+    for size in (1, 6):
+        job_id = create_job(1, f"보관 문장 수 {size}")
+        for index in range(size):
+            apply(job_id, f"archive-count-{size}-{index}")
+        statements, archived = _delete_statements(client, job_id)
+        assert archived == size
+        counts.append(statements)
+    assert counts[0] == counts[1]
@@ -0,0 +1,62 @@
+"""
+마감 스케줄러 - 이 tick이 실제로 마감한 공고의 지원자에게만 job_closed 알림을 한 번 보냄
+"""
+from datetime import datetime
+
+from sqlalchemy import update
+from sqlmodel import Session, select
+
+from app.db import engine
+from app.models import Job, Notification
+from app.services.job_deadlines import _claim_expired, close_expired_jobs, deadline_cutoff
+
+
+def _expire(*job_ids):
+    with Session(engine) as session:
+        session.execute(update(Job).where(Job.id.in_(job_ids)).values(deadline="2000-01-01"))
+        session.commit()
+
+
+def _closed_notifications(job_id):
+    with Session(engine) as session:
+        return session.exec(
+            select(Notification).where(Notification.job_id == job_id, Notification.type == "job_closed")
+        ).all()
+
+
+def test_expired_job_is_closed_and_notified_once(client, create_job, apply):
+    job_id = create_job(0, "마감 테스트")
+    apply(job_id, "deadline-seeker")
+    _expire(job_id)
+
+    assert close_expired_jobs(engine) == 1
+    assert close_expired_jobs(engine) == 0
+    assert client.get(f"/jobs/{job_id}").json()["status"] == "closed"
+    assert len(_closed_notifications(job_id)) == 1
+
+
+def test_only_jobs_closed_by_this_tick_are_claimed(client, create_job):
+    """다른 워커가 먼저 마감한 공고는 후보에 있어도 이 tick의 결과에서 빠짐"""
+    mine = create_job(0, "마감 경합 1")
+    taken = create_job(0, "마감 경합 2")
+    _expire(mine, taken)
+    with Session(engine) as session:
+        session.execute(update(Job).where(Job.id == taken).values(status="closed"))
+        session.commit()
+
+    with Session(engine) as session:
+        claimed = _claim_expired(session, {mine: "emp-1", taken: "emp-1"}, deadline_cutoff(datetime.utcnow()))
+        session.commit()
+    assert claimed == {mine: "emp-1"}
+    assert _closed_notifications(taken) == []
+
+
+def test_closing_jobs_refreshes_employer_dashboard(client, create_job):
+    job_id = create_job(1, "대시보드 마감")
+    before = {job["jobId"]: job["status"] for job in client.get("/employer/emp-2/dashboard").json()["byJob"]}
+    assert before[job_id] == "active"
+    _expire(job_id)
+
+    close_expired_jobs(engine)
+    after = {job["jobId"]: job["status"] for job in client.get("/employer/emp-2/dashboard").json()["byJob"]}
+    assert after[job_id] == "closed"
@@ -0,0 +1,100 @@
+"""
+POST /jobs/bulk - JSONL/CSV 행별 검증, 따옴표 안 줄바꿈, 청크 저장 실패 시 그 청크의 행만 실패
+"""
+import json
+
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from app.db import engine
+from app.models import Job
+from app.services import job_import
+
+ROW = {
+    "title": "일괄 등록",
+    "description": "주말 근무",
+    "category": "식당",
+    "wage": 11000,
+    "work_days": "토,일",
+    "work_hours": "10:00-19:00",
+    "deadline": "2099-12-31",
+    "positions": 1,
+    "required_language": "Lv.1 기초",
+    "required_visa": ["E-9"],
+    "store_id": "store-2",
+}
+
+
+def _bulk(client, body: str, format: str):
+    response = client.post(
+        "/jobs/bulk", params={"employer_profile_id": "profile-2", "format": format}, content=body.encode("utf-8"),
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _jobs_titled(title):
+    with Session(engine) as session:
+        return session.exec(select(func.count()).select_from(Job).where(Job.title == title)).one()
+
+
+def test_jsonl_rows_fail_individually(client):
+    lines = [
+        json.dumps({**ROW, "title": "JSONL 정상 1"}),
+        "{not json",
+        "",
+        json.dumps(["배열"]),
+        json.dumps({key: value for key, value in ROW.items() if key != "wage"}),
+        json.dumps({**ROW, "store_id": "store-1"}),
+        json.dumps({**ROW, "title": "JSONL 정상 2", "status": "paused"}),
+    ]
+    result = _bulk(client, "\n".join(lines), "jsonl")
+
+    assert (result["created"], result["failed"]) == (2, 4)
+    by_row = {item["row"]: item for item in result["results"]}
+    assert [by_row[row]["status"] for row in range(1, 7)] == ["created", "error", "error", "error", "error", "created"]
+    assert by_row[2]["errors"][0].startswith("JSON 형식 오류")
+    assert by_row[4]["errors"][0].startswith("wage")
+    assert "store_id" in by_row[5]["errors"][0]
+    assert client.get(f"/jobs/{by_row[6]['id']}").json()["status"] == "paused"
+
+
+def test_csv_quoted_multiline_field_and_bad_row(client):
+    body = "\n".join([
+        "title,description,category,wage,work_days,work_hours,deadline,positions,required_language,required_visa,store_id",
+        'CSV 여러 줄,"첫 줄\n둘째 줄, 쉼표 포함",식당,11000,"토,일",10:00-19:00,2099-12-31,1,Lv.1 기초,E-9|H-2,store-2',
+        "CSV 열 부족,설명,식당",
+        'CSV 정상,"""따옴표"" 설명",식당,11000,토,10:00-19:00,2099-12-31,1,Lv.1 기초,,store-2',
+    ])
+    result = _bulk(client, body, "csv")
+
+    assert (result["created"], result["failed"]) == (2, 1)
+    first, bad, last = result["results"]
+    assert bad["status"] == "error" and "열 개수" in bad["errors"][0]
+    job = client.get(f"/jobs/{first['id']}").json()
+    assert job["description"] == "첫 줄\n둘째 줄, 쉼표 포함"
+    assert job["requiredVisa"] == ["E-9", "H-2"]
+    assert client.get(f"/jobs/{last['id']}").json()["description"] == '"따옴표" 설명'
+
+
+def test_failed_chunk_only_fails_its_rows(client, monkeypatch):
+    monkeypatch.setattr(job_import, "BULK_CHUNK_SIZE", 2)
+    calls = []
+    index_new_jobs = job_import.index_new_jobs
+
+    def flaky_index(session, jobs):
+        calls.append(len(jobs))
+        if len(calls) == 2:
+            raise RuntimeError("index down")
+        index_new_jobs(session, jobs)
+
+    monkeypatch.setattr(job_import, "index_new_jobs", flaky_index)
+    lines = [json.dumps({**ROW, "title": f"청크 {index // 2}"}) for index in range(5)]
+    result = _bulk(client, "\n".join(lines), "jsonl")
+
+    assert calls == [2, 2, 1]
+    assert (result["created"], result["failed"]) == (3, 2)
+    assert [item["status"] for item in result["results"]] == ["created", "created", "error", "error", "created"]
+    assert result["results"][2]["errors"] == ["저장 실패: RuntimeError"]
+    # 실패한 청크는 jobs/job_cards 모두 롤백
+    assert (_jobs_titled("청크 0"), _jobs_titled("청크 1"), _jobs_titled("청크 2")) == (2, 0, 1)
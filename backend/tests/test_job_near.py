@@ -0,0 +1,53 @@
+"""
+GET /jobs?near= - 거리 판정/가까운 순 정렬/LIMIT을 SQL에서 처리하고 X-Next-Cursor로 이어서 조회
+"""
+from app.db import count_queries
+from app.services.geo import DISTRICT_CENTROIDS
+
+GANGNAM = "{},{}".format(*DISTRICT_CENTROIDS[("서울", "강남구")])
+
+
+def _pages(client, **params):
+    pages, cursor = [], None
+    while True:
+        response = client.get("/jobs", params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200, response.text
+        pages.append(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return pages
+
+
+def test_near_pages_follow_cursor_nearest_first(client):
+    everything = client.get("/jobs", params={"near": GANGNAM, "limit": 100}).json()
+    assert everything
+    assert all(job["distanceKm"] <= 5 for job in everything)
+    assert all("부산" not in (job.get("location") or "") for job in everything)
+
+    pages = _pages(client, near=GANGNAM, limit=3)
+    assert all(len(page) <= 3 for page in pages)
+    ids = [job["id"] for page in pages for job in page]
+    assert len(ids) == len(set(ids))
+    assert set(ids) == {job["id"] for job in everything}
+    distances = [job["distanceKm"] for page in pages for job in page]
+    assert distances == sorted(distances)
+
+
+def test_near_with_sort_preset_uses_cursor(client):
+    pages = _pages(client, near=GANGNAM, sort="latest", limit=3)
+    ids = [job["id"] for page in pages for job in page]
+    assert len(ids) == len(set(ids))
+    assert set(ids) == {job["id"] for job in client.get("/jobs", params={"near": GANGNAM, "limit": 100}).json()}
+
+
+def test_near_query_count_does_not_depend_on_page_size(client):
+    counts = []
+    for limit in (1, 5):
+        with count_queries() as statements:
+            assert client.get("/jobs", params={"near": GANGNAM, "limit": limit}).status_code == 200
+        counts.append(len(statements))
+    assert counts[0] == counts[1]
+
+
+def test_near_rejects_bad_point(client):
+    assert client.get("/jobs", params={"near": "seoul"}).status_code == 400
@@ -0,0 +1,39 @@
+"""
+N+1 회귀 방지 - 공고 목록/상세가 공고 수와 무관한 고정 개수의 SQL로 처리되는지 확인
+
+목록/상세는 고용주 정보와 신뢰 여부를 공고 쿼리에 함께 join해서 읽습니다.
+공고마다 고용주를 따로 조회하게 되면 페이지 크기에 따라 쿼리 수가 늘어나 실패합니다.
+"""
+from app.db import count_queries
+
+
+def _list_query_count(client, **params) -> int:
+    with count_queries() as queries:
+        response = client.get("/jobs", params=params)
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == params["limit"]
+    return len(queries)
+
+
+def test_job_list_query_count_does_not_grow_with_page_size(client):
+    small = _list_query_count(client, limit=2)
+    large = _list_query_count(client, limit=10)
+    assert large == small
+    assert small <= 3
+
+
+def test_job_list_query_count_is_constant_with_filters(client):
+    for params in ({"visaType": "E-9"}, {"sort": "latest"}):
+        assert _list_query_count(client, limit=2, **params) == _list_query_count(client, limit=10, **params), params
+
+
+def test_job_detail_query_count_is_constant(client):
+    counts = []
+    for job_id in client.job_ids[:4]:
+        with count_queries() as queries:
+            response = client.get(f"/jobs/{job_id}")
+        assert response.status_code == 200, response.text
+        assert response.json()["id"] == job_id
+        counts.append(len(queries))
+    assert len(set(counts)) == 1
+    assert counts[0] <= 2
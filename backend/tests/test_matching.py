@@ -0,0 +1,69 @@
+"""
+matching - 비자 비트 번호 충돌/미등록 비자 비교, TOPIK 표기 변환
+"""
+import json
+from types import SimpleNamespace
+
+from app.services.job_recommender import JobFeatureMatrix
+from app.services.matching import OTHER_VISA_BIT, VISA_BITS, language_level, visa_allowed, visa_bit, visa_mask
+
+
+def test_visa_bits_are_unique():
+    bits = list(VISA_BITS.values())
+    assert len(set(bits)) == len(bits)
+    assert OTHER_VISA_BIT not in bits
+    assert 0 <= OTHER_VISA_BIT < 31  # MySQL INT (signed) 범위
+
+
+def test_unlisted_visa_does_not_match_listed_visa():
+    assert visa_bit("Z-99") & visa_mask(VISA_BITS) == 0
+    assert visa_bit("e9") & visa_mask(["E-9"])
+
+
+def test_topik_labels_map_to_levels():
+    assert language_level("TOPIK 1급") == 1
+    assert language_level("TOPIK 3급") == 3
+    assert language_level("Lv.2 초급") == 2
+    assert language_level(None) == 0
+
+
+def test_unlisted_visas_are_compared_exactly():
+    job_mask = visa_mask(["D-3"])
+    assert job_mask == visa_bit("Z-99")  # 미등록 비자끼리는 비트가 같음
+    assert visa_allowed(job_mask, ["D-3"], "d3")
+    assert not visa_allowed(job_mask, ["D-3"], "Z-99")
+    assert not visa_allowed(job_mask, ["D-3"], "E-9")
+    assert visa_allowed(0, [], "Z-99")
+
+
+def test_job_list_visa_filter_does_not_mix_unlisted_visas(client, create_job):
+    job_id = create_job(0, "미등록 비자 공고", required_visa=["D-3"])
+
+    def listed(visa):
+        jobs = client.get("/jobs", params={"visaType": visa, "limit": 100}).json()
+        return job_id in {job["id"] for job in jobs}
+
+    assert listed("D-3")
+    assert listed("d 3")
+    assert not listed("Z-99")
+    assert not listed("E-9")
+
+
+def test_recommender_does_not_mix_unlisted_visas():
+    matrix = JobFeatureMatrix()
+    matrix._loaded_at = 0.0
+    for job_id, visas in (("open", []), ("d3", ["D-3"]), ("e9", ["E-9"])):
+        matrix.upsert(SimpleNamespace(
+            id=job_id, status="active", location="서울 강남구", shop_address=None, category="카페",
+            workDays="월,화", hourly_wage=10000, visa_mask=visa_mask(visas), requiredVisa=json.dumps(visas),
+        ))
+
+    def recommended(visa):
+        profile = SimpleNamespace(
+            preferred_regions="[]", preferred_jobs="[]", work_days_of_week="[]", visa_type=visa,
+        )
+        return {job_id for job_id, _ in matrix.top_k(profile, 10)}
+
+    assert recommended("D-3") == {"open", "d3"}
+    assert recommended("Z-99") == {"open"}
+    assert recommended("E-9") == {"open", "e9"}
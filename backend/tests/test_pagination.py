@@ -0,0 +1,54 @@
+"""
+Keyset cursor 페이지네이션 - /jobs, /job-seeker/profiles (X-Next-Cursor로 이어서 조회해도 누락/중복 없음)
+"""
+from datetime import datetime
+
+from sqlmodel import Session
+
+from app.db import engine
+from app.models import JobSeekerProfile
+
+PROFILE_VISA = "PAGE-TEST"
+
+
+def _walk(client, path, limit, **params):
+    """cursor를 따라 끝까지 조회한 id 목록 (페이지마다 limit 이하)"""
+    ids, cursor = [], None
+    while True:
+        response = client.get(path, params={**params, "limit": limit, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200, response.text
+        page = response.json()
+        assert len(page) <= limit
+        ids += [row["id"] for row in page]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return ids
+
+
+def test_job_feed_cursor_matches_single_page(client):
+    for sort in (None, "latest"):
+        params = {"sort": sort} if sort else {}
+        everything = [job["id"] for job in client.get("/jobs", params={**params, "limit": 100}).json()]
+        assert len(everything) >= 10
+        assert _walk(client, "/jobs", 3, **params) == everything
+
+
+def test_profile_cursor_breaks_created_at_ties_by_id(client):
+    created_at = datetime(2024, 1, 1, 9, 0, 0)
+    with Session(engine) as session:
+        for index in range(7):
+            session.add(JobSeekerProfile(
+                id=f"page-profile-{index}", user_id=f"page-seeker-{index}", visa_type=PROFILE_VISA,
+                # 두 명씩 같은 등록 시각
+                created_at=created_at.replace(minute=index // 2),
+            ))
+        session.commit()
+
+    ids = _walk(client, "/job-seeker/profiles", 2, visa_type=PROFILE_VISA)
+    assert ids == ["page-profile-6", "page-profile-5", "page-profile-4", "page-profile-3",
+                   "page-profile-2", "page-profile-1", "page-profile-0"]
+
+
+def test_malformed_cursor_is_400(client):
+    assert client.get("/jobs", params={"cursor": "not-a-cursor"}).status_code == 400
+    assert client.get("/job-seeker/profiles", params={"cursor": "WyJ4Il0"}).status_code == 400
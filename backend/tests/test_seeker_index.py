@@ -0,0 +1,50 @@
+"""
+seeker_index - 비자 표기 정규화, 근무 가능 시간대 점수
+"""
+from types import SimpleNamespace
+
+from app.services.seeker_index import SeekerIndex
+
+
+def _profile(user_id, visa=None, start=None, end=None):
+    return SimpleNamespace(
+        user_id=user_id, preferred_regions="[]", preferred_jobs="[]", visa_type=visa,
+        work_days_of_week="[]", work_start_time=start, work_end_time=end,
+    )
+
+
+def _job(required_visa='[]', work_hours="09:00-18:00"):
+    return SimpleNamespace(
+        location="서울 강남구", shop_address=None, category="카페", requiredVisa=required_visa,
+        workDays="", workHours=work_hours, requiredLanguage=None,
+    )
+
+
+def _index(*profiles):
+    index = SeekerIndex()
+    for profile in profiles:
+        index._add_row(profile, None)
+    return index
+
+
+def test_visa_spellings_match_the_same_visa():
+    index = _index(_profile("a", "E9"), _profile("b", "e-9 "), _profile("c", "E-9"), _profile("d", "H-2"))
+    candidates = index.top_k(_job('["e9"]'), 10)
+    assert {candidate["user_id"] for candidate in candidates} == {"a", "b", "c"}
+    assert all("비자 요건 충족 (E-9)" in candidate["reasons"] for candidate in candidates)
+
+
+def test_covering_work_hours_rank_higher():
+    index = _index(
+        _profile("evening", start="18:00", end="23:00"),
+        _profile("all-day", start="08:00", end="20:00"),
+        _profile("unknown"),
+    )
+    candidates = index.top_k(_job(), 10)
+    assert candidates[0]["user_id"] == "all-day"
+    assert candidates[0]["score"] > candidates[1]["score"]
+    assert "근무 가능 시간 (09:00-18:00)" in candidates[0]["reasons"]
+
+    # 행을 지우면 시간대 비트셋에서도 빠짐
+    index._remove_row("all-day")
+    assert all(candidate["score"] == 0 for candidate in index.top_k(_job(), 10))
@@ -0,0 +1,44 @@
+"""
+공고 조회수 버퍼 - 상세 조회는 쓰기 없이 메모리에 기록하고 flush 때 UPDATE 한 번으로 반영
+"""
+from sqlmodel import Session
+
+from app.db import count_queries, engine
+from app.models import Job
+from app.services.view_counter import ViewCounter, view_counter
+
+
+def _stored_views(job_id):
+    with Session(engine) as session:
+        return session.get(Job, job_id).views or 0
+
+
+def test_detail_views_are_buffered_then_flushed(client, create_job):
+    job_id = create_job(1, "조회수")
+    view_counter.flush(engine)
+
+    with count_queries() as statements:
+        views = [client.get(f"/jobs/{job_id}").json()["views"] for _ in range(3)]
+    assert views == [1, 2, 3]
+    assert not [statement for statement in statements if statement.lstrip().upper().startswith("UPDATE")]
+    assert _stored_views(job_id) == 0
+
+    with count_queries() as statements:
+        assert view_counter.flush(engine) >= 1
+    assert len(statements) == 1
+    assert _stored_views(job_id) == 3
+    assert view_counter.pending(job_id) == 0
+    assert client.get(f"/jobs/{job_id}").json()["views"] == 4
+
+
+def test_failed_flush_keeps_counts_for_next_time():
+    class BrokenEngine:
+        def begin(self):
+            raise RuntimeError("db down")
+
+    counter = ViewCounter()
+    counter.record("job-a")
+    counter.record("job-a")
+    assert counter.flush(BrokenEngine()) == 0
+    counter.record("job-a")
+    assert counter.pending("job-a") == 3
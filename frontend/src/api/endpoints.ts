@@ -33,6 +33,7 @@ export const jobsAPI = {
     sort?: string;
     limit?: number;
     offset?: number;
+    cursor?: string;
   }) => apiClient.get<Job[]>('/jobs', { params }),
   get: (id: string) => apiClient.get<Job>(`/jobs/${id}`),
 };
@@ -41,8 +42,9 @@ export const jobsAPI = {
 export const applicationsAPI = {
   create: (seekerId: string, jobId: string) =>
     apiClient.post<Application>('/applications', { seekerId, jobId }),
+  // 구직자 본인 지원 내역 - 한 페이지 최대치(200건)로 조회 (고용주 목록은 cursor로 페이지 단위 조회)
   list: (seekerId?: string, jobId?: string, employerId?: string, userId?: string) =>
-    apiClient.get<Application[]>('/applications', { params: { seekerId, jobId, employerId, userId } }),
+    apiClient.get<Application[]>('/applications', { params: { seekerId, jobId, employerId, userId, limit: 200 } }),
   update: (id: string, status: string) =>
     apiClient.patch<Application>(`/applications/${id}`, { status }),
   updateInterviewProposal: (id: string, data: {
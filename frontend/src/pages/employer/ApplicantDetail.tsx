@@ -50,7 +50,7 @@ export const ApplicantDetail = () => {
         const signupUserId = useAuthStore.getState().signupUserId;
         const userId = signupUserId || localStorage.getItem('signup_user_id');
         if (userId) {
-          const applicationsRes = await fetch(`${API_BASE_URL}/applications?userId=${userId}`);
+          const applicationsRes = await fetch(`${API_BASE_URL}/applications?userId=${userId}&seekerId=${id}`);
           if (applicationsRes.ok) {
             const applications = await applicationsRes.json();
             const application = applications.find((app: any) => 
@@ -150,7 +150,7 @@ export const ApplicantDetail = () => {
       
       // 현재 고용주의 모든 지원서 목록에서 해당 구직자의 지원서 찾기
       const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'http://localhost:8000';
-      const applicationsRes = await fetch(`${API_BASE_URL}/applications?userId=${userId}`);
+      const applicationsRes = await fetch(`${API_BASE_URL}/applications?userId=${userId}&seekerId=${id}`);
       
       if (!applicationsRes.ok) {
         toast.error('지원서 정보를 불러올 수 없습니다. 다시 시도해주세요.');
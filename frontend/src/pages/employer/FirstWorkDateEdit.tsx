@@ -36,7 +36,7 @@ export const FirstWorkDateEdit = () => {
         const signupUserId = useAuthStore.getState().signupUserId;
         const userId = signupUserId || localStorage.getItem('signup_user_id');
         if (userId) {
-          const applicationsRes = await fetch(`${API_BASE_URL}/applications?userId=${userId}`);
+          const applicationsRes = await fetch(`${API_BASE_URL}/applications?userId=${userId}&seekerId=${id}`);
           if (applicationsRes.ok) {
             const applications = await applicationsRes.json();
             const application = applications.find((app: any) => 
@@ -10,6 +10,9 @@ import { FilterChips } from '@/components/FilterChips';
 import { EmployerFilterModal, type EmployerFilterState } from '@/components/EmployerFilterModal';
 import { API_BASE_URL } from '@/api/client';
 
+// 지원자 목록 한 페이지 크기 (GET /applications limit)
+const APPLICANTS_PAGE_SIZE = 50;
+
 // localStorage 변경 감지를 위한 커스텀 훅
 const useLocalStorage = (key: string) => {
   const [value, setValue] = useState<string[]>(() => {
@@ -100,6 +103,9 @@ export const Recruitment = () => {
   }, []);
   const [applicants, setApplicants] = useState<Applicant[]>([]);
   const [loading, setLoading] = useState(true);
+  // 지원자 목록은 페이지 단위로 조회 (GET /applications의 X-Next-Cursor)
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const savedApplicantIds = useLocalStorage('saved_applicants');
   const [showInterviewModal, setShowInterviewModal] = useState(false);
   const [selectedApplicantId, setSelectedApplicantId] = useState<string | null>(null);
@@ -207,9 +213,13 @@ export const Recruitment = () => {
     };
   }, []);
 
-  const fetchApplicants = async () => {
+  const fetchApplicants = async (cursor?: string) => {
     try {
-      setLoading(true);
+      if (cursor) {
+        setLoadingMore(true);
+      } else {
+        setLoading(true);
+      }
       
       // Get user ID (prefer zustand-migrated value)
       const signupUserId = useAuthStore.getState().signupUserId;
@@ -219,11 +229,15 @@ export const Recruitment = () => {
         return;
       }
 
-      // Get all applications for this employer using userId
-      const applicationsRes = await fetch(`${API_BASE_URL}/applications?userId=${userId}`);
+      // Get applications for this employer using userId (한 페이지씩, 다음 페이지는 cursor로)
+      const cursorParam = cursor ? `&cursor=${encodeURIComponent(cursor)}` : '';
+      const applicationsRes = await fetch(
+        `${API_BASE_URL}/applications?userId=${userId}&limit=${APPLICANTS_PAGE_SIZE}${cursorParam}`
+      );
       if (!applicationsRes.ok) {
         throw new Error('지원 내역을 가져올 수 없습니다');
       }
+      setNextCursor(applicationsRes.headers.get('X-Next-Cursor'));
       const applications = await applicationsRes.json();
       console.log('[DEBUG] Applications response:', applications);
       console.log('[DEBUG] Applications count:', applications.length);
@@ -232,8 +246,7 @@ export const Recruitment = () => {
       // 응답이 배열이 아닌 경우 처리
       if (!Array.isArray(applications)) {
         console.error('[ERROR] Applications response is not an array:', applications);
-        setApplicants([]);
-        setLoading(false);
+        if (!cursor) setApplicants([]);
         return;
       }
       
@@ -242,8 +255,7 @@ export const Recruitment = () => {
         console.warn('  1. 구직자가 실제로 지원했는지 확인');
         console.warn('  2. employer_profiles와 employers 연결 확인');
         console.warn('  3. jobs.employerId가 올바른지 확인');
-        setApplicants([]);
-        setLoading(false);
+        if (!cursor) setApplicants([]);
         return;
       }
 
@@ -398,14 +410,15 @@ export const Recruitment = () => {
 
       console.log('[DEBUG] Transformed applicants count:', applicantsData.length);
       console.log('[DEBUG] Transformed applicants:', applicantsData);
-      setApplicants(applicantsData);
+      setApplicants((prev) => (cursor ? [...prev, ...applicantsData] : applicantsData));
     } catch (error) {
       console.error('지원자 목록 로딩 실패:', error);
       console.error('Error details:', error);
       toast.error('지원자 목록을 불러오는데 실패했습니다');
-      setApplicants([]);
+      if (!cursor) setApplicants([]);
     } finally {
       setLoading(false);
+      setLoadingMore(false);
     }
   };
 
@@ -1423,6 +1436,15 @@ export const Recruitment = () => {
             );
           })
         )}
+          {!loading && nextCursor && (
+            <button
+              onClick={() => fetchApplicants(nextCursor)}
+              disabled={loadingMore}
+              className="w-full py-3 rounded-[10px] bg-gray-100 text-[14px] font-medium text-text-700 hover:bg-gray-200 disabled:opacity-50"
+            >
+              {loadingMore ? '불러오는 중...' : '지원자 더 보기'}
+            </button>
+          )}
         </div>
       )}
 
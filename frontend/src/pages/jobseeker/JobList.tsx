@@ -76,8 +76,8 @@ export const JobList = () => {
             Boolean(job?.employer?.business_license) ||
             Boolean(job?.employer?.is_verified);
 
-          if (sortPreset === 'high-wage') return job.wage >= 11000;
-          if (sortPreset === 'popular') return applicationsCount > 0;
+          if (sortPreset === 'high-wage') return (job.hourly_wage ?? job.wage) >= 11000;
+          if (sortPreset === 'popular') return (job.trend_score ?? applicationsCount) > 0;
           if (sortPreset === 'trusted') return isTrusted;
           // 단기 알바는 기존 기준 없음 -> 서버 기준 사용, 없으면 전체 유지
           return true;
@@ -85,12 +85,16 @@ export const JobList = () => {
 
         // Sorting fallback
         if (sortPreset === 'high-wage') {
-          activeJobs.sort((a: any, b: any) => (b.wage ?? 0) - (a.wage ?? 0));
+          // 시급 환산 급여 기준 (월급/주급 공고도 시급과 비교)
+          activeJobs.sort(
+            (a: any, b: any) => (b.hourly_wage ?? b.wage ?? 0) - (a.hourly_wage ?? a.wage ?? 0)
+          );
         } else if (sortPreset === 'popular') {
+          // 최근 조회/지원 기준 인기 점수 (없으면 누적 지원자 수)
           activeJobs.sort(
             (a: any, b: any) =>
-              (b.applicationsCount ?? b.applications ?? 0) -
-              (a.applicationsCount ?? a.applications ?? 0)
+              (b.trend_score ?? b.applicationsCount ?? b.applications ?? 0) -
+              (a.trend_score ?? a.applicationsCount ?? a.applications ?? 0)
           );
         }
 
@@ -79,6 +79,8 @@ export interface Job {
   category?: string;
   wage: number;
   wage_type?: 'hourly' | 'weekly' | 'monthly';
+  hourly_wage?: number | null; // 시급 환산 급여 (high-wage 필터/정렬 기준)
+  trend_score?: number; // 시간 감쇠 인기 점수 (popular 정렬 기준)
   workDays: string | string[];
   workHours: string;
   deadline: string;